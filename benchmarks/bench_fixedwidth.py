@@ -0,0 +1,72 @@
+"""
+Per-field fmt_text/fmt_int vs compiled layout rendering.
+
+    python benchmarks/bench_fixedwidth.py [rows]
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+
+from cwr_tool.format.fixedwidth import FieldSpec, LayoutField, compile_layout, fmt_int, fmt_text
+
+# NWR-like layout: prefix, title, language, SWK, ISWC, then a run of short code fields
+FIELDS = [
+    LayoutField("record_type", FieldSpec(width=3), const="NWR"),
+    LayoutField("tx_seq", FieldSpec(width=8, align="right", pad="0"), numeric=True),
+    LayoutField("rec_seq", FieldSpec(width=8, align="right", pad="0"), numeric=True),
+    LayoutField("title", FieldSpec(width=60, required=True)),
+    LayoutField("language", FieldSpec(width=2)),
+    LayoutField("swk", FieldSpec(width=14, required=True)),
+    LayoutField("iswc", FieldSpec(width=11)),
+    LayoutField("copyright_date", FieldSpec(width=8, align="right", pad="0"), numeric=True),
+    *(LayoutField(f"code{i}", FieldSpec(width=3)) for i in range(8)),
+    LayoutField("duration", FieldSpec(width=6, align="right", pad="0"), numeric=True),
+]
+
+ROW = {
+    "tx_seq": 42,
+    "rec_seq": 0,
+    "title": "A REASONABLY LONG WORK TITLE",
+    "language": "EN",
+    "swk": "0000000042",
+    "iswc": "T1234567890",
+    "copyright_date": "",
+    **{f"code{i}": "POP" for i in range(8)},
+    "duration": 215,
+}
+
+
+def per_field(row: dict[str, object]) -> str:
+    out = []
+    for f in FIELDS:
+        if f.const is not None:
+            out.append(fmt_text(f.const, f.spec))
+        elif f.numeric:
+            out.append(fmt_int(row.get(f.name), f.spec))  # type: ignore[arg-type]
+        else:
+            out.append(fmt_text(row.get(f.name), f.spec))  # type: ignore[arg-type]
+    return "".join(out)
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    layout = compile_layout(FIELDS)
+    positional = [ROW.get(n) for n in layout.names]
+    assert layout.render(ROW) == per_field(ROW)
+
+    cases = {
+        "per-field fmt_text/fmt_int": lambda: per_field(ROW),
+        "compiled render(mapping)": lambda: layout.render(ROW),
+        "compiled render_row(seq)": lambda: layout.render_row(positional),
+    }
+    base = None
+    for name, fn in cases.items():
+        secs = min(timeit.repeat(fn, number=rows, repeat=3))
+        base = base or secs
+        print(f"{name:30s} {rows / secs:12,.0f} lines/s  x{base / secs:4.1f}")
+
+
+if __name__ == "__main__":
+    main()
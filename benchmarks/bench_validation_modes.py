@@ -0,0 +1,70 @@
+"""
+Validation throughput per mode (strict / fast / trusted) on a synthetic catalogue.
+
+    python benchmarks/bench_validation_modes.py [works]
+
+Also times the minimal rule pack on its own (what strict/fast add on top of
+it is the contract check) and MinimalPayload.model_validate over the whole
+payload, i.e. what "just use the Pydantic model" would cost.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+from cwr_tool.models.input import MinimalPayload
+from cwr_tool.validation.engine import (
+    MINIMAL_RULES,
+    ValidationMode,
+    run_rule_pack,
+    validate_minimal,
+)
+
+
+def make_payload(works: int) -> dict[str, Any]:
+    return {
+        "works": [
+            {
+                "title": f"WORK TITLE NUMBER {i}",
+                "submitter_work_number": f"{i:010d}",
+                "language_code": "EN" if i % 3 else "FR",
+                "alternate_titles": [f"ALT TITLE {i}"] if i % 4 == 0 else [],
+                **({"comment": f"NOTE {i}"} if i % 10 == 0 else {}),
+            }
+            for i in range(works)
+        ],
+        "spu": [{"publisher_name": f"PUBLISHER {i}"} for i in range(works // 100)],
+    }
+
+
+def best_of(fn: Callable[[], object], runs: int = 3) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    works = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    payload = make_payload(works)
+    print(f"{works:,} works")
+
+    cases: dict[str, Callable[[], object]] = {
+        f"validate_minimal({mode.value})": lambda mode=mode: validate_minimal(payload, mode=mode)
+        for mode in ValidationMode
+    }
+    cases["minimal rules only"] = lambda: run_rule_pack(MINIMAL_RULES, payload)
+    cases["MinimalPayload.model_validate"] = lambda: MinimalPayload.model_validate(payload)
+
+    for name, fn in cases.items():
+        secs = best_of(fn)
+        print(f"{name:32s} {secs:7.3f} s  {works / secs:12,.0f} works/s")
+
+
+if __name__ == "__main__":
+    main()
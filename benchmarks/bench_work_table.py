@@ -0,0 +1,107 @@
+"""
+Validate + render a synthetic catalogue: per-work dicts/records vs WorkTable.
+
+    python benchmarks/bench_work_table.py [works]
+
+Each case runs twice: once timed, once under tracemalloc for peak memory
+(tracemalloc slows Python down, so the two are kept apart). Output goes to a
+sink that only counts characters.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+
+from cwr_tool.generation.work_table import WorkTable, WorkTableCollector
+from cwr_tool.generation.writer import write_minimal_wrk_file
+from cwr_tool.ingest.json_stream import load_payload
+from cwr_tool.validation.engine import validate_minimal
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+class CountingSink:
+    def __init__(self) -> None:
+        self.chars = 0
+
+    def write(self, s: str, /) -> int:
+        self.chars += len(s)
+        return len(s)
+
+
+def make_catalogue(path: Path, works: int) -> None:
+    with path.open("w", encoding="utf-8") as fh:
+        fh.write('{"works": [')
+        for i in range(works):
+            w = {
+                "title": f"WORK TITLE NUMBER {i}",
+                "submitter_work_number": f"{i:010d}",
+                "language_code": "EN" if i % 3 else "FR",
+                "alternate_titles": [f"ALT TITLE {i}"] if i % 4 == 0 else [],
+            }
+            fh.write(("," if i else "") + json.dumps(w))
+        fh.write("]}")
+
+
+def records_path(path: Path, stream: bool) -> int:
+    payload = load_payload(path, stream=stream)
+    assert validate_minimal(payload).ok
+    sink = CountingSink()
+    write_minimal_wrk_file(payload, sink, sender="SUB", receiver="000", now=NOW)
+    return sink.chars
+
+
+def table_path(path: Path, stream: bool) -> int:
+    payload = load_payload(path, stream=stream)
+    collector = WorkTableCollector(WorkTable())
+    assert validate_minimal(payload, extra_rules=[collector]).ok
+    sink = CountingSink()
+    write_minimal_wrk_file(
+        payload, sink, sender="SUB", receiver="000", now=NOW, works=collector.table
+    )
+    return sink.chars
+
+
+def measure(fn: Callable[[], int]) -> tuple[float, float, int]:
+    t0 = time.perf_counter()
+    chars = fn()
+    secs = time.perf_counter() - t0
+
+    tracemalloc.start()
+    fn()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return secs, peak / 2**20, chars
+
+
+def main() -> None:
+    works = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "catalogue.json"
+        make_catalogue(path, works)
+        print(f"{works:,} works, {path.stat().st_size / 2**20:,.0f} MiB of JSON")
+
+        cases = {
+            "loaded dicts + records": lambda: records_path(path, stream=False),
+            "loaded dicts + WorkTable": lambda: table_path(path, stream=False),
+            "streamed x2 + records": lambda: records_path(path, stream=True),
+            "streamed x1 + WorkTable": lambda: table_path(path, stream=True),
+        }
+        expected = None
+        for name, fn in cases.items():
+            secs, peak_mib, chars = measure(fn)
+            assert expected in (None, chars), "cases must render the same output"
+            expected = chars
+            rate = works / secs
+            print(f"{name:26s} {secs:7.2f} s  {rate:10,.0f} works/s  peak {peak_mib:8,.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
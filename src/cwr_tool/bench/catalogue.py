@@ -0,0 +1,59 @@
+"""
+Synthetic catalogues for benchmarks.
+
+Payloads are deterministic for a given shape (no randomness), so two runs
+of the benchmark measure exactly the same input.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+_LANGUAGES = ("EN", "FR", "DE", "ES", "IT")
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogueShape:
+    """
+    Size of a synthetic payload.
+
+    - works: number of works (one NWR transaction each)
+    - alt_titles: ALT titles per work
+    - comment_every: every n-th work gets a comment (0: none)
+    - spu: number of SPU entries
+    """
+
+    works: int = 100_000
+    alt_titles: int = 1
+    comment_every: int = 10
+    spu: int = 100
+
+    def record_count(self) -> int:
+        """Physical lines of the generated file, HDR/GRH/GRT/TRL included."""
+        comments = 0 if self.comment_every <= 0 else -(-self.works // self.comment_every)
+        body = self.works * (1 + self.alt_titles) + comments
+        groups = (1 if self.works else 0) + (1 if self.spu else 0)
+        return 2 + 2 * groups + body + self.spu
+
+
+def iter_works(shape: CatalogueShape) -> Iterator[dict[str, Any]]:
+    for i in range(shape.works):
+        work: dict[str, Any] = {
+            "title": f"SYNTHETIC WORK TITLE {i}",
+            "submitter_work_number": f"{i:010d}",
+            "language_code": _LANGUAGES[i % len(_LANGUAGES)],
+            "alternate_titles": [f"ALTERNATE TITLE {i} {n}" for n in range(shape.alt_titles)],
+        }
+        if shape.comment_every > 0 and i % shape.comment_every == 0:
+            work["comment"] = f"SYNTHETIC COMMENT FOR WORK {i}"
+        yield work
+
+
+def synthesize_payload(shape: CatalogueShape) -> dict[str, Any]:
+    """A valid payload of the given shape (see CatalogueShape)."""
+    return {
+        "works": list(iter_works(shape)),
+        "spu": [{"publisher_name": f"SYNTHETIC PUBLISHER {i}"} for i in range(shape.spu)],
+    }
@@ -0,0 +1,184 @@
+"""
+Stage-by-stage throughput of the generate/validate pipeline.
+
+Stages, in pipeline order:
+- validate_minimal: the payload's validation pass
+- build_groups: payload -> groups of transactions
+- render_group: groups -> record lists (GRH ... GRT)
+- join_records: record lists -> text (KEY=VALUE lines, HDR/TRL included)
+- write: that text to a file
+- write_minimal_wrk_file: the streaming writer end to end (in the requested
+  output format), i.e. what `generate` does after validation
+
+The staged path (build_groups ... write) is the buffered one and always
+KEY=VALUE; it is timed stage by stage because the streaming writer
+interleaves them. Every stage is run `repeat` times and the best time kept.
+"""
+
+from __future__ import annotations
+
+import platform
+import sys
+import tempfile
+import time
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from cwr_tool import __version__
+from cwr_tool.bench.catalogue import CatalogueShape, synthesize_payload
+from cwr_tool.generation.control_records import HDRRecord
+from cwr_tool.generation.group_builder import build_groups, render_group
+from cwr_tool.generation.records import RenderableRecord, join_records
+from cwr_tool.generation.totals import FileTotals
+from cwr_tool.generation.writer import GROUP_SPECS, write_minimal_wrk_file
+from cwr_tool.reporting.models import BenchReport, BenchStage
+from cwr_tool.validation.engine import validate_minimal
+
+try:
+    import resource
+except ImportError:  # not on Windows
+    resource = None  # type: ignore[assignment]
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def peak_rss_mib() -> float | None:
+    """Peak resident set size of this process so far, in MiB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, KiB elsewhere
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def _run_once(
+    payload: Mapping[str, Any], path: Path, *, cwr_version: str, output_format: str
+) -> list[tuple[str, float, int]]:
+    """One pass over every stage: [(stage, seconds, bytes)]."""
+    timings: list[tuple[str, float, int]] = []
+    clock = time.perf_counter
+
+    t0 = clock()
+    report = validate_minimal(payload, version=cwr_version)
+    timings.append(("validate_minimal", clock() - t0, 0))
+    if not report.ok:
+        raise ValueError("benchmark payload does not validate")
+
+    t0 = clock()
+    groups = build_groups(payload, GROUP_SPECS)
+    timings.append(("build_groups", clock() - t0, 0))
+
+    t0 = clock()
+    rendered: list[list[RenderableRecord]] = [
+        render_group(
+            group_number=g.group_number,
+            group_type=g.group_type,
+            transactions=g.transactions,
+            totals=g.totals,
+        )[0]
+        for g in groups
+    ]
+    timings.append(("render_group", clock() - t0, 0))
+
+    t0 = clock()
+    totals = FileTotals()
+    for g in groups:
+        totals.add_group(g.group_totals())
+    hdr = HDRRecord(sender="SUB", receiver="000", version=cwr_version, created=NOW)
+    texts = [join_records([hdr]), *(join_records(r) for r in rendered)]
+    texts.append(join_records([totals.trailer()]))
+    timings.append(("join_records", clock() - t0, 0))
+
+    t0 = clock()
+    with path.open("w", encoding="ascii", newline="") as fh:
+        for text in texts:
+            fh.write(text)
+    timings.append(("write", clock() - t0, path.stat().st_size))
+
+    t0 = clock()
+    with path.open("w", encoding="ascii", newline="") as fh:
+        write_minimal_wrk_file(
+            payload,
+            fh,
+            sender="SUB",
+            receiver="000",
+            cwr_version=cwr_version,
+            now=NOW,
+            output_format=output_format,
+        )
+    timings.append(("write_minimal_wrk_file", clock() - t0, path.stat().st_size))
+    return timings
+
+
+def run_benchmark(
+    shape: CatalogueShape,
+    *,
+    cwr_version: str = "2.1",
+    output_format: str = "kv",
+    repeat: int = 3,
+) -> BenchReport:
+    """
+    Synthesize a payload of `shape` and time every stage (see module docstring).
+
+    `records` is the same for every stage (the file's physical lines), so
+    records_per_sec compares stages directly.
+    """
+    payload = synthesize_payload(shape)
+    records = shape.record_count()
+    best: dict[str, BenchStage] = {}
+
+    with tempfile.TemporaryDirectory(prefix="cwr-bench-") as tmp:
+        path = Path(tmp) / "bench.out"
+        for _ in range(max(1, repeat)):
+            for name, secs, size in _run_once(
+                payload, path, cwr_version=cwr_version, output_format=output_format
+            ):
+                rss = peak_rss_mib()
+                prev = best.get(name)
+                if prev is None or secs < prev.seconds:
+                    best[name] = BenchStage(
+                        name=name,
+                        seconds=secs,
+                        records=records,
+                        records_per_sec=records / secs if secs > 0 else 0.0,
+                        bytes=size,
+                        process_peak_rss_mib=rss,
+                    )
+
+    return BenchReport(
+        tool_version=__version__,
+        python=f"{platform.python_implementation()} {platform.python_version()}",
+        created=datetime.now(UTC).isoformat(timespec="seconds"),
+        shape={
+            "works": shape.works,
+            "alt_titles": shape.alt_titles,
+            "comment_every": shape.comment_every,
+            "spu": shape.spu,
+        },
+        cwr_version=cwr_version,
+        output_format=output_format,
+        repeat=max(1, repeat),
+        stages=list(best.values()),
+        peak_rss_mib=peak_rss_mib(),
+    )
+
+
+def compare_reports(
+    baseline: BenchReport, current: BenchReport
+) -> list[tuple[str, float, float, float]]:
+    """
+    Per stage present in both: (stage, baseline records/s, current records/s,
+    slowdown in %). Negative slowdown means faster. Throughput rather than
+    seconds is compared, so reports of different shapes remain comparable.
+    """
+    before = {s.name: s for s in baseline.stages}
+    rows: list[tuple[str, float, float, float]] = []
+    for stage in current.stages:
+        old = before.get(stage.name)
+        if old is None or stage.records_per_sec <= 0:
+            continue
+        slowdown = (old.records_per_sec / stage.records_per_sec - 1.0) * 100.0
+        rows.append((stage.name, old.records_per_sec, stage.records_per_sec, slowdown))
+    return rows
@@ -1,18 +1,34 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Annotated, Any, cast
+from typing import TYPE_CHECKING, Annotated, Any, cast
 
 import typer
 
-from cwr_tool.generation.pipeline import generate_cwr_file
-from cwr_tool.models.input import MinimalPayload
-from cwr_tool.validation.engine import validate_minimal
+from cwr_tool.service import DEFAULT_HOST, DEFAULT_PORT, SERVER_ENV
+from cwr_tool.validation.modes import ValidationMode
+
+if TYPE_CHECKING:
+    from cwr_tool.reporting.metrics import Metrics
+    from cwr_tool.reporting.models import IssueLimits, ValidationReport
+
+# Only typer and light modules are imported at module level: `--help`,
+# `schema`, `parse` etc. must not pay for the generation/validation stack.
+# Commands import what they need when they run (see tests/test_startup.py).
 
 app = typer.Typer(no_args_is_help=True)
 
 
+def _check_format(output_format: str) -> None:
+    from cwr_tool.format import OUTPUT_FORMATS
+
+    if output_format not in OUTPUT_FORMATS:
+        raise typer.BadParameter(f"format must be one of: {', '.join(OUTPUT_FORMATS)}")
+
+
 def _read_json(path: Path) -> dict[str, Any]:
     """Read a JSON file and ensure the top-level value is an object (dict)."""
     try:
@@ -30,20 +46,156 @@ def _read_json(path: Path) -> dict[str, Any]:
     return cast(dict[str, Any], data)
 
 
+def _load_payload(path: Path, stream: bool) -> Mapping[str, Any]:
+    """Load the whole payload, or (with --stream) open it for incremental reading."""
+    from cwr_tool.ingest.json_stream import StreamingPayload
+
+    if not stream:
+        return _read_json(path)
+    if not path.is_file():
+        raise typer.BadParameter(f"File not found: {path}")
+    return StreamingPayload(path)
+
+
+@contextmanager
+def _stream_errors(path: Path) -> Iterator[None]:
+    """Surface JSON errors found mid-stream the same way _read_json does."""
+    from cwr_tool.ingest.json_stream import JsonStreamError
+
+    try:
+        yield
+    except JsonStreamError as e:
+        raise typer.BadParameter(f"Invalid JSON in {path}: {e}") from None
+
+
+StreamOption = Annotated[
+    bool,
+    typer.Option(
+        "--stream",
+        help="Read works/spu incrementally instead of loading the whole JSON into memory.",
+    ),
+]
+ModeOption = Annotated[
+    ValidationMode,
+    typer.Option(
+        "--mode",
+        help="Validation depth: minimal (required fields, duplicates), strict (plus the "
+        "input contract, Pydantic), fast (the same by compiled checks) or trusted "
+        "(works array only; no per-work or duplicate checks).",
+    ),
+]
+MaxIssuesOption = Annotated[
+    int | None,
+    typer.Option(
+        "--max-issues",
+        min=0,
+        help="Keep at most N issues in the report; further ones are only counted "
+        "(per code, under 'omitted').",
+    ),
+]
+MaxIssuesPerCodeOption = Annotated[
+    int | None,
+    typer.Option(
+        "--max-issues-per-code",
+        min=0,
+        help="Keep the first N issues of each code; further ones are only counted.",
+    ),
+]
+ServerOption = Annotated[
+    str | None,
+    typer.Option(
+        "--server",
+        envvar=SERVER_ENV,
+        help="Send the work to a running `cwr-tool serve` (e.g. http://127.0.0.1:8765).",
+    ),
+]
+
+
+def _issue_limits(max_issues: int | None, per_code: int | None) -> IssueLimits | None:
+    if max_issues is None and per_code is None:
+        return None
+    from cwr_tool.reporting.models import IssueLimits
+
+    return IssueLimits(max_issues=max_issues, per_code=per_code)
+
+
+def _read_bytes(path: Path) -> bytes:
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        raise typer.BadParameter(f"File not found: {path}") from None
+
+
+@contextmanager
+def _service_errors() -> Iterator[None]:
+    from cwr_tool.service.client import ServiceError
+
+    try:
+        yield
+    except (ServiceError, ValueError) as e:
+        raise typer.BadParameter(str(e)) from None
+
+
 @app.command()
 def validate(
     input_path: Annotated[Path, typer.Argument(help="Path to input JSON payload")],
     version: Annotated[
         str, typer.Option("--version", "-v", help="CWR version (2.1, 2.2, 3.0, 3.1)")
     ] = "2.1",
+    stream: StreamOption = False,
+    mode: ModeOption = ValidationMode.MINIMAL,
+    workers: Annotated[
+        int,
+        typer.Option("--workers", "-j", min=1, help="Validate works in shards on N processes."),
+    ] = 1,
+    max_issues: MaxIssuesOption = None,
+    max_issues_per_code: MaxIssuesPerCodeOption = None,
+    ndjson: Annotated[
+        bool,
+        typer.Option(
+            "--ndjson",
+            help="Print the report as NDJSON: a summary line, then one line per issue.",
+        ),
+    ] = False,
+    server: ServerOption = None,
 ) -> None:
     """Validate an input JSON payload and print a structured JSON report."""
-    payload = _read_json(input_path)
-    report = validate_minimal(payload, version=version)
-    typer.echo(report.model_dump_json(indent=2))
+    limits = _issue_limits(max_issues, max_issues_per_code)
+    if server is not None:
+        from cwr_tool.service.client import CWRClient
+
+        if limits is not None:
+            raise typer.BadParameter("--server cannot be combined with --max-issues*")
+        with _service_errors(), CWRClient(server) as client:
+            sent = client.validate(_read_bytes(input_path), version=version, mode=mode)
+        if ndjson:
+            _print_report(sent.parse(), ndjson)
+        else:
+            typer.echo(sent.json)
+        raise typer.Exit(code=0 if sent.ok else 2)
+
+    from cwr_tool.validation.engine import validate_minimal
+
+    payload = _load_payload(input_path, stream)
+    with _stream_errors(input_path):
+        report = validate_minimal(
+            payload, version=version, mode=mode, workers=workers, issue_limits=limits
+        )
+    _print_report(report, ndjson)
     raise typer.Exit(code=0 if report.ok else 2)
 
 
+def _print_report(report: ValidationReport, ndjson: bool) -> None:
+    if not ndjson:
+        typer.echo(report.model_dump_json(indent=2))
+        return
+    from cwr_tool.reporting.ndjson import write_report_ndjson
+
+    out = typer.get_text_stream("stdout")
+    write_report_ndjson(report, out)
+    out.flush()
+
+
 @app.command()
 def generate(
     input_path: Annotated[Path, typer.Argument(help="Path to input JSON payload")],
@@ -65,30 +217,371 @@ def generate(
         str, typer.Option("--receiver", help="Receiver code (3 chars recommended)")
     ] = "000",
     file_seq: Annotated[int, typer.Option("--file-seq", help="File sequence number (1-9999)")] = 1,
+    stream: StreamOption = False,
+    workers: Annotated[
+        int,
+        typer.Option("--workers", "-j", min=1, help="Validate and render on N processes."),
+    ] = 1,
+    output_format: Annotated[
+        str,
+        typer.Option(
+            "--format", "-f", help="Line format: kv (KEY=VALUE) or fixedwidth (CWR layouts)."
+        ),
+    ] = "kv",
+    cache_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--cache-dir",
+            help="Reuse rendered works from (and save them to) a cache in this directory.",
+        ),
+    ] = None,
+    mode: ModeOption = ValidationMode.MINIMAL,
+    with_metrics: Annotated[
+        bool,
+        typer.Option(
+            "--metrics",
+            help="Add per-stage timings and counts to the report (with --stream, JSON "
+            "is read during validation and rendering rather than in load_json).",
+        ),
+    ] = False,
+    receivers: Annotated[
+        str | None,
+        typer.Option(
+            "--receivers",
+            help="Comma-separated receiver codes: render once and write one file per "
+            "receiver (suggested filenames) into the --out directory. Overrides --receiver.",
+        ),
+    ] = None,
+    versions: Annotated[
+        str | None,
+        typer.Option(
+            "--versions",
+            help="Comma-separated CWR versions: validate and render once, write one file per "
+            "version (suggested filenames) into the --out directory. Overrides --version.",
+        ),
+    ] = None,
+    max_issues: MaxIssuesOption = None,
+    max_issues_per_code: MaxIssuesPerCodeOption = None,
+    server: ServerOption = None,
 ) -> None:
     """Generate a minimal WRK-group CWR file via the pipeline."""
     if not (1 <= file_seq <= 9999):
         raise typer.BadParameter("file-seq must be between 1 and 9999")
+    _check_format(output_format)
+    limits = _issue_limits(max_issues, max_issues_per_code)
+    if server is not None:
+        if workers > 1 or cache_dir is not None or with_metrics or receivers or versions:
+            raise typer.BadParameter(
+                "--server cannot be combined with "
+                "--workers/--cache-dir/--metrics/--receivers/--versions"
+            )
+        if limits is not None:
+            raise typer.BadParameter("--server cannot be combined with --max-issues*")
+        _generate_via_server(
+            server,
+            input_path,
+            out,
+            version=version,
+            sender=sender,
+            receiver=receiver,
+            file_seq=file_seq,
+            output_format=output_format,
+            mode=mode,
+        )
+        return
+    if receivers is not None and versions is not None:
+        raise typer.BadParameter("--receivers and --versions cannot be combined")
+    if versions is not None and (workers > 1 or cache_dir is not None):
+        raise typer.BadParameter("--versions cannot be combined with --workers/--cache-dir")
+    if (receivers is not None or versions is not None) and out is not None and out.is_file():
+        raise typer.BadParameter("with --receivers/--versions, --out is a directory")
+    version_list = None if versions is None else _version_list(versions)
 
-    payload = _read_json(input_path)
+    from cwr_tool.generation.pipeline import generate_cwr_to_path
+    from cwr_tool.reporting.metrics import NULL_METRICS, Metrics
+    from cwr_tool.reporting.paths import report_path_for
 
-    report, cwr_text, suggested_name = generate_cwr_file(
-        payload=payload,
-        cwr_version=version,
-        sender=sender,
-        receiver=receiver,
-        file_sequence=file_seq,
-    )
+    metrics = Metrics() if with_metrics else NULL_METRICS
+    with metrics.stage("load_json") as st:
+        payload = _load_payload(input_path, stream)
+        if metrics.enabled:
+            st.bytes += input_path.stat().st_size
 
-    if not report.ok:
+    if receivers is not None:
+        _generate_fanout(
+            payload,
+            input_path,
+            out,
+            receivers=[r for r in receivers.split(",") if r.strip()],
+            version=version,
+            sender=sender,
+            file_seq=file_seq,
+            workers=workers,
+            output_format=output_format,
+            cache_dir=cache_dir,
+            mode=mode,
+            limits=limits,
+            metrics=metrics,
+        )
+        return
+    if version_list is not None:
+        _generate_versions(
+            payload,
+            input_path,
+            out,
+            versions=version_list,
+            sender=sender,
+            receiver=receiver,
+            file_seq=file_seq,
+            output_format=output_format,
+            mode=mode,
+            limits=limits,
+            metrics=metrics,
+        )
+        return
+
+    with _stream_errors(input_path):
+        report, output_path, suggested_name = generate_cwr_to_path(
+            payload=payload,
+            cwr_version=version,
+            sender=sender,
+            receiver=receiver,
+            file_sequence=file_seq,
+            output_path=out,
+            workers=workers,
+            output_format=output_format,
+            cache_dir=cache_dir,
+            validation_mode=mode,
+            issue_limits=limits,
+            metrics=metrics,
+        )
+
+    if output_path is None:
         typer.echo(report.model_dump_json(indent=2))
         raise typer.Exit(code=2)
 
-    output_path = out or (Path.cwd() / suggested_name)
+    report_path = report_path_for(output_path)
+    report_path.write_text(report.model_dump_json(indent=2), encoding="utf-8")
+
+    typer.echo(f"Wrote: {output_path}")
+    typer.echo(f"Wrote: {report_path}")
+    typer.echo(f"Suggested filename: {suggested_name}")
+
+
+def _generate_fanout(
+    payload: Mapping[str, Any],
+    input_path: Path,
+    out_dir: Path | None,
+    *,
+    receivers: list[str],
+    version: str,
+    sender: str,
+    file_seq: int,
+    workers: int,
+    output_format: str,
+    cache_dir: Path | None,
+    mode: str,
+    limits: IssueLimits | None,
+    metrics: Metrics,
+) -> None:
+    from cwr_tool.generation.pipeline import generate_cwr_fanout
+
+    codes = [r.strip().upper() for r in receivers]
+    if not codes or len(set(codes)) != len(codes):
+        raise typer.BadParameter("--receivers needs distinct, non-empty receiver codes")
+
+    with _stream_errors(input_path):
+        report, written = generate_cwr_fanout(
+            payload=payload,
+            cwr_version=version,
+            sender=sender,
+            receivers=receivers,
+            file_sequence=file_seq,
+            out_dir=out_dir,
+            workers=workers,
+            output_format=output_format,
+            cache_dir=cache_dir,
+            validation_mode=mode,
+            issue_limits=limits,
+            metrics=metrics,
+        )
+    _write_reports(report, written.values())
+
+
+def _version_list(versions: str) -> list[str]:
+    """--versions as a list, checked before any work is done."""
+    from cwr_tool.spec.registry import SpecRegistry
+
+    out = [v.strip() for v in versions.split(",") if v.strip()]
+    if not out:
+        raise typer.BadParameter("--versions needs at least one CWR version")
+    if len(set(out)) != len(out):
+        raise typer.BadParameter(f"--versions repeats a version: {', '.join(out)}")
+    for v in out:
+        try:
+            SpecRegistry.get(v)
+        except ValueError as e:
+            raise typer.BadParameter(str(e)) from None
+    return out
+
+
+def _generate_versions(
+    payload: Mapping[str, Any],
+    input_path: Path,
+    out_dir: Path | None,
+    *,
+    versions: list[str],
+    sender: str,
+    receiver: str,
+    file_seq: int,
+    output_format: str,
+    mode: str,
+    limits: IssueLimits | None,
+    metrics: Metrics,
+) -> None:
+    from cwr_tool.generation.pipeline import generate_cwr_versions
+
+    with _stream_errors(input_path):
+        report, written = generate_cwr_versions(
+            payload=payload,
+            cwr_versions=versions,
+            sender=sender,
+            receiver=receiver,
+            file_sequence=file_seq,
+            out_dir=out_dir,
+            output_format=output_format,
+            validation_mode=mode,
+            issue_limits=limits,
+            metrics=metrics,
+        )
+    _write_reports(report, written.values())
+
+
+def _write_reports(report: ValidationReport, written: Iterable[Path]) -> None:
+    """Finish a multi-file generate: one report per written file, or exit 2."""
+    from cwr_tool.reporting.paths import report_path_for
+
+    paths = list(written)
+    if not paths:
+        typer.echo(report.model_dump_json(indent=2))
+        raise typer.Exit(code=2)
+
+    report_json = report.model_dump_json(indent=2)
+    for output_path in paths:
+        report_path = report_path_for(output_path)
+        report_path.write_text(report_json, encoding="utf-8")
+        typer.echo(f"Wrote: {output_path}")
+        typer.echo(f"Wrote: {report_path}")
+
+
+def _generate_via_server(
+    server: str,
+    input_path: Path,
+    out: Path | None,
+    *,
+    version: str,
+    sender: str,
+    receiver: str,
+    file_seq: int,
+    output_format: str,
+    mode: str,
+) -> None:
+    from cwr_tool.reporting.paths import report_path_for
+    from cwr_tool.service.client import CWRClient
+
+    with _service_errors(), CWRClient(server) as client:
+        report, data, suggested_name = client.generate(
+            _read_bytes(input_path),
+            version=version,
+            sender=sender,
+            receiver=receiver,
+            file_sequence=file_seq,
+            output_format=output_format,
+            mode=mode,
+        )
+    if data is None:
+        typer.echo(report.json)
+        raise typer.Exit(code=2)
+
+    output_path = out if out is not None else Path.cwd() / suggested_name
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(cwr_text, encoding="ascii", errors="strict")
+    part_path = output_path.with_name(output_path.name + ".part")
+    part_path.write_bytes(data)
+    part_path.replace(output_path)
+
+    # the server's report JSON as sent: no Pydantic on this path
+    report_path = report_path_for(output_path)
+    report_path.write_text(report.json, encoding="utf-8")
+
+    typer.echo(f"Wrote: {output_path}")
+    typer.echo(f"Wrote: {report_path}")
+    typer.echo(f"Suggested filename: {suggested_name}")
+
+
+@app.command("diff-generate")
+def diff_generate(
+    old_path: Annotated[Path, typer.Argument(help="Payload of the previous delivery")],
+    input_path: Annotated[Path, typer.Argument(help="Current payload")],
+    out: Annotated[
+        Path | None,
+        typer.Option(
+            "--out",
+            "-o",
+            help="Output .Vxx file path. If omitted, uses suggested filename in CWD.",
+        ),
+    ] = None,
+    version: Annotated[
+        str, typer.Option("--version", "-v", help="CWR version (2.1, 2.2, 3.0, 3.1)")
+    ] = "2.1",
+    sender: Annotated[
+        str, typer.Option("--sender", help="Sender code (3 chars recommended)")
+    ] = "SUB",
+    receiver: Annotated[
+        str, typer.Option("--receiver", help="Receiver code (3 chars recommended)")
+    ] = "000",
+    file_seq: Annotated[int, typer.Option("--file-seq", help="File sequence number (1-9999)")] = 1,
+    stream: StreamOption = False,
+    output_format: Annotated[
+        str,
+        typer.Option(
+            "--format", "-f", help="Line format: kv (KEY=VALUE) or fixedwidth (CWR layouts)."
+        ),
+    ] = "kv",
+) -> None:
+    """Generate a CWR file with only the works that are new (NWR) or changed (REV)."""
+    if not (1 <= file_seq <= 9999):
+        raise typer.BadParameter("file-seq must be between 1 and 9999")
+    _check_format(output_format)
+
+    from cwr_tool.generation.pipeline import generate_delta_to_path
+    from cwr_tool.ingest.json_stream import JsonStreamError
+    from cwr_tool.reporting.paths import report_path_for
 
-    report_path = output_path.with_suffix(output_path.suffix + ".report.json")
+    old_payload = _load_payload(old_path, stream)
+    payload = _load_payload(input_path, stream)
+
+    try:
+        report, output_path, suggested_name = generate_delta_to_path(
+            old_payload=old_payload,
+            payload=payload,
+            cwr_version=version,
+            sender=sender,
+            receiver=receiver,
+            file_sequence=file_seq,
+            output_path=out,
+            output_format=output_format,
+        )
+    except JsonStreamError as e:
+        # both payloads may be streamed; the error does not say which one failed
+        raise typer.BadParameter(f"Invalid JSON in {old_path} or {input_path}: {e}") from None
+    except ValueError as e:
+        raise typer.BadParameter(str(e)) from None
+
+    if output_path is None:
+        typer.echo(report.model_dump_json(indent=2))
+        raise typer.Exit(code=2)
+
+    report_path = report_path_for(output_path)
     report_path.write_text(report.model_dump_json(indent=2), encoding="utf-8")
 
     typer.echo(f"Wrote: {output_path}")
@@ -96,6 +589,200 @@ def generate(
     typer.echo(f"Suggested filename: {suggested_name}")
 
 
+@app.command("generate-batch")
+def generate_batch(
+    manifest_path: Annotated[Path, typer.Argument(help="Path to batch manifest JSON")],
+    out_dir: Annotated[
+        Path,
+        typer.Option("--out-dir", "-d", help="Directory for files without an explicit 'out'."),
+    ] = Path("."),
+    jobs: Annotated[
+        int, typer.Option("--jobs", "-j", min=1, help="Generate up to N files in parallel.")
+    ] = 1,
+    summary: Annotated[
+        Path | None,
+        typer.Option("--summary", help="Also write the combined summary JSON to this path."),
+    ] = None,
+    seq_state: Annotated[
+        Path | None,
+        typer.Option(
+            "--seq-state",
+            help="JSON file with the last file sequence number per sender/receiver: "
+            "auto-numbering continues from it and it is updated after the run. Without "
+            "it, numbering starts at 1 on every run.",
+        ),
+    ] = None,
+) -> None:
+    """Generate many CWR files from a manifest in one invocation."""
+    from cwr_tool.generation.batch import (
+        ManifestError,
+        load_manifest,
+        load_sequence_state,
+        run_batch,
+        save_sequence_state,
+    )
+
+    try:
+        last = {} if seq_state is None else load_sequence_state(seq_state)
+        entries = load_manifest(manifest_path, last_sequences=last)
+    except FileNotFoundError:
+        raise typer.BadParameter(f"File not found: {manifest_path}") from None
+    except ManifestError as e:
+        raise typer.BadParameter(str(e)) from None
+
+    result = run_batch(entries, out_dir=out_dir, jobs=jobs)
+    if seq_state is not None:
+        save_sequence_state(seq_state, last, result.entries)
+    summary_json = result.model_dump_json(indent=2)
+
+    if summary is not None:
+        summary.parent.mkdir(parents=True, exist_ok=True)
+        summary.write_text(summary_json, encoding="utf-8")
+
+    typer.echo(summary_json)
+    raise typer.Exit(code=0 if result.ok else 2)
+
+
+@app.command()
+def parse(
+    input_path: Annotated[Path, typer.Argument(help="Path to a CWR .Vxx file")],
+    record_type: Annotated[
+        list[str] | None,
+        typer.Option("--type", "-t", help="Only output these record types (repeatable)."),
+    ] = None,
+    limit: Annotated[
+        int | None, typer.Option("--limit", min=1, help="Stop after N output records.")
+    ] = None,
+) -> None:
+    """Parse a CWR file and print one JSON object per record (NDJSON)."""
+    from cwr_tool.parsing.reader import ParseError, iter_records
+
+    if not input_path.is_file():
+        raise typer.BadParameter(f"File not found: {input_path}")
+
+    wanted = {t.strip().upper() for t in record_type} if record_type else None
+    n = 0
+    try:
+        for rec in iter_records(input_path):
+            # skipped records are never decoded
+            if wanted is not None and rec.record_type not in wanted:
+                continue
+            fields = rec.fields() if rec.known else None
+            typer.echo(json.dumps({"line": rec.line_no, "type": rec.record_type, "fields": fields}))
+            n += 1
+            if limit is not None and n >= limit:
+                break
+    except ParseError as e:
+        typer.echo(f"Parse error in {input_path}: {e}", err=True)
+        raise typer.Exit(code=2) from None
+
+
+@app.command()
+def verify(
+    input_path: Annotated[Path, typer.Argument(help="Path to a CWR .Vxx file")],
+) -> None:
+    """Check GRT/TRL totals of a CWR file against its body and print a JSON report."""
+    from cwr_tool.parsing.verify import verify_file
+
+    if not input_path.is_file():
+        raise typer.BadParameter(f"File not found: {input_path}")
+
+    report = verify_file(input_path)
+    typer.echo(report.model_dump_json(indent=2))
+    raise typer.Exit(code=0 if report.ok else 2)
+
+
+@app.command()
+def bench(
+    works: Annotated[int, typer.Option("--works", min=1, help="Synthetic works.")] = 100_000,
+    alt_titles: Annotated[
+        int, typer.Option("--alt-titles", min=0, help="ALT titles per work.")
+    ] = 1,
+    comment_every: Annotated[
+        int, typer.Option("--comment-every", min=0, help="Every N-th work has a comment (0: none).")
+    ] = 10,
+    spu: Annotated[int, typer.Option("--spu", min=0, help="Synthetic SPU entries.")] = 100,
+    version: Annotated[
+        str, typer.Option("--version", "-v", help="CWR version (2.1, 2.2, 3.0, 3.1)")
+    ] = "2.1",
+    output_format: Annotated[
+        str,
+        typer.Option("--format", "-f", help="Format of the streaming-writer stage."),
+    ] = "kv",
+    repeat: Annotated[int, typer.Option("--repeat", min=1, help="Keep the best of N runs.")] = 3,
+    out: Annotated[
+        Path | None,
+        typer.Option("--out", "-o", help="Write the JSON results here (or stdout if omitted)."),
+    ] = None,
+    compare: Annotated[
+        Path | None,
+        typer.Option("--compare", help="Results JSON of an earlier run to compare against."),
+    ] = None,
+    max_slowdown: Annotated[
+        float | None,
+        typer.Option(
+            "--max-slowdown", help="With --compare: exit 2 if any stage is this % slower."
+        ),
+    ] = None,
+) -> None:
+    """Time each pipeline stage on a synthetic catalogue (records/sec, peak RSS)."""
+    from cwr_tool.bench.catalogue import CatalogueShape
+    from cwr_tool.bench.runner import compare_reports, run_benchmark
+    from cwr_tool.reporting.models import BenchReport
+
+    _check_format(output_format)
+    baseline = None
+    if compare is not None:
+        if not compare.is_file():
+            raise typer.BadParameter(f"File not found: {compare}")
+        baseline = BenchReport.model_validate_json(compare.read_text(encoding="utf-8"))
+
+    shape = CatalogueShape(works=works, alt_titles=alt_titles, comment_every=comment_every, spu=spu)
+    try:
+        result = run_benchmark(
+            shape, cwr_version=version, output_format=output_format, repeat=repeat
+        )
+    except ValueError as e:
+        raise typer.BadParameter(str(e)) from None
+
+    if out is None:
+        typer.echo(result.model_dump_json(indent=2))
+    else:
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(result.model_dump_json(indent=2), encoding="utf-8")
+        for st in result.stages:
+            typer.echo(f"{st.name:24s} {st.seconds:9.3f} s {st.records_per_sec:14,.0f} records/s")
+        typer.echo(f"Wrote: {out}")
+
+    if baseline is None:
+        return
+    worst = 0.0
+    for name, before, after, slowdown in compare_reports(baseline, result):
+        worst = max(worst, slowdown)
+        typer.echo(
+            f"{name:24s} {before:14,.0f} -> {after:14,.0f} records/s ({slowdown:+.1f}% time)"
+        )
+    if max_slowdown is not None and worst > max_slowdown:
+        raise typer.Exit(code=2)
+
+
+@app.command("serve")
+def serve_command(
+    host: Annotated[str, typer.Option("--host", help="Interface to listen on.")] = DEFAULT_HOST,
+    port: Annotated[int, typer.Option("--port", "-p", help="TCP port.")] = DEFAULT_PORT,
+    workers: Annotated[
+        int,
+        typer.Option("--workers", "-j", min=1, help="Worker threads (concurrent connections)."),
+    ] = 4,
+    verbose: Annotated[bool, typer.Option("--verbose", help="Log every request.")] = False,
+) -> None:
+    """Serve validate/generate over local HTTP so callers skip per-run start-up."""
+    from cwr_tool.service.server import serve
+
+    typer.echo(f"Serving on http://{host}:{port} (Ctrl+C to stop)")
+    serve(host, port, workers=workers, verbose=verbose)
+
+
 @app.command()
 def hello(
     out: Annotated[
@@ -104,6 +791,9 @@ def hello(
     ] = None,
 ) -> None:
     """Create a tiny input JSON and (optionally) generate a file, for smoke testing."""
+    from cwr_tool.generation.pipeline import generate_cwr_to_path
+    from cwr_tool.validation.engine import validate_minimal
+
     sample: dict[str, Any] = {
         "works": [
             {"title": "HELLO WORLD", "submitter_work_number": "0000000001", "language_code": "EN"},
@@ -115,20 +805,17 @@ def hello(
     if not report.ok:
         raise typer.Exit(code=2)
 
-    report2, cwr_text, suggested_name = generate_cwr_file(
+    _report2, output_path, suggested_name = generate_cwr_to_path(
         payload=sample,
         cwr_version="2.1",
         sender="SUB",
         receiver="000",
         file_sequence=1,
+        output_path=out,
     )
-    if not report2.ok:
+    if output_path is None:
         raise typer.Exit(code=2)
 
-    output_path = out or (Path.cwd() / suggested_name)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(cwr_text, encoding="ascii", errors="strict")
-
     typer.echo(f"Wrote: {output_path}")
     typer.echo(f"Suggested filename: {suggested_name}")
 
@@ -141,6 +828,7 @@ def schema(
     ] = None,
 ) -> None:
     """Print the JSON schema for the current input payload contract."""
+    from cwr_tool.models.input import MinimalPayload
 
     schema_json = MinimalPayload.model_json_schema()
 
@@ -0,0 +1,2 @@
+# "kv": placeholder KEY=VALUE lines; "fixedwidth": the version's record layouts
+OUTPUT_FORMATS = ("kv", "fixedwidth")
@@ -0,0 +1,123 @@
+"""
+CWR character set: printable ASCII, and a transliteration table into it.
+
+Payloads often carry accented names and typographic punctuation ("Café",
+"Don’t Stop — Live"). TRANSLITERATION maps those onto the closest ASCII
+text so a record renders instead of failing when the file is encoded:
+accented Latin letters lose their accents (from Unicode decomposition),
+ligatures and letters without a decomposition get an explicit spelling,
+and quotes, dashes, spaces and ellipses get their ASCII form.
+
+to_cwr_text() applies the table in one str.translate() call and returns
+text that is already ASCII unchanged, so the common case costs one
+isascii() check. Characters the table does not know (CJK, emoji, control
+characters) are left in place; find_invalid() reports the first of them,
+for validation rules to point at the offending work.
+"""
+
+from __future__ import annotations
+
+import unicodedata
+
+# Letters and symbols Unicode decomposition does not reduce to ASCII.
+_SPELLED = {
+    "Æ": "AE",
+    "æ": "ae",
+    "Œ": "OE",
+    "œ": "oe",
+    "ß": "ss",
+    "ẞ": "SS",
+    "Ø": "O",
+    "ø": "o",
+    "Đ": "D",
+    "đ": "d",
+    "Ð": "D",
+    "ð": "d",
+    "Ħ": "H",
+    "ħ": "h",
+    "ı": "i",
+    "Ł": "L",
+    "ł": "l",
+    "Þ": "TH",
+    "þ": "th",
+    "‘": "'",
+    "’": "'",
+    "‚": "'",
+    "‛": "'",
+    "′": "'",
+    "´": "'",
+    "“": '"',
+    "”": '"',
+    "„": '"',
+    "‟": '"',
+    "″": '"',
+    "«": '"',
+    "»": '"',
+    "‐": "-",
+    "‑": "-",
+    "‒": "-",
+    "–": "-",
+    "—": "-",
+    "―": "-",
+    "−": "-",
+}
+
+
+def _build_table() -> dict[int, str]:
+    table: dict[int, str] = {}
+    # Latin-1 Supplement, Latin Extended-A/B, General Punctuation
+    for cp in (*range(0x80, 0x250), *range(0x2000, 0x2070)):
+        ch = chr(cp)
+        base = "".join(c for c in unicodedata.normalize("NFKD", ch) if not unicodedata.combining(c))
+        if not (base.isascii() and base.isprintable()) or not base:
+            continue
+        # a spacing accent (¨, ¸) decomposes to a space: only real spaces map to one
+        if base.isspace() and unicodedata.category(ch) != "Zs":
+            continue
+        table[cp] = base
+    table.update({ord(k): v for k, v in _SPELLED.items()})
+    return table
+
+
+TRANSLITERATION: dict[int, str] = _build_table()
+
+
+def is_cwr_text(s: str) -> bool:
+    """True if `s` only has characters of the CWR character set (printable ASCII)."""
+    return s.isascii() and s.isprintable()
+
+
+def to_cwr_text(s: str) -> str:
+    """`s` with every character TRANSLITERATION knows replaced by its ASCII form."""
+    return s if s.isascii() else s.translate(TRANSLITERATION)
+
+
+def find_invalid(s: str) -> tuple[int, str] | None:
+    """
+    First character of `s` that is outside the CWR character set even after
+    transliteration, as (position in the transliterated text, character).
+    """
+    t = to_cwr_text(s)
+    if is_cwr_text(t):
+        return None
+    return next((i, c) for i, c in enumerate(t) if not is_cwr_text(c))
+
+
+def first_invalid(s: str) -> str:
+    """First character of `s` outside the CWR character set (`s` must have one)."""
+    return next(c for c in s if not is_cwr_text(c))
+
+
+def ascii_line(line: str) -> str:
+    """
+    A rendered KEY=VALUE line, transliterated; ValueError if it cannot be
+    (a character outside the CWR character set, control characters included).
+    """
+    if is_cwr_text(line):
+        return line
+    line = line.translate(TRANSLITERATION)
+    if not is_cwr_text(line):
+        raise ValueError(
+            f"{line[:3]}: character outside the CWR character set: {first_invalid(line)!r}"
+        )
+    return line
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 
+from cwr_tool.format.charset import first_invalid, is_cwr_text, to_cwr_text
+
 
 class FixedWidthError(ValueError):
     pass
@@ -33,10 +36,9 @@ class FieldSpec:
 
 
 def _to_ascii(s: str) -> str:
-    try:
-        s.encode("ascii")
-    except UnicodeEncodeError as e:
-        raise FixedWidthError(f"Non-ASCII character: {e}") from None
+    s = to_cwr_text(s)
+    if not is_cwr_text(s):
+        raise FixedWidthError(f"Character outside the CWR character set: {first_invalid(s)!r}")
     return s
 
 
@@ -79,3 +81,124 @@ def fmt_int(value: int | str | None, spec: FieldSpec) -> str:
     if align == "left":
         return raw.ljust(spec.width, pad)
     return raw.rjust(spec.width, pad)
+
+
+@dataclass(frozen=True, slots=True)
+class LayoutField:
+    """
+    One field of a fixed-width record layout.
+
+    - numeric: format like fmt_int (digits only, keep rightmost on overflow)
+    - const: fixed value baked into the layout at compile time (record type, filler)
+    """
+
+    name: str
+    spec: FieldSpec
+    numeric: bool = False
+    const: str | None = None
+
+
+class CompiledLayout:
+    """
+    A record layout compiled into one str.format template.
+
+    Equivalent to calling fmt_text/fmt_int per field and concatenating, but:
+    - constant fields are pre-rendered into the template
+    - padding/truncation of text fields is done by the template's format specs
+    - the character set check runs once per line instead of once per field
+    """
+
+    __slots__ = (
+        "fields",
+        "width",
+        "_names",
+        "_spans",
+        "_template",
+        "_required",
+        "_numeric",
+    )
+
+    def __init__(self, fields: Sequence[LayoutField]) -> None:
+        self.fields = tuple(fields)
+        self.width = sum(f.spec.width for f in self.fields)
+
+        parts: list[str] = []
+        names: list[str] = []
+        spans: dict[str, tuple[int, int]] = {}
+        offset = 0
+        for f in self.fields:
+            spec = f.spec
+            offset += spec.width
+            if f.const is not None:
+                fmt = fmt_int if f.numeric else fmt_text
+                parts.append(fmt(f.const, spec).replace("{", "{{").replace("}", "}}"))
+                continue
+            if spec.pad in "{}":
+                raise FixedWidthError(f"{f.name}: pad cannot be a brace in a compiled layout")
+            align = "<" if spec.align == "left" else ">"
+            # numeric values are pre-truncated (rightmost digits), text via precision
+            precision = "" if f.numeric else f".{spec.width}"
+            parts.append(f"{{{len(names)}:{spec.pad}{align}{spec.width}{precision}}}")
+            names.append(f.name)
+            spans[f.name] = (offset - spec.width, offset)
+
+        self._names = tuple(names)
+        self._spans = spans
+        self._template = "".join(parts)
+        variable = [f for f in self.fields if f.const is None]
+        self._required = tuple(i for i, f in enumerate(variable) if f.spec.required)
+        self._numeric = tuple((i, f.spec.width) for i, f in enumerate(variable) if f.numeric)
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Names of the non-constant fields, in layout order."""
+        return self._names
+
+    def span(self, name: str) -> tuple[int, int]:
+        """(start, end) column offsets of a named field, for slicing parsed lines."""
+        try:
+            return self._spans[name]
+        except KeyError:
+            raise FixedWidthError(f"Unknown field: {name}") from None
+
+    def render(self, values: Mapping[str, object]) -> str:
+        """Render one line; missing names render as blank."""
+        get = values.get
+        return self.render_row([get(n) for n in self._names])
+
+    def render_row(self, row: Sequence[object]) -> str:
+        """Render one line from values given in `names` order."""
+        vals = ["" if v is None else str(v).strip() for v in row]
+
+        for i in self._required:
+            if not vals[i]:
+                raise FixedWidthError(f"Required field is blank: {self._names[i]}")
+
+        for i, width in self._numeric:
+            raw = vals[i]
+            if raw:
+                if not raw.isdigit():
+                    raise FixedWidthError(f"Numeric field must be digits only: {raw}")
+                if len(raw) > width:
+                    vals[i] = raw[-width:]
+
+        line = self._template.format(*vals)
+        # printable ASCII only: a control character (tab, CR, LF) would split the record
+        if not is_cwr_text(line):
+            # transliterate the values, not the line: "Æ" -> "AE" changes widths
+            vals = [to_cwr_text(v) for v in vals]
+            line = self._template.format(*vals)
+            if not is_cwr_text(line):
+                name, value = next(
+                    (n, v) for n, v in zip(self._names, vals, strict=True) if not is_cwr_text(v)
+                )
+                raise FixedWidthError(
+                    f"Character outside the CWR character set in field {name}: "
+                    f"{first_invalid(value)!r}"
+                )
+        return line
+
+
+def compile_layout(fields: Sequence[LayoutField]) -> CompiledLayout:
+    """Compile an ordered field list (one record type/version) into a line formatter."""
+    return CompiledLayout(fields)
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from cwr_tool.format.charset import ascii_line
+from cwr_tool.spec.registry import VersionSpec
+
 
 def _req(value: str, field: str) -> str:
     v = value.strip()
@@ -10,6 +13,13 @@ def _req(value: str, field: str) -> str:
     return v
 
 
+def alt_line(spec: VersionSpec | None, tx_seq: int, rec_seq: int, title: str) -> str:
+    """ALT line from an already-normalized title (spec None: KEY=VALUE format)."""
+    if spec is None:
+        return ascii_line(f"ALT TITLE={title}")
+    return spec.layout("ALT").render_row([tx_seq, rec_seq, title])
+
+
 @dataclass(frozen=True, slots=True)
 class ALTRecord:
     """Alternate title record within a WRK transaction."""
@@ -21,5 +31,7 @@ class ALTRecord:
         return 0, 1
 
     def render(self) -> str:
-        t = _req(self.title, "title")
-        return f"ALT TITLE={t}"
+        return alt_line(None, 0, 0, _req(self.title, "title"))
+
+    def render_fixedwidth(self, spec: VersionSpec, tx_seq: int = 0, rec_seq: int = 0) -> str:
+        return alt_line(spec, tx_seq, rec_seq, _req(self.title, "title"))
@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from itertools import repeat
+from pathlib import Path
+from typing import Any
+
+from cwr_tool.generation.pipeline import ensure_utc, generate_cwr_to_path
+from cwr_tool.ingest.json_stream import load_payload
+from cwr_tool.reporting.models import BatchEntryResult, BatchSummary, Severity
+from cwr_tool.reporting.paths import report_path_for
+
+
+class ManifestError(ValueError):
+    pass
+
+
+# Last file sequence number written per (sender, receiver) pair
+SequenceState = dict[tuple[str, str], int]
+
+
+@dataclass(frozen=True, slots=True)
+class BatchEntry:
+    """
+    One file to generate in a batch run.
+
+    - file_sequence None means "next free number for this sender/receiver pair"
+    - output_path None means "suggested filename inside the batch out_dir"
+    """
+
+    input_path: Path
+    receiver: str
+    cwr_version: str = "2.1"
+    sender: str = "SUB"
+    file_sequence: int | None = None
+    output_path: Path | None = None
+    stream: bool = False
+    output_format: str = "kv"
+
+
+def _entry_from_json(raw: object, defaults: dict[str, Any], base_dir: Path, i: int) -> BatchEntry:
+    if not isinstance(raw, dict):
+        raise ManifestError(f"Manifest entry {i} must be an object")
+
+    merged = {**defaults, **raw}
+    try:
+        input_path = Path(merged["input"])
+        receiver = str(merged["receiver"])
+    except KeyError as e:
+        raise ManifestError(f"Manifest entry {i} is missing {e.args[0]!r}") from None
+
+    file_seq = merged.get("file_seq")
+    if file_seq is not None and (
+        isinstance(file_seq, bool) or not isinstance(file_seq, int) or not 1 <= file_seq <= 9999
+    ):
+        raise ManifestError(f"Manifest entry {i}: file_seq must be an integer 1-9999")
+
+    stream = merged.get("stream", False)
+    if not isinstance(stream, bool):
+        raise ManifestError(f"Manifest entry {i}: stream must be true or false")
+
+    out = merged.get("out")
+    return BatchEntry(
+        input_path=input_path if input_path.is_absolute() else base_dir / input_path,
+        receiver=receiver,
+        cwr_version=str(merged.get("version", "2.1")),
+        sender=str(merged.get("sender", "SUB")),
+        file_sequence=file_seq,
+        output_path=None if out is None else base_dir / Path(out),
+        stream=stream,
+        output_format=str(merged.get("format", "kv")),
+    )
+
+
+def load_manifest(
+    path: Path, *, last_sequences: Mapping[tuple[str, str], int] | None = None
+) -> list[BatchEntry]:
+    """
+    Load a batch manifest.
+
+    Either a list of entries, or an object with an "entries" list plus
+    defaults (sender, version, stream, format) applied to every entry:
+
+        {"sender": "SUB", "entries": [
+            {"input": "cat.json", "receiver": "ASC", "version": "2.2", "file_seq": 12},
+            {"input": "cat.json", "receiver": "BMI", "out": "out/bmi.V21"}
+        ]}
+
+    Relative paths are resolved against the manifest's directory, and
+    missing file sequence numbers are assigned (see assign_file_sequences;
+    `last_sequences` continues the numbering of earlier runs).
+    """
+    try:
+        data: Any = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as e:
+        raise ManifestError(f"Invalid JSON in {path}: {e.msg} (line {e.lineno})") from None
+
+    defaults: dict[str, Any] = {}
+    if isinstance(data, dict):
+        defaults = {k: v for k, v in data.items() if k != "entries"}
+        data = data.get("entries")
+    if not isinstance(data, list):
+        raise ManifestError("Manifest must be a list of entries or an object with 'entries'")
+
+    base_dir = path.parent
+    return assign_file_sequences(
+        [_entry_from_json(raw, defaults, base_dir, i) for i, raw in enumerate(data)],
+        last_sequences=last_sequences,
+    )
+
+
+def assign_file_sequences(
+    entries: Sequence[BatchEntry], *, last_sequences: Mapping[tuple[str, str], int] | None = None
+) -> list[BatchEntry]:
+    """
+    Fill in missing file sequence numbers, auto-incrementing per
+    (sender, receiver) pair in manifest order. A pair's counter starts after
+    its number in `last_sequences` (see load_sequence_state), or at 1.
+
+    An explicit file_seq is kept and the pair's counter continues after it
+    (it never moves back to a lower number).
+    Numbers are never reused within a pair: the counter skips every number
+    the manifest gives explicitly (wherever it appears), and the same
+    explicit number twice for one pair is a ManifestError.
+    """
+    used: dict[tuple[str, str], set[int]] = {}
+    for i, e in enumerate(entries):
+        if e.file_sequence is None:
+            continue
+        seqs = used.setdefault(_pair(e), set())
+        if e.file_sequence in seqs:
+            raise ManifestError(
+                f"Manifest entry {i}: file_seq {e.file_sequence} is already used "
+                f"for {e.sender}->{e.receiver}"
+            )
+        seqs.add(e.file_sequence)
+
+    next_seq = {pair: seq + 1 for pair, seq in (last_sequences or {}).items()}
+    out: list[BatchEntry] = []
+    for e in entries:
+        pair = _pair(e)
+        seq = e.file_sequence
+        if seq is None:
+            seqs = used.setdefault(pair, set())
+            seq = next_seq.get(pair, 1)
+            while seq in seqs:
+                seq += 1
+            if seq > 9999:
+                raise ManifestError(f"File sequence for {pair[0]}->{pair[1]} exceeds 9999")
+            seqs.add(seq)
+        next_seq[pair] = max(next_seq.get(pair, 1), seq + 1)
+        out.append(replace(e, file_sequence=seq))
+    return out
+
+
+def _pair(entry: BatchEntry) -> tuple[str, str]:
+    return _pair_of(entry.sender, entry.receiver)
+
+
+def _pair_of(sender: str, receiver: str) -> tuple[str, str]:
+    return sender.strip().upper(), receiver.strip().upper()
+
+
+def load_sequence_state(path: Path) -> SequenceState:
+    """
+    Read the last file sequence number per sender/receiver pair from a state
+    file ({"SUB": {"ASC": 12}}); a missing file is an empty state.
+    """
+    try:
+        data: Any = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except json.JSONDecodeError as e:
+        raise ManifestError(f"Invalid JSON in {path}: {e.msg} (line {e.lineno})") from None
+
+    state: SequenceState = {}
+    if not isinstance(data, dict):
+        raise ManifestError(f"{path}: sequence state must be an object")
+    for sender, receivers in data.items():
+        if not isinstance(receivers, dict):
+            raise ManifestError(f"{path}: {sender!r} must map receivers to numbers")
+        for receiver, seq in receivers.items():
+            if isinstance(seq, bool) or not isinstance(seq, int) or not 0 <= seq <= 9999:
+                raise ManifestError(f"{path}: {sender}->{receiver} must be an integer 0-9999")
+            state[_pair_of(sender, receiver)] = seq
+    return state
+
+
+def save_sequence_state(
+    path: Path, state: Mapping[tuple[str, str], int], results: Iterable[BatchEntryResult]
+) -> SequenceState:
+    """
+    Write `state` advanced by the files a batch wrote (failed entries do not
+    use up their number) and return it. Written atomically.
+    """
+    new: SequenceState = dict(state)
+    for r in results:
+        if r.ok:
+            pair = _pair_of(r.sender, r.receiver)
+            new[pair] = max(new.get(pair, 0), r.file_sequence)
+
+    data: dict[str, dict[str, int]] = {}
+    for (sender, receiver), seq in sorted(new.items()):
+        data.setdefault(sender, {})[receiver] = seq
+    path.parent.mkdir(parents=True, exist_ok=True)
+    part = path.with_name(path.name + ".part")
+    part.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    part.replace(path)
+    return new
+
+
+def _run_entry(entry: BatchEntry, out_dir: Path, created: datetime) -> BatchEntryResult:
+    if entry.file_sequence is None:
+        raise ValueError("file sequence must be assigned before running an entry")
+    result = BatchEntryResult(
+        input_path=str(entry.input_path),
+        sender=entry.sender,
+        receiver=entry.receiver,
+        cwr_version=entry.cwr_version,
+        file_sequence=entry.file_sequence,
+        ok=False,
+    )
+
+    try:
+        payload = load_payload(entry.input_path, stream=entry.stream)
+        report, output_path, _suggested = generate_cwr_to_path(
+            payload=payload,
+            cwr_version=entry.cwr_version,
+            sender=entry.sender,
+            receiver=entry.receiver,
+            file_sequence=entry.file_sequence,
+            output_path=entry.output_path,
+            out_dir=out_dir,
+            created=created,
+            output_format=entry.output_format,
+        )
+    except (OSError, ValueError) as e:
+        result.error = str(e)
+        return result
+
+    result.error_count = sum(1 for i in report.issues if i.severity == Severity.ERROR)
+    if output_path is None:
+        result.error = "validation failed"
+        return result
+
+    report_path = report_path_for(output_path)
+    report_path.write_text(report.model_dump_json(indent=2), encoding="utf-8")
+
+    result.ok = True
+    result.output_path = str(output_path)
+    result.report_path = str(report_path)
+    return result
+
+
+def run_batch(
+    entries: Sequence[BatchEntry],
+    *,
+    out_dir: Path,
+    jobs: int = 1,
+    created: datetime | None = None,
+) -> BatchSummary:
+    """
+    Generate every entry in one process (or `jobs` worker processes) and
+    return a combined summary. All files share the same creation timestamp.
+    A failing entry is recorded in the summary and does not stop the batch.
+    """
+    planned = assign_file_sequences(entries)
+    created = ensure_utc(created or datetime.now(UTC))
+
+    if jobs > 1 and len(planned) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as ex:
+            results = list(ex.map(_run_entry, planned, repeat(out_dir), repeat(created)))
+    else:
+        results = [_run_entry(e, out_dir, created) for e in planned]
+
+    succeeded = sum(1 for r in results if r.ok)
+    return BatchSummary(
+        ok=succeeded == len(results),
+        total=len(results),
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        entries=results,
+    )
@@ -0,0 +1,236 @@
+"""
+On-disk cache of rendered transactions, for incremental regeneration.
+
+Each source item (a work, an SPU entry...) is keyed by a stable hash of the
+records its group builds from it (values already stripped and uppercased the
+way rendering sees them, so whitespace or code case changes still hit) plus
+everything else that affects its lines: group type, CWR version, output
+format, the fixed-width layouts (layout_digest()) and RENDER_SCHEMA. The
+cache stores the item's rendered lines and its GRT counts, so an unchanged
+item is written without rendering a single record.
+
+Storage is one SQLite file per cache directory (stdlib, no server, safe to
+delete at any time).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import sqlite3
+from collections.abc import Iterable, Mapping, Sequence
+from itertools import chain
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from cwr_tool import __version__
+from cwr_tool.generation.control_records import GRHRecord
+from cwr_tool.generation.group_builder import GroupSpec, _get_objects, iter_groups, write_group
+from cwr_tool.generation.records import CRLF, write_records, write_transaction_records
+from cwr_tool.generation.totals import FileTotals, GroupTotals
+from cwr_tool.generation.transaction import Transaction
+from cwr_tool.reporting.models import CacheStats
+from cwr_tool.sink import TextSink
+from cwr_tool.spec.registry import VersionSpec
+
+CACHE_FILENAME = "render-cache.sqlite3"
+
+# Bump with any change to how records render (record classes, transliteration,
+# KEY=VALUE lines) so existing caches stop matching; layout changes are
+# covered by layout_digest().
+RENDER_SCHEMA = 1
+
+# Rendered items held in memory before they are inserted (see RenderCache)
+PUT_BATCH = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS renders (
+    key TEXT PRIMARY KEY,
+    txcount INTEGER NOT NULL,
+    reccount INTEGER NOT NULL,
+    lines TEXT NOT NULL
+)
+"""
+
+
+def canonical_json(item: Mapping[str, Any]) -> str:
+    """Normalized JSON of a source item: equal content gives equal text, whatever the key order."""
+    return json.dumps(item, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def layout_digest(spec: VersionSpec | None) -> str:
+    """Hash of the fixed-width layouts lines are rendered with ("" for KEY=VALUE)."""
+    if spec is None:
+        return ""
+    fields = sorted((name, layout.fields) for name, layout in spec.layouts.items())
+    return hashlib.sha256(repr(fields).encode("utf-8")).hexdigest()
+
+
+def transaction_key(
+    transaction: Transaction, *, group_type: str, version: str, output_format: str, layouts: str
+) -> str:
+    """Stable hash of one built transaction in a given rendering context."""
+    # records are frozen dataclasses of normalized str/int fields: repr() is stable
+    body = repr(transaction.records)
+    prefix = f"{__version__}|{RENDER_SCHEMA}|{layouts}|{group_type}|{version}|{output_format}|"
+    return hashlib.sha256((prefix + body).encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    """
+    SQLite-backed map of item key -> (rendered lines, GroupTotals).
+
+    Rows are inserted as they are put, PUT_BATCH at a time, into one open
+    SQLite transaction that commit() commits at the end of the run (as does
+    leaving the context manager without an exception). close() without a
+    commit() rolls it back, so a failed run leaves the cache as it was.
+    Memory stays bounded by PUT_BATCH rendered items. Hit/miss counts are
+    kept in `stats`.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.path = cache_dir / CACHE_FILENAME
+        self.stats = CacheStats()
+        self._db = sqlite3.connect(self.path)
+        self._db.execute(_SCHEMA)
+        self._pending: list[tuple[str, int, int, str]] = []
+        self._inserted = 0
+
+    def get(self, key: str) -> tuple[str, GroupTotals] | None:
+        row = self._db.execute(
+            "SELECT lines, txcount, reccount FROM renders WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return row[0], GroupTotals(txcount=row[1], reccount=row[2])
+
+    def put(self, key: str, text: str, totals: GroupTotals) -> None:
+        self._pending.append((key, totals.txcount, totals.reccount, text))
+        if len(self._pending) >= PUT_BATCH:
+            self._insert()
+
+    def _insert(self) -> None:
+        # sqlite3 opens a transaction before the first INSERT; it stays open until commit()
+        self._db.executemany("INSERT OR REPLACE INTO renders VALUES (?, ?, ?, ?)", self._pending)
+        self._inserted += len(self._pending)
+        self._pending.clear()
+
+    def commit(self) -> None:
+        if self._pending:
+            self._insert()
+        self._db.commit()
+        self.stats.stored += self._inserted
+        self._inserted = 0
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> RenderCache:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.commit()
+        self.close()
+
+
+def _with_tx_seq(text: str, spec: VersionSpec | None, tx_seq: int) -> str:
+    """
+    Re-number cached fixed-width lines (stored with transaction sequence 0).
+
+    KEY=VALUE lines carry no sequence numbers and are returned unchanged.
+    """
+    if spec is None or tx_seq == 0:
+        return text
+    out: list[str] = []
+    for line in text.split(CRLF)[:-1]:
+        start, end = spec.layout(line[:3]).span("tx_seq")
+        out.append(f"{line[:start]}{tx_seq:0{end - start}d}{line[end:]}{CRLF}")
+    return "".join(out)
+
+
+def _render_transaction(
+    transaction: Transaction, spec: VersionSpec | None
+) -> tuple[str, GroupTotals]:
+    buf = io.StringIO()
+    write_transaction_records(transaction.records, buf, spec)
+    totals = GroupTotals()
+    totals.add_transaction(transaction)
+    return buf.getvalue(), totals
+
+
+def write_groups_cached(
+    payload: Mapping[str, Any],
+    specs: Sequence[GroupSpec],
+    out: TextSink,
+    cache: RenderCache,
+    *,
+    version: str,
+    output_format: str = "kv",
+    spec: VersionSpec | None = None,
+) -> FileTotals:
+    """
+    Cached counterpart of the group loop in write_minimal_wrk_file().
+
+    For chunkable groups (see GroupSpec.build_transaction) each item's
+    transaction is built and looked up by transaction_key(); hits are written
+    from the cache, misses are rendered and stored. Other groups are rendered
+    as usual. Output is identical to an uncached run.
+    """
+    totals = FileTotals()
+    layouts = layout_digest(spec)
+
+    for group_spec in specs:
+        group_number = totals.groups + 1
+        build = group_spec.build_transaction
+
+        if group_spec.source_key is None or build is None:
+            for g in iter_groups(payload, [group_spec]):
+                totals.add_group(
+                    write_group(
+                        out,
+                        group_number=group_number,
+                        group_type=g.group_type,
+                        transactions=g.transactions,
+                        spec=spec,
+                    )
+                )
+            continue
+
+        items: Iterable[dict[str, Any]] = _get_objects(payload, group_spec.source_key)
+        first = next(iter(items), None)
+        if first is None:
+            continue
+
+        write_records([GRHRecord(group=group_number, type_=group_spec.group_type)], out, spec)
+        group_totals = GroupTotals()
+        for tx_seq, item in enumerate(chain((first,), items)):
+            transaction = build(item)
+            key = transaction_key(
+                transaction,
+                group_type=group_spec.group_type,
+                version=version,
+                output_format=output_format,
+                layouts=layouts,
+            )
+            hit = cache.get(key)
+            if hit is None:
+                hit = _render_transaction(transaction, spec)
+                cache.put(key, *hit)
+            text, item_totals = hit
+            out.write(_with_tx_seq(text, spec, tx_seq))
+            group_totals.merge(item_totals)
+        write_records([group_totals.trailer(group_number)], out, spec)
+        totals.add_group(group_totals)
+
+    return totals
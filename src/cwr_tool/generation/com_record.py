@@ -2,11 +2,22 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from cwr_tool.format.charset import ascii_line
+from cwr_tool.generation.memo import seq_line
+from cwr_tool.spec.registry import VersionSpec
+
 
 def _req_or_blank(value: str) -> str:
     return value.strip()
 
 
+def com_line(spec: VersionSpec | None, tx_seq: int, rec_seq: int, comment: str) -> str:
+    """COM line from an already-stripped comment (spec None: KEY=VALUE format)."""
+    if spec is None:
+        return ascii_line(f"COM COMMENT={comment}") if comment else "COM"
+    return seq_line(spec.layout("COM"), tx_seq, rec_seq, comment)
+
+
 @dataclass(frozen=True, slots=True)
 class COMRecord:
     """Non-transaction comment record (counts as record line, not a transaction)."""
@@ -18,5 +29,7 @@ class COMRecord:
         return 0, 1
 
     def render(self) -> str:
-        msg = _req_or_blank(self.comment)
-        return f"COM COMMENT={msg}" if msg else "COM"
+        return com_line(None, 0, 0, _req_or_blank(self.comment))
+
+    def render_fixedwidth(self, spec: VersionSpec, tx_seq: int = 0, rec_seq: int = 0) -> str:
+        return com_line(spec, tx_seq, rec_seq, _req_or_blank(self.comment))
@@ -3,7 +3,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 
-from cwr_tool.spec.registry import SpecRegistry
+from cwr_tool import __version__
+from cwr_tool.format.charset import ascii_line
+from cwr_tool.spec.registry import VersionSpec
 
 
 def _fmt_dt(dt: datetime) -> str:
@@ -22,14 +24,22 @@ class HDRRecord:
         receiver = self.receiver.strip().upper()
         ver = self.version.strip()
         dt = _fmt_dt(self.created)
-        return f"HDR SENDER={sender} RECEIVER={receiver} VER={ver} DT={dt}"
+        return ascii_line(f"HDR SENDER={sender} RECEIVER={receiver} VER={ver} DT={dt}")
 
-    def render_fixedwidth(self, registry: SpecRegistry) -> str:
+    def render_fixedwidth(self, spec: VersionSpec, tx_seq: int = 0, rec_seq: int = 0) -> str:
+        # The fixed-width HDR has no receiver field; receiver lives in the filename.
         sender = self.sender.strip().upper()
-        receiver = self.receiver.strip().upper()
-        ver = self.version.strip()
         dt = _fmt_dt(self.created)
-        return registry.render_hdr_fixedwidth(sender=sender, receiver=receiver, version=ver, dt=dt)
+        return spec.layout("HDR").render(
+            {
+                "sender_id": sender,
+                "sender_name": sender,
+                "creation_date": dt[:8],
+                "creation_time": dt[8:],
+                "transmission_date": dt[:8],
+                "software_version": __version__,
+            }
+        )
 
 
 @dataclass(frozen=True, slots=True)
@@ -38,7 +48,10 @@ class GRHRecord:
     type_: str = "WRK"
 
     def render(self) -> str:
-        return f"GRH GROUP={self.group:05d} TYPE={self.type_}"
+        return ascii_line(f"GRH GROUP={self.group:05d} TYPE={self.type_}")
+
+    def render_fixedwidth(self, spec: VersionSpec, tx_seq: int = 0, rec_seq: int = 0) -> str:
+        return spec.layout("GRH").render_row([self.type_, self.group])
 
 
 @dataclass(frozen=True, slots=True)
@@ -50,6 +63,9 @@ class GRTRecord:
     def render(self) -> str:
         return f"GRT GROUP={self.group:05d} TXCOUNT={self.txcount:08d} RECCOUNT={self.reccount:08d}"
 
+    def render_fixedwidth(self, spec: VersionSpec, tx_seq: int = 0, rec_seq: int = 0) -> str:
+        return spec.layout("GRT").render_row([self.group, self.txcount, self.reccount])
+
 
 @dataclass(frozen=True, slots=True)
 class TRLRecord:
@@ -61,3 +77,6 @@ class TRLRecord:
         return (
             f"TRL GROUPS={self.groups:05d} TXTOTAL={self.txtotal:08d} RECTOTAL={self.rectotal:08d}"
         )
+
+    def render_fixedwidth(self, spec: VersionSpec, tx_seq: int = 0, rec_seq: int = 0) -> str:
+        return spec.layout("TRL").render_row([self.groups, self.txtotal, self.rectotal])
@@ -0,0 +1,80 @@
+"""
+Delta deliveries: compare two payloads and keep only the works to send.
+
+Works are matched by submitter_work_number through one hash map of the
+previous payload (key -> content digest), so classifying n works is O(n) and
+the previous catalogue is never held in memory as objects.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from cwr_tool.generation.cache import canonical_json
+from cwr_tool.generation.group_builder import _get_objects
+
+
+def _swk(work: Mapping[str, Any]) -> str | None:
+    swk = work.get("submitter_work_number")
+    if isinstance(swk, str) and swk.strip():
+        return swk.strip()
+    return None
+
+
+def _digest(work: Mapping[str, Any]) -> bytes:
+    return hashlib.blake2b(canonical_json(work).encode("utf-8"), digest_size=16).digest()
+
+
+@dataclass(slots=True)
+class WorkDelta:
+    """
+    Works of the new payload split by what the receiver needs.
+
+    - new: not in the previous payload (sent as NWR)
+    - changed: in both, with different content (sent as REV)
+    - removed: submitter work numbers only in the previous payload
+    """
+
+    new: list[dict[str, Any]] = field(default_factory=list)
+    changed: list[dict[str, Any]] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    def payload(self) -> dict[str, Any]:
+        """The works to send, keyed for the delta group specs (see writer)."""
+        return {"works": self.new, "revisions": self.changed}
+
+
+def diff_works(old: Mapping[str, Any], new: Mapping[str, Any]) -> WorkDelta:
+    """
+    Classify the works of `new` against `old` by submitter_work_number.
+
+    Both payloads may stream their works arrays (each is traversed once).
+    Raises ValueError if `old` repeats a submitter_work_number, since the
+    match would then be ambiguous; `new` is expected to be validated already.
+    """
+    previous: dict[str, bytes] = {}
+    for w in _get_objects(old, "works"):
+        swk = _swk(w)
+        if swk is None:
+            continue
+        if swk in previous:
+            raise ValueError(f"Previous payload repeats submitter_work_number {swk!r}")
+        previous[swk] = _digest(w)
+
+    delta = WorkDelta()
+    for w in _get_objects(new, "works"):
+        swk = _swk(w)
+        digest = previous.pop(swk, None) if swk is not None else None
+        if digest is None:
+            delta.new.append(w)
+        elif digest != _digest(w):
+            delta.changed.append(w)
+        else:
+            delta.unchanged += 1
+
+    delta.removed = list(previous)
+    return delta
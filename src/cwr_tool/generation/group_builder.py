@@ -1,34 +1,43 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
-from typing import Any
-
-from cwr_tool.generation.control_records import GRHRecord, GRTRecord
-from cwr_tool.generation.records import RenderableRecord
-from cwr_tool.generation.transaction import Transaction, sum_counts
-
-
-def _get_list(payload: dict[str, Any], key: str) -> list[Any]:
+from itertools import chain
+from typing import Any, cast
+
+from cwr_tool.generation.control_records import GRHRecord
+from cwr_tool.generation.records import (
+    RenderableRecord,
+    TextSink,
+    write_records,
+    write_transaction_records,
+)
+from cwr_tool.generation.totals import GroupTotals
+from cwr_tool.generation.transaction import Transaction
+from cwr_tool.ingest.json_stream import is_array
+from cwr_tool.spec.registry import VersionSpec
+
+
+def _get_list(payload: Mapping[str, Any], key: str) -> Iterable[Any]:
+    """Return payload[key] as an array: a loaded list or a StreamedArray."""
     value = payload.get(key)
     if value is None:
         return []
-    if not isinstance(value, list):
+    if not is_array(value):
         raise ValueError(f"'{key}' must be a list")
-    return value
+    return cast(Iterable[Any], value)
 
 
-def _get_objects(payload: dict[str, Any], key: str) -> list[dict[str, Any]]:
-    raw = _get_list(payload, key)
-    out: list[dict[str, Any]] = []
-    for item in raw:
+def _get_objects(payload: Mapping[str, Any], key: str) -> Iterator[dict[str, Any]]:
+    """Yield the objects of payload[key] one by one (works for streamed arrays too)."""
+    for item in _get_list(payload, key):
         if not isinstance(item, dict):
             raise ValueError(f"Each item in '{key}' must be an object")
-        out.append(item)
-    return out
+        yield item
 
 
-BuildTransactions = Callable[[dict[str, Any]], list[Transaction]]
+BuildTransactions = Callable[[Mapping[str, Any]], Iterable[Transaction]]
+BuildTransaction = Callable[[dict[str, Any]], Transaction]
 
 
 @dataclass(frozen=True, slots=True)
@@ -37,44 +46,97 @@ class GroupSpec:
     Declarative group spec.
 
     - group_type: e.g. WRK, SPU
-    - build_transactions(payload) returns transactions for that group.
+    - build_transactions(payload) returns (or lazily yields) transactions for that group.
       If empty, the group is omitted and group numbers stay compact.
+    - source_key/build_transaction (optional): the same group expressed as one
+      transaction per item of payload[source_key]. Groups that declare it can be
+      rendered in independent chunks (see generation.parallel); build_transaction
+      must then be a module-level function so it can be sent to worker processes.
     """
 
     group_type: str
     build_transactions: BuildTransactions
+    source_key: str | None = None
+    build_transaction: BuildTransaction | None = None
 
 
 @dataclass(frozen=True, slots=True)
 class BuiltGroup:
-    """A group that exists in the final file (has transactions)."""
+    """
+    A group that exists in the final file (has transactions).
+
+    `totals` is accumulated once by build_groups(); groups built by hand may
+    leave it None and it will be computed on demand.
+    """
 
     group_number: int
     group_type: str
     transactions: list[Transaction]
+    totals: GroupTotals | None = None
 
+    def group_totals(self) -> GroupTotals:
+        if self.totals is not None:
+            return self.totals
+        return GroupTotals.of(self.transactions)
 
-def build_groups(payload: dict[str, Any], specs: Sequence[GroupSpec]) -> list[BuiltGroup]:
+
+@dataclass(frozen=True, slots=True)
+class PendingGroup:
     """
-    Build groups in the order of specs, assigning sequential group numbers
-    only to groups that actually have transactions.
+    A group known to exist (it has at least one transaction) whose
+    transactions are still being built lazily.
+    """
+
+    group_number: int
+    group_type: str
+    transactions: Iterator[Transaction]
+
+
+def iter_groups(payload: Mapping[str, Any], specs: Sequence[GroupSpec]) -> Iterator[PendingGroup]:
+    """
+    Lazy counterpart of build_groups().
+
+    Only the first transaction of each group is built up front (to decide
+    whether the group exists); the rest are built as the caller consumes them.
+    Each group's transactions must be consumed before advancing to the next group.
     """
-    built: list[BuiltGroup] = []
     next_group_num = 1
 
     for spec in specs:
-        txs = spec.build_transactions(payload)
-        if not txs:
+        txs = iter(spec.build_transactions(payload))
+        first = next(txs, None)
+        if first is None:
             continue
 
+        yield PendingGroup(
+            group_number=next_group_num,
+            group_type=spec.group_type,
+            transactions=chain((first,), txs),
+        )
+        next_group_num += 1
+
+
+def build_groups(payload: Mapping[str, Any], specs: Sequence[GroupSpec]) -> list[BuiltGroup]:
+    """
+    Build groups in the order of specs, assigning sequential group numbers
+    only to groups that actually have transactions.
+    """
+    built: list[BuiltGroup] = []
+    for g in iter_groups(payload, specs):
+        totals = GroupTotals()
+        txs: list[Transaction] = []
+        for t in g.transactions:
+            totals.add_transaction(t)
+            txs.append(t)
+
         built.append(
             BuiltGroup(
-                group_number=next_group_num,
-                group_type=spec.group_type,
+                group_number=g.group_number,
+                group_type=g.group_type,
                 transactions=txs,
+                totals=totals,
             )
         )
-        next_group_num += 1
 
     return built
 
@@ -84,6 +146,7 @@ def render_group(
     group_number: int,
     group_type: str,
     transactions: list[Transaction],
+    totals: GroupTotals | None = None,
 ) -> tuple[list[RenderableRecord], int, int]:
     """
     Render a group as:
@@ -96,20 +159,55 @@ def render_group(
 
     Note:
       - txcount/reccount are group totals excluding GRH/GRT (CWR convention)
-      - reccount is based on Transaction.counts() (record-driven)
+      - reccount is based on record.counts() (record-driven)
+      - pass `totals` (e.g. BuiltGroup.totals) to skip recounting; otherwise
+        totals are accumulated in the same pass that collects the records
+    """
+    records: list[RenderableRecord] = [GRHRecord(group=group_number, type_=group_type)]
+
+    if totals is None:
+        totals = GroupTotals()
+        for t in transactions:
+            for r in t.records:
+                totals.add_record(r)
+                records.append(r)
+    else:
+        for t in transactions:
+            records.extend(t.records)
+
+    records.append(totals.trailer(group_number))
+    return records, totals.txcount, totals.reccount
+
+
+def write_group(
+    out: TextSink,
+    *,
+    group_number: int,
+    group_type: str,
+    transactions: Iterable[Transaction],
+    spec: VersionSpec | None = None,
+) -> GroupTotals:
+    """
+    Streaming counterpart of render_group(): writes GRH, every transaction's
+    record lines and GRT straight to `out`.
+
+    Counts are accumulated while records are written, so `transactions` may be
+    a lazy iterator and is consumed exactly once. Pass `spec` to write the
+    version's fixed-width layouts instead of KEY=VALUE lines.
+
+    Returns:
+      the group's totals (same convention as render_group())
     """
-    txcount, reccount = sum_counts(transactions)
+    write_records([GRHRecord(group=group_number, type_=group_type)], out, spec)
 
-    body_records: list[RenderableRecord] = []
-    for t in transactions:
-        body_records.extend(t.records)
+    totals = GroupTotals()
+    for tx_seq, t in enumerate(transactions):
+        for r in t.records:
+            totals.add_record(r)
+        write_transaction_records(t.records, out, spec, tx_seq)
 
-    records: list[RenderableRecord] = [
-        GRHRecord(group=group_number, type_=group_type),
-        *body_records,
-        GRTRecord(group=group_number, txcount=txcount, reccount=reccount),
-    ]
-    return records, txcount, reccount
+    write_records([totals.trailer(group_number)], out, spec)
+    return totals
 
 
 def total_physical_line_count(groups: Sequence[BuiltGroup]) -> int:
@@ -117,8 +215,4 @@ def total_physical_line_count(groups: Sequence[BuiltGroup]) -> int:
     Physical lines across groups INCLUDING GRH/GRT per group.
     For each group: GRH(1) + body(reccount) + GRT(1) = 2 + reccount
     """
-    total = 0
-    for g in groups:
-        _tx, rec = sum_counts(g.transactions)
-        total += 2 + rec
-    return total
+    return sum(g.group_totals().physical_lines for g in groups)
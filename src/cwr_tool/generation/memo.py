@@ -0,0 +1,143 @@
+"""
+Bounded in-process memos for values and lines that repeat across a catalogue.
+
+Publisher names, language codes and boilerplate comments repeat across most
+of a catalogue, and each occurrence arrives from the JSON parser as a new str
+object.
+
+- norm_text() / norm_code(): a normalized field value (stripped; stripped
+  and uppercased). Equal inputs give the same str object back, so a table
+  that keeps the values (WorkTable's comments and language codes) holds one
+  copy per distinct value.
+- seq_line(): a fixed-width transaction line (SPU, COM). The line is rendered
+  once per distinct field values and the transaction and record sequence
+  numbers are put into the cached text at the layout's tx_seq/rec_seq spans.
+
+A line hit costs about a third of a render, a miss about twice as much, so
+only fields that mostly repeat go through a memo, and seq_line() stops using
+its memo while the hit rate is low (a catalogue of distinct publishers).
+Titles, ALT titles and submitter work numbers are mostly distinct and are
+not memoized; neither are KEY=VALUE lines, one f-string each. Values that
+are only rendered, not kept (publisher names), are plainly stripped: a
+value hit is no cheaper than strip(), the line memo is where they pay off.
+
+Every memo is a functools.lru_cache: bounded, least-recently-used eviction,
+safe to share between threads (`cwr-tool serve` generates on a thread
+pool). The hit-rate bookkeeping that decides whether seq_line() uses its
+memo is kept per thread, so it needs no lock. Memo counters are per
+process; memo_stats() reads them (worker processes of a parallel render
+keep their own).
+"""
+
+from __future__ import annotations
+
+import threading
+from functools import lru_cache
+
+from cwr_tool.format.fixedwidth import CompiledLayout
+from cwr_tool.reporting.models import MemoStats
+
+VALUE_MEMO_SIZE = 8192
+LINE_MEMO_SIZE = 4096
+
+# Every LINE_WINDOW misses seq_line() looks at its hit rate; below
+# MIN_LINE_HIT_RATE it renders the next BYPASS_LINES lines directly, then
+# tries the memo again.
+LINE_WINDOW = 4096
+MIN_LINE_HIT_RATE = 0.5
+BYPASS_LINES = 16 * LINE_WINDOW
+
+
+@lru_cache(maxsize=VALUE_MEMO_SIZE)
+def norm_text(value: str) -> str:
+    """`value` stripped, as one shared str per distinct input."""
+    return value.strip()
+
+
+@lru_cache(maxsize=VALUE_MEMO_SIZE)
+def norm_code(value: str) -> str:
+    """A code (language, ...) stripped and uppercased, as one shared str per distinct input."""
+    return value.strip().upper()
+
+
+class _LineGate(threading.local):
+    """Whether seq_line() goes through its memo (see LINE_WINDOW), per thread."""
+
+    def __init__(self) -> None:
+        self.bypass = 0  # lines left to render without the memo
+        self.misses = 0  # misses since the last review
+        self.lookups = 0  # lookups since the last review
+
+    def missed(self) -> None:
+        self.misses += 1
+        if self.misses < LINE_WINDOW:
+            return
+        if self.misses > (1 - MIN_LINE_HIT_RATE) * self.lookups:
+            self.bypass = BYPASS_LINES
+        self.misses = 0
+        self.lookups = 0
+
+
+_gate = _LineGate()
+
+
+@lru_cache(maxsize=LINE_MEMO_SIZE)
+def _line_parts(layout: CompiledLayout, values: tuple[object, ...]) -> tuple[str, int, int]:
+    """
+    The line for `values` as a %-template with the sequence numbers left
+    out, and the limits (10**width) of the tx_seq and rec_seq fields.
+    """
+    _gate.missed()
+    line = layout.render_row((0, 0, *values)).replace("%", "%%")
+    tx_start, tx_end = layout.span("tx_seq")
+    rec_start, rec_end = layout.span("rec_seq")
+    tx_width, rec_width = tx_end - tx_start, rec_end - rec_start
+    template = (
+        f"{line[:tx_start]}%0{tx_width}d{line[tx_end:rec_start]}%0{rec_width}d{line[rec_end:]}"
+    )
+    return template, 10**tx_width, 10**rec_width
+
+
+def seq_line(layout: CompiledLayout, tx_seq: int, rec_seq: int, *values: object) -> str:
+    """
+    Same as layout.render_row([tx_seq, rec_seq, *values]) for a layout whose
+    first value fields are tx_seq and rec_seq; `values` must be hashable.
+    """
+    gate = _gate
+    if gate.bypass:
+        gate.bypass -= 1
+        return layout.render_row((tx_seq, rec_seq, *values))
+    gate.lookups += 1
+    template, tx_limit, rec_limit = _line_parts(layout, values)
+    if tx_seq >= tx_limit or rec_seq >= rec_limit:
+        # numeric fields keep their rightmost digits on overflow
+        tx_seq %= tx_limit
+        rec_seq %= rec_limit
+    return template % (tx_seq, rec_seq)
+
+
+_MEMOS = {"values": (norm_text, norm_code), "lines": (_line_parts,)}
+
+
+def memo_stats() -> dict[str, MemoStats]:
+    """Counters of this process's memos so far, per kind ("values", "lines")."""
+    out: dict[str, MemoStats] = {}
+    for kind, memos in _MEMOS.items():
+        stats = MemoStats()
+        for memo in memos:
+            info = memo.cache_info()
+            stats.hits += info.hits
+            stats.misses += info.misses
+            stats.size += info.currsize
+            stats.maxsize += info.maxsize or 0
+        out[kind] = stats
+    return out
+
+
+def clear_memos() -> None:
+    """Drop every memoized value and line and reset the counters."""
+    global _gate
+    for memos in _MEMOS.values():
+        for memo in memos:
+            memo.cache_clear()
+    _gate = _LineGate()
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import ClassVar
+
+from cwr_tool.format.charset import ascii_line
+from cwr_tool.generation.memo import norm_code
+from cwr_tool.spec.registry import VersionSpec
 
 
 def _req(value: str, field: str) -> str:
@@ -10,8 +15,28 @@ def _req(value: str, field: str) -> str:
     return v
 
 
+def nwr_line(
+    spec: VersionSpec | None,
+    tx_seq: int,
+    rec_seq: int,
+    title: str,
+    swk: str,
+    lang: str,
+    record_type: str = "NWR",
+) -> str:
+    """
+    NWR line from already-normalized values (spec None: KEY=VALUE format).
+    record_type "REV" gives the REV line: same fields, same layout.
+    """
+    if spec is None:
+        return ascii_line(f"{record_type} TITLE={title} SWK={swk} LANG={lang}")
+    return spec.layout(record_type).render_row([tx_seq, rec_seq, title, lang, swk])
+
+
 @dataclass(frozen=True, slots=True)
 class NWRRecord:
+    record_type: ClassVar[str] = "NWR"
+
     title: str
     submitter_work_number: str
     language_code: str = "EN"
@@ -19,8 +44,14 @@ class NWRRecord:
     def counts(self) -> tuple[int, int]:
         return 1, 1
 
-    def render(self) -> str:
+    def _normalized(self) -> tuple[str, str, str]:
         title = _req(self.title, "title")
         swk = _req(self.submitter_work_number, "submitter_work_number")
-        lang = (self.language_code or "EN").strip().upper()
-        return f"NWR TITLE={title} SWK={swk} LANG={lang}"
+        lang = norm_code(self.language_code or "EN")
+        return title, swk, lang
+
+    def render(self) -> str:
+        return nwr_line(None, 0, 0, *self._normalized(), self.record_type)
+
+    def render_fixedwidth(self, spec: VersionSpec, tx_seq: int = 0, rec_seq: int = 0) -> str:
+        return nwr_line(spec, tx_seq, rec_seq, *self._normalized(), self.record_type)
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import io
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Executor, Future
+from itertools import batched, chain
+from typing import Any
+
+from cwr_tool.generation.control_records import GRHRecord
+from cwr_tool.generation.group_builder import (
+    BuildTransaction,
+    GroupSpec,
+    _get_objects,
+    iter_groups,
+    write_group,
+)
+from cwr_tool.generation.records import write_records, write_transaction_records
+from cwr_tool.generation.totals import FileTotals, GroupTotals
+from cwr_tool.sink import TextSink
+from cwr_tool.spec.registry import VersionSpec
+
+DEFAULT_CHUNK_SIZE = 2000
+
+
+def render_chunk(
+    build_transaction: BuildTransaction,
+    items: Sequence[dict[str, Any]],
+    spec: VersionSpec | None = None,
+    tx_start: int = 0,
+) -> tuple[str, GroupTotals]:
+    """
+    Build and render one chunk of a group's transactions.
+
+    Runs inside worker processes. Returns the chunk's CRLF-terminated text plus
+    its partial GRT totals, to be merged in chunk order by the parent.
+    `tx_start` is the group-level sequence number of the chunk's first
+    transaction (fixed-width output only).
+    """
+    buf = io.StringIO()
+    totals = GroupTotals()
+    for tx_seq, item in enumerate(items, tx_start):
+        t = build_transaction(item)
+        totals.add_transaction(t)
+        write_transaction_records(t.records, buf, spec, tx_seq)
+    return buf.getvalue(), totals
+
+
+def iter_rendered_chunks(
+    executor: Executor,
+    build_transaction: BuildTransaction,
+    items: Iterable[dict[str, Any]],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_pending: int = 8,
+    spec: VersionSpec | None = None,
+) -> Iterator[tuple[str, GroupTotals]]:
+    """
+    Render `items` in chunks on `executor`, yielding results in input order.
+
+    At most `max_pending` chunks are in flight at once, so memory stays bounded
+    even when `items` is a streamed array.
+    """
+    pending: deque[Future[tuple[str, GroupTotals]]] = deque()
+    for n, chunk in enumerate(batched(items, chunk_size)):
+        pending.append(
+            executor.submit(render_chunk, build_transaction, chunk, spec, n * chunk_size)
+        )
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def write_groups_parallel(
+    payload: Mapping[str, Any],
+    specs: Sequence[GroupSpec],
+    out: TextSink,
+    executor: Executor,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_pending: int = 8,
+    spec: VersionSpec | None = None,
+) -> FileTotals:
+    """
+    Parallel counterpart of the group loop in write_minimal_wrk_file().
+
+    Chunkable groups (see GroupSpec.build_transaction) are rendered on
+    `executor` and reassembled in order; GRT/TRL totals are merged from the
+    per-chunk partials. Other groups fall back to serial rendering. Output is
+    byte-identical to the serial writer.
+    """
+    totals = FileTotals()
+
+    for group_spec in specs:
+        group_number = totals.groups + 1
+
+        if group_spec.source_key is None or group_spec.build_transaction is None:
+            for g in iter_groups(payload, [group_spec]):
+                totals.add_group(
+                    write_group(
+                        out,
+                        group_number=group_number,
+                        group_type=g.group_type,
+                        transactions=g.transactions,
+                        spec=spec,
+                    )
+                )
+            continue
+
+        chunks = iter_rendered_chunks(
+            executor,
+            group_spec.build_transaction,
+            _get_objects(payload, group_spec.source_key),
+            chunk_size=chunk_size,
+            max_pending=max_pending,
+            spec=spec,
+        )
+        first = next(chunks, None)
+        if first is None:
+            continue
+
+        write_records([GRHRecord(group=group_number, type_=group_spec.group_type)], out, spec)
+        group_totals = GroupTotals()
+        for text, part in chain((first,), chunks):
+            out.write(text)
+            group_totals.merge(part)
+        write_records([group_totals.trailer(group_number)], out, spec)
+        totals.add_group(group_totals)
+
+    return totals
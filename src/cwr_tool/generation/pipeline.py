@@ -1,14 +1,40 @@
 from __future__ import annotations
 
+import io
+import shutil
+import tempfile
+import time
+from collections.abc import Callable, Mapping, Sequence
 from datetime import UTC, datetime
-from typing import Any
+from pathlib import Path
+from typing import Any, TextIO
 
-from cwr_tool.generation.writer import render_minimal_wrk_file
-from cwr_tool.reporting.models import ValidationReport
-from cwr_tool.validation.engine import validate_minimal
+from cwr_tool.generation.cache import RenderCache
+from cwr_tool.generation.control_records import HDRRecord
+from cwr_tool.generation.delta import diff_works
+from cwr_tool.generation.records import write_records
+from cwr_tool.generation.versions import changed_record_types, write_lines_as
+from cwr_tool.generation.work_table import WorkTable, WorkTableCollector
+from cwr_tool.generation.writer import (
+    layout_spec,
+    write_delta_wrk_file,
+    write_minimal_wrk_body,
+)
+from cwr_tool.reporting.metrics import NULL_METRICS, Metrics
+from cwr_tool.reporting.models import (
+    DeltaStats,
+    GenerationReport,
+    IssueLimits,
+    StageMetrics,
+    ValidationReport,
+)
+from cwr_tool.sink import TextSink
+from cwr_tool.spec.registry import SpecRegistry, VersionSpec
+from cwr_tool.validation.engine import ValidationMode, validate_minimal
+from cwr_tool.validation.rules.base import AnyRule, RuleContext
 
 
-def _ensure_utc(dt: datetime) -> datetime:
+def ensure_utc(dt: datetime) -> datetime:
     """Return a timezone-aware datetime in UTC.
 
     - If `dt` is naive, assume it is already UTC.
@@ -36,7 +62,7 @@ def suggest_filename(
     - `sender` and `receiver` are normalized to uppercase.
     - `file_sequence` is formatted as a 4-digit, zero-padded number.
     """
-    created = _ensure_utc(created)
+    created = ensure_utc(created)
 
     sender = sender.strip().upper()
     receiver = receiver.strip().upper()
@@ -57,31 +83,458 @@ def suggest_filename(
     return f"CW{yy}{nnnn}{sender}_{receiver}.V{safe_ver}"
 
 
+class _WorkCounter:
+    """Records how many works the validation pass saw (for metrics)."""
+
+    code = "WORK.COUNT"
+
+    def __init__(self) -> None:
+        self.works = 0
+
+    def finish(self, report: ValidationReport, ctx: RuleContext, work_count: int) -> None:
+        self.works = work_count
+
+
 def generate_cwr_file(
-    payload: dict[str, Any],
+    payload: Mapping[str, Any],
     cwr_version: str,
     sender: str,
     receiver: str,
     file_sequence: int,
     created: datetime | None = None,
+    out: TextSink | None = None,
+    workers: int = 1,
+    output_format: str = "kv",
+    cache_dir: Path | None = None,
+    validation_mode: ValidationMode | str = ValidationMode.MINIMAL,
+    issue_limits: IssueLimits | None = None,
+    metrics: Metrics = NULL_METRICS,
 ) -> tuple[ValidationReport, str, str]:
-    """Validate payload, render minimal WRK file, and suggest output filename."""
-    report = validate_minimal(payload, version=cwr_version)
+    """Validate payload, render minimal WRK file, and suggest output filename.
+
+    If `out` is given, the file is streamed into it record by record and the
+    returned text is empty. Nothing is written to `out` when validation fails.
+    `workers` > 1 validates and renders on process pools (same report and output).
+    `output_format` is "kv" (KEY=VALUE lines) or "fixedwidth".
+    With `cache_dir`, rendered works are cached there and reused by later runs;
+    the returned report is then a GenerationReport with hit/miss stats.
+    `validation_mode` selects how thoroughly the payload is checked first
+    (see validation.engine.ValidationMode), and `issue_limits` how many of
+    its issues the report keeps (see reporting.issues.IssueLimits).
+    With an enabled `metrics` (see reporting.metrics), the report is a
+    GenerationReport whose `metrics` section breaks the run down into
+    validate / build_transactions / render / write.
+    """
+    report, works = _validate(
+        payload, cwr_version, workers, cache_dir, validation_mode, issue_limits, metrics
+    )
     if not report.ok:
         return report, "", ""
 
     if created is None:
         created = datetime.now(UTC)
 
-    created = _ensure_utc(created)
+    created = ensure_utc(created)
+
+    buf = io.StringIO()
+    sink = metrics.sink("write", buf if out is None else out)
+    write_records(
+        [HDRRecord(sender=sender, receiver=receiver, version=cwr_version, created=created)],
+        sink,
+        layout_spec(output_format, cwr_version),
+    )
+    report, _lines = _render_body(
+        payload, sink, report, works, cwr_version, workers, output_format, cache_dir, metrics
+    )
+    cwr_text = buf.getvalue()
 
-    cwr_text = render_minimal_wrk_file(
-        payload=payload,
+    filename = suggest_filename(
+        cwr_version=cwr_version,
         sender=sender,
         receiver=receiver,
+        file_sequence=file_sequence,
+        created=created,
+    )
+
+    return report, cwr_text, filename
+
+
+def _validate(
+    payload: Mapping[str, Any],
+    cwr_version: str,
+    workers: int,
+    cache_dir: Path | None,
+    validation_mode: ValidationMode | str,
+    issue_limits: IssueLimits | None,
+    metrics: Metrics,
+) -> tuple[ValidationReport, WorkTable | None]:
+    """The validation pass of generate_cwr_file(), plus the WorkTable to render from."""
+    # Normalize in-memory works into a WorkTable during validation and render
+    # from it. Streamed works are not collected (that would give up flat
+    # memory), nor are works for paths that need per-item dicts (pool, cache).
+    use_table = workers <= 1 and cache_dir is None and isinstance(payload.get("works"), list)
+    collector = WorkTableCollector(WorkTable()) if use_table else None
+    extra_rules: list[AnyRule] = [] if collector is None else [collector]
+    counter = _WorkCounter()
+    if metrics.enabled:
+        extra_rules.append(counter)
+    with metrics.stage("validate") as st:
+        report = validate_minimal(
+            payload,
+            version=cwr_version,
+            extra_rules=extra_rules,
+            mode=validation_mode,
+            workers=workers,
+            issue_limits=issue_limits,
+        )
+        st.records += counter.works
+    works = None if collector is None or collector.failed else collector.table
+    return report, works
+
+
+def _render_body(
+    payload: Mapping[str, Any],
+    sink: TextSink,
+    report: ValidationReport,
+    works: WorkTable | None,
+    cwr_version: str,
+    workers: int,
+    output_format: str,
+    cache_dir: Path | None,
+    metrics: Metrics,
+) -> tuple[ValidationReport, int]:
+    """
+    Write the file body (groups + TRL) into `sink`, which is expected to be
+    metrics' "write" sink.
+
+    Returns the report to hand back (`report` itself, or a GenerationReport
+    once a cache or metrics are involved) and the file's line count, HDR
+    included.
+    """
+    cache = None if cache_dir is None else RenderCache(cache_dir)
+    try:
+        with metrics.stage("render", exclude=("build_transactions", "write")) as st:
+            lines = write_minimal_wrk_body(
+                payload=payload,
+                out=sink,
+                cwr_version=cwr_version,
+                workers=workers,
+                output_format=output_format,
+                cache=cache,
+                works=works,
+                metrics=metrics,
+            )
+            st.records += lines
+        metrics.count("write", records=lines)
+        if cache is not None:
+            cache.commit()
+        if cache is not None or metrics.enabled:
+            report = GenerationReport(
+                ok=report.ok,
+                version=report.version,
+                issues=report.issues,
+                cache=None if cache is None else cache.stats,
+                metrics=metrics.result() if metrics.enabled else None,
+            )
+    finally:
+        if cache is not None:
+            cache.close()
+    return report, lines
+
+
+def generate_cwr_fanout(
+    payload: Mapping[str, Any],
+    cwr_version: str,
+    sender: str,
+    receivers: Sequence[str],
+    file_sequence: int,
+    out_dir: Path | None = None,
+    created: datetime | None = None,
+    workers: int = 1,
+    output_format: str = "kv",
+    cache_dir: Path | None = None,
+    validation_mode: ValidationMode | str = ValidationMode.MINIMAL,
+    issue_limits: IssueLimits | None = None,
+    metrics: Metrics = NULL_METRICS,
+) -> tuple[ValidationReport, dict[str, Path]]:
+    """Write the same catalogue to several receivers, validating and rendering once.
+
+    The files only differ in their HDR line (and name), so the body is
+    rendered once into a temporary file in `out_dir` (default: current
+    directory) and copied under each receiver's HDR into its suggested
+    filename, written atomically as in generate_cwr_to_path(). Every file
+    gets the same `file_sequence` and creation time. Files are written in
+    `receivers` order; if one fails, the ones before it stay in place.
+
+    With metrics, the copies are timed under "fan_out" (records: lines written
+    across all files).
+
+    Returns:
+      (report, {receiver: written path}); the dict is empty if validation failed.
+    """
+    keys = [r.strip().upper() for r in receivers]
+    if not keys:
+        raise ValueError("at least one receiver is required")
+    if len(set(keys)) != len(keys):
+        raise ValueError(f"duplicate receivers: {', '.join(receivers)}")
+
+    created = ensure_utc(created or datetime.now(UTC))
+    out_dir = out_dir or Path.cwd()
+    spec = layout_spec(output_format, cwr_version)
+
+    report, works = _validate(
+        payload, cwr_version, workers, cache_dir, validation_mode, issue_limits, metrics
+    )
+    if not report.ok:
+        return report, {}
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written: dict[str, Path] = {}
+    # newline="" keeps our CRLF terminators byte-exact on every platform
+    with tempfile.TemporaryFile(
+        "w+", encoding="ascii", errors="strict", newline="", dir=out_dir
+    ) as body:
+        sink = metrics.sink("write", body)
+        report, lines = _render_body(
+            payload, sink, report, works, cwr_version, workers, output_format, cache_dir, metrics
+        )
+
+        with metrics.stage("fan_out") as st:
+            for receiver in receivers:
+                hdr = HDRRecord(
+                    sender=sender, receiver=receiver, version=cwr_version, created=created
+                )
+
+                def write(fh: TextSink, hdr: HDRRecord = hdr) -> ValidationReport:
+                    write_records([hdr], fh, spec)
+                    body.seek(0)
+                    shutil.copyfileobj(body, fh, _COPY_CHUNK)
+                    return report
+
+                name = suggest_filename(cwr_version, sender, receiver, file_sequence, created)
+                written[receiver] = out_dir / name
+                _write_atomically(written[receiver], write)
+                st.records += lines
+
+    if isinstance(report, GenerationReport) and report.metrics is not None:
+        report.metrics = metrics.result()
+    return report, written
+
+
+# Characters per read/write when copying a rendered body (see generate_cwr_fanout)
+_COPY_CHUNK = 1 << 20
+
+
+def generate_cwr_versions(
+    payload: Mapping[str, Any],
+    cwr_versions: Sequence[str],
+    sender: str,
+    receiver: str,
+    file_sequence: int,
+    out_dir: Path | None = None,
+    created: datetime | None = None,
+    output_format: str = "kv",
+    validation_mode: ValidationMode | str = ValidationMode.MINIMAL,
+    issue_limits: IssueLimits | None = None,
+    metrics: Metrics = NULL_METRICS,
+) -> tuple[ValidationReport, dict[str, Path]]:
+    """Write the same catalogue in several CWR versions from one pass over the payload.
+
+    The payload is validated and normalized once, and the body is rendered
+    once, for the first version. Every version's file (suggested filename in
+    `out_dir`, written atomically) is then its own HDR plus that body: copied
+    as is, except for the lines whose record layout differs between the two
+    versions, which are re-rendered (see generation.versions).
+
+    The returned GenerationReport's `versions` section has the time, lines and
+    bytes per version; the first version's time includes rendering the body.
+
+    Raises ValueError for an empty, repeated or unsupported version.
+
+    Returns:
+      (report, {version: written path}); the dict is empty if validation failed.
+    """
+    if not cwr_versions:
+        raise ValueError("at least one CWR version is required")
+    if len(set(cwr_versions)) != len(cwr_versions):
+        raise ValueError(f"duplicate CWR versions: {', '.join(cwr_versions)}")
+    specs = {v: layout_spec(output_format, v) for v in cwr_versions}
+    for v in cwr_versions:
+        SpecRegistry.get(v)
+
+    created = ensure_utc(created or datetime.now(UTC))
+    out_dir = out_dir or Path.cwd()
+    source = cwr_versions[0]
+
+    validation, works = _validate(payload, source, 1, None, validation_mode, issue_limits, metrics)
+    if not validation.ok:
+        return validation, {}
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written: dict[str, Path] = {}
+    stats: dict[str, StageMetrics] = {}
+    with tempfile.TemporaryFile(
+        "w+", encoding="ascii", errors="strict", newline="", dir=out_dir
+    ) as body:
+        t0 = time.perf_counter()
+        sink = metrics.sink("write", body)
+        report, lines = _render_body(
+            payload, sink, validation, works, source, 1, output_format, None, metrics
+        )
+        render_seconds = time.perf_counter() - t0
+
+        for version in cwr_versions:
+            t0 = time.perf_counter()
+            hdr = HDRRecord(sender=sender, receiver=receiver, version=version, created=created)
+
+            def write(
+                fh: TextSink, hdr: HDRRecord = hdr, version: str = version
+            ) -> ValidationReport:
+                write_records([hdr], fh, specs[version])
+                body.seek(0)
+                _write_body_as(body, fh, specs[source], specs[version])
+                return report
+
+            name = suggest_filename(version, sender, receiver, file_sequence, created)
+            written[version] = out_dir / name
+            _write_atomically(written[version], write)
+            stats[version] = StageMetrics(
+                seconds=time.perf_counter() - t0,
+                records=lines,
+                bytes=written[version].stat().st_size,
+            )
+        stats[source].seconds += render_seconds
+
+    return (
+        GenerationReport(
+            ok=report.ok,
+            version=report.version,
+            issues=report.issues,
+            metrics=metrics.result() if metrics.enabled else None,
+            versions=stats,
+        ),
+        written,
+    )
+
+
+def _write_body_as(
+    body: TextIO, out: TextSink, source: VersionSpec | None, target: VersionSpec | None
+) -> None:
+    """Copy a body rendered with `source` into `out` as `target` renders it."""
+    changed = changed_record_types(source, target)
+    if source is None or target is None or not changed:
+        shutil.copyfileobj(body, out, _COPY_CHUNK)
+    else:
+        write_lines_as(body, out, source, target, changed)
+
+
+def generate_cwr_to_path(
+    payload: Mapping[str, Any],
+    cwr_version: str,
+    sender: str,
+    receiver: str,
+    file_sequence: int,
+    output_path: Path | None = None,
+    out_dir: Path | None = None,
+    created: datetime | None = None,
+    workers: int = 1,
+    output_format: str = "kv",
+    cache_dir: Path | None = None,
+    validation_mode: ValidationMode | str = ValidationMode.MINIMAL,
+    issue_limits: IssueLimits | None = None,
+    metrics: Metrics = NULL_METRICS,
+) -> tuple[ValidationReport, Path | None, str]:
+    """Validate payload and stream the CWR file straight to disk.
+
+    - If `output_path` is omitted, the suggested filename is used inside
+      `out_dir` (default: current directory).
+    - The file is written to a `.part` sibling and renamed into place only
+      once complete, so a failed run never leaves a truncated `.Vxx` behind.
+
+    Returns:
+      (report, written_path, suggested_filename); written_path is None if
+      validation failed.
+    """
+    created = ensure_utc(created or datetime.now(UTC))
+
+    filename = suggest_filename(
         cwr_version=cwr_version,
-        now=created,
+        sender=sender,
+        receiver=receiver,
+        file_sequence=file_sequence,
+        created=created,
     )
+    if output_path is None:
+        output_path = (out_dir or Path.cwd()) / filename
+
+    def write(fh: TextSink) -> ValidationReport:
+        report, _text, _name = generate_cwr_file(
+            payload=payload,
+            cwr_version=cwr_version,
+            sender=sender,
+            receiver=receiver,
+            file_sequence=file_sequence,
+            created=created,
+            out=fh,
+            workers=workers,
+            output_format=output_format,
+            cache_dir=cache_dir,
+            validation_mode=validation_mode,
+            issue_limits=issue_limits,
+            metrics=metrics,
+        )
+        return report
+
+    report = _write_atomically(output_path, write)
+    return report, output_path if report.ok else None, filename
+
+
+def _write_atomically(
+    output_path: Path, write: Callable[[TextSink], ValidationReport]
+) -> ValidationReport:
+    """
+    Run `write` against a `.part` sibling of output_path and rename it into
+    place only if it completes with an ok report.
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    part_path = output_path.with_name(output_path.name + ".part")
+
+    try:
+        # newline="" keeps our CRLF terminators byte-exact on every platform
+        with part_path.open("w", encoding="ascii", errors="strict", newline="") as fh:
+            report = write(fh)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+
+    if not report.ok:
+        part_path.unlink(missing_ok=True)
+        return report
+
+    part_path.replace(output_path)
+    return report
+
+
+def generate_delta_to_path(
+    old_payload: Mapping[str, Any],
+    payload: Mapping[str, Any],
+    cwr_version: str,
+    sender: str,
+    receiver: str,
+    file_sequence: int,
+    output_path: Path | None = None,
+    out_dir: Path | None = None,
+    created: datetime | None = None,
+    output_format: str = "kv",
+) -> tuple[GenerationReport, Path | None, str]:
+    """Validate `payload` and write a file with only its new/changed works.
+
+    Works are compared with `old_payload` (the previous delivery) by
+    submitter_work_number; see generation.delta. Output paths work as in
+    generate_cwr_to_path(), and the report's `delta` section lists what was
+    sent, kept back and removed.
+    """
+    created = ensure_utc(created or datetime.now(UTC))
 
     filename = suggest_filename(
         cwr_version=cwr_version,
@@ -90,5 +543,35 @@ def generate_cwr_file(
         file_sequence=file_sequence,
         created=created,
     )
+    if output_path is None:
+        output_path = (out_dir or Path.cwd()) / filename
 
-    return report, cwr_text, filename
+    validation = validate_minimal(payload, version=cwr_version)
+    report = GenerationReport(
+        ok=validation.ok, version=validation.version, issues=validation.issues
+    )
+    if not report.ok:
+        return report, None, filename
+
+    delta = diff_works(old_payload, payload)
+    report.delta = DeltaStats(
+        new=len(delta.new),
+        changed=len(delta.changed),
+        unchanged=delta.unchanged,
+        removed=delta.removed,
+    )
+
+    def write(fh: TextSink) -> ValidationReport:
+        write_delta_wrk_file(
+            delta,
+            fh,
+            sender=sender,
+            receiver=receiver,
+            cwr_version=cwr_version,
+            now=created,
+            output_format=output_format,
+        )
+        return report
+
+    _write_atomically(output_path, write)
+    return report, output_path, filename
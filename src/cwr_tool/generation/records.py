@@ -2,7 +2,20 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
+
+from cwr_tool.format.charset import ascii_line
+from cwr_tool.sink import TextSink
+
+if TYPE_CHECKING:
+    from cwr_tool.spec.registry import VersionSpec
+
+# Record types this tool writes (and the parser decodes)
+RECORD_TYPES = ("HDR", "GRH", "GRT", "TRL", "NWR", "REV", "ALT", "COM", "SPU")
+
+# (txcount, reccount) increments per body record type: the same numbers the
+# record classes return from counts(), for readers that only see record types
+RECORD_COUNTS = {"NWR": (1, 1), "REV": (1, 1), "SPU": (1, 1), "ALT": (0, 1), "COM": (0, 1)}
 
 CRLF = "\r\n"
 
@@ -10,6 +23,10 @@ CRLF = "\r\n"
 class RenderableRecord(Protocol):
     def render(self) -> str: ...
 
+    def render_fixedwidth(self, spec: VersionSpec, tx_seq: int = 0, rec_seq: int = 0) -> str:
+        """Render with the version's compiled layout (tx/rec sequence for detail records)."""
+        ...
+
 
 class CountableRecord(RenderableRecord, Protocol):
     """
@@ -28,9 +45,59 @@ class RecordLine:
     payload: str = ""
 
     def render(self) -> str:
-        return f"{self.record_type}{self.payload}" if self.payload else self.record_type
+        return ascii_line(f"{self.record_type}{self.payload}") if self.payload else self.record_type
+
+    def render_fixedwidth(self, spec: VersionSpec, tx_seq: int = 0, rec_seq: int = 0) -> str:
+        # Pre-formatted line: identical in every output format
+        return self.render()
 
 
 def join_records(records: Iterable[RenderableRecord]) -> str:
     rendered = [r.render() for r in records]
     return CRLF.join(rendered) + CRLF
+
+
+def write_records(
+    records: Iterable[RenderableRecord], out: TextSink, spec: VersionSpec | None = None
+) -> int:
+    """
+    Stream records to `out`, one CRLF-terminated line at a time.
+
+    Unlike join_records() nothing is buffered here, so memory stays flat
+    regardless of how many records flow through.
+
+    - spec None: placeholder KEY=VALUE format (render())
+    - spec given: fixed-width format from the spec's layouts (render_fixedwidth())
+
+    Returns:
+      number of lines written
+    """
+    n = 0
+    for r in records:
+        out.write(r.render() if spec is None else r.render_fixedwidth(spec))
+        out.write(CRLF)
+        n += 1
+    return n
+
+
+def write_transaction_records(
+    records: Iterable[RenderableRecord],
+    out: TextSink,
+    spec: VersionSpec | None = None,
+    tx_seq: int = 0,
+) -> int:
+    """
+    Like write_records(), for the lines of one transaction.
+
+    In fixed-width format every line carries the transaction sequence number
+    (`tx_seq`, 0-based within the group) and its record sequence number
+    (0 for the transaction header, then 1, 2, ... for detail lines).
+    """
+    if spec is None:
+        return write_records(records, out)
+    n = 0
+    for rec_seq, r in enumerate(records):
+        out.write(r.render_fixedwidth(spec, tx_seq, rec_seq))
+        out.write(CRLF)
+        n += 1
+    return n
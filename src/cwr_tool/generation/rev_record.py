@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import ClassVar
+
+from cwr_tool.generation.nwr_record import NWRRecord
+
+
+@dataclass(frozen=True, slots=True)
+class REVRecord(NWRRecord):
+    """Revised registration: same fields (and layout) as NWR, for a work sent before."""
+
+    record_type: ClassVar[str] = "REV"
@@ -2,6 +2,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from cwr_tool.format.charset import ascii_line
+from cwr_tool.generation.memo import seq_line
+from cwr_tool.spec.registry import VersionSpec
+
 
 def _req(value: str, field: str) -> str:
     v = value.strip()
@@ -21,4 +25,8 @@ class SPURecord:
 
     def render(self) -> str:
         name = _req(self.publisher_name, "publisher_name")
-        return f"SPU NAME={name}"
+        return ascii_line(f"SPU NAME={name}")
+
+    def render_fixedwidth(self, spec: VersionSpec, tx_seq: int = 0, rec_seq: int = 0) -> str:
+        name = _req(self.publisher_name, "publisher_name")
+        return seq_line(spec.layout("SPU"), tx_seq, rec_seq, 1, name)
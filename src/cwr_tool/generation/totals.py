@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from cwr_tool.generation.control_records import GRTRecord, TRLRecord
+from cwr_tool.generation.records import CountableRecord
+from cwr_tool.generation.transaction import Transaction
+
+
+@dataclass(slots=True)
+class GroupTotals:
+    """
+    Running GRT totals for one group, accumulated as records are emitted.
+
+    - txcount/reccount exclude GRH/GRT (CWR convention)
+    - each record's counts() is consulted exactly once
+    """
+
+    txcount: int = 0
+    reccount: int = 0
+
+    @classmethod
+    def of(cls, transactions: Iterable[Transaction]) -> GroupTotals:
+        totals = cls()
+        for t in transactions:
+            totals.add_transaction(t)
+        return totals
+
+    def add_record(self, record: CountableRecord) -> None:
+        dtx, drec = record.counts()
+        self.txcount += dtx
+        self.reccount += drec
+
+    def add_transaction(self, transaction: Transaction) -> None:
+        for r in transaction.records:
+            self.add_record(r)
+
+    def merge(self, other: GroupTotals) -> None:
+        """Fold in partial totals (e.g. from a chunk rendered elsewhere)."""
+        self.txcount += other.txcount
+        self.reccount += other.reccount
+
+    @property
+    def physical_lines(self) -> int:
+        """GRH(1) + body(reccount) + GRT(1)."""
+        return 2 + self.reccount
+
+    def trailer(self, group_number: int) -> GRTRecord:
+        return GRTRecord(group=group_number, txcount=self.txcount, reccount=self.reccount)
+
+
+@dataclass(slots=True)
+class FileTotals:
+    """
+    Running TRL totals for a whole file, fed one closed group at a time.
+
+    RECTOTAL = HDR(1) + all groups (including GRH/GRT) + TRL(1)
+    """
+
+    groups: int = 0
+    txtotal: int = 0
+    group_lines: int = 0
+
+    def add_group(self, group: GroupTotals) -> None:
+        self.groups += 1
+        self.txtotal += group.txcount
+        self.group_lines += group.physical_lines
+
+    @property
+    def rectotal(self) -> int:
+        return 2 + self.group_lines
+
+    def trailer(self) -> TRLRecord:
+        return TRLRecord(groups=self.groups, txtotal=self.txtotal, rectotal=self.rectotal)
@@ -0,0 +1,65 @@
+"""
+Emit one rendered file body under other CWR versions.
+
+Most record layouts are the same in every version (see spec/layouts.py), so a
+body rendered for one version is also the body for another one, except for
+the lines of the few record types whose layouts differ (GRH carries the
+version, for instance). Those lines are decoded with the source layout and
+re-rendered with the target's; every other line is copied as it is.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from cwr_tool.generation.records import CRLF, RECORD_TYPES
+from cwr_tool.sink import TextSink
+from cwr_tool.spec.registry import VersionSpec
+
+
+def changed_record_types(source: VersionSpec | None, target: VersionSpec | None) -> frozenset[str]:
+    """
+    Record types that render differently under `target` than under `source`.
+
+    None (KEY=VALUE output) has no layouts: its lines only depend on the
+    version in HDR, which callers write themselves, so nothing else changes.
+    """
+    if source is None or target is None:
+        return frozenset()
+    return frozenset(
+        rt
+        for rt in RECORD_TYPES
+        if rt in source.layouts
+        and (rt not in target.layouts or source.layouts[rt].fields != target.layouts[rt].fields)
+    )
+
+
+def write_lines_as(
+    lines: Iterable[str],
+    out: TextSink,
+    source: VersionSpec,
+    target: VersionSpec,
+    record_types: frozenset[str],
+) -> int:
+    """
+    Copy CRLF-terminated fixed-width `lines` rendered with `source` into
+    `out`, re-rendering those of `record_types` with `target`'s layouts.
+
+    Re-rendered lines keep the decoded field values; a field the source
+    layout does not have is left blank (FixedWidthError if it is required).
+
+    Returns:
+      number of lines written
+    """
+    write = out.write
+    n = 0
+    for line in lines:
+        record_type = line[:3]
+        if record_type in record_types:
+            layout = source.layout(record_type)
+            text = line.removesuffix(CRLF)
+            values = {name: text[slice(*layout.span(name))].strip() for name in layout.names}
+            line = target.layout(record_type).render(values) + CRLF
+        write(line)
+        n += 1
+    return n
@@ -0,0 +1,184 @@
+"""
+Columnar, normalized in-memory form of payload["works"].
+
+Filled once, during validation (see WorkTableCollector), and rendered from
+directly: no Transaction/record objects are built, and titles/codes are
+stripped and uppercased once instead of on every render. This saves time,
+not memory: the table lives next to the caller's payload dicts (a few
+percent more at peak), which is why streamed works are not collected.
+
+Layout (n works, a alternate titles in total):
+- titles, swks, languages: one str per work (equal language codes share one
+  str, see generation.memo)
+- alt_titles + alt_ends: a flat list of ALT titles and, per work, the end
+  offset of its slice (array of machine ints rather than a list of lists)
+- comments: sparse {work index: comment}; most works have none, and repeated
+  comments share one str
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from cwr_tool.generation.alt_record import alt_line
+from cwr_tool.generation.com_record import com_line
+from cwr_tool.generation.control_records import GRHRecord
+from cwr_tool.generation.memo import norm_code, norm_text
+from cwr_tool.generation.nwr_record import nwr_line
+from cwr_tool.generation.records import CRLF, RECORD_COUNTS, write_records
+from cwr_tool.generation.totals import GroupTotals
+from cwr_tool.reporting.models import ValidationReport
+from cwr_tool.sink import TextSink
+from cwr_tool.spec.registry import VersionSpec
+from cwr_tool.validation.rules.base import RuleContext
+
+_ALT_REC = RECORD_COUNTS["ALT"][1]
+_COM_REC = RECORD_COUNTS["COM"][1]
+
+
+def _get_str_list(work: Mapping[str, Any], key: str) -> list[str]:
+    value = work.get(key)
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        raise ValueError(f"'{key}' must be a list of strings")
+    out: list[str] = []
+    for item in value:
+        if not isinstance(item, str):
+            raise ValueError(f"Each item in '{key}' must be a string")
+        s = item.strip()
+        if s:
+            out.append(s)
+    return out
+
+
+class WorkTable:
+    """Normalized works, one column per field (see module docstring)."""
+
+    __slots__ = ("titles", "swks", "languages", "alt_titles", "alt_ends", "comments")
+
+    def __init__(self) -> None:
+        self.titles: list[str] = []
+        self.swks: list[str] = []
+        self.languages: list[str] = []
+        self.alt_titles: list[str] = []
+        self.alt_ends = array("L")
+        self.comments: dict[int, str] = {}
+
+    @classmethod
+    def from_works(cls, works: Iterable[Mapping[str, Any]]) -> WorkTable:
+        table = cls()
+        for w in works:
+            table.append(w)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def append(self, work: Mapping[str, Any]) -> None:
+        """
+        Normalize one work the way the writer does (see writer._work_transaction).
+
+        Raises ValueError for a blank title or submitter_work_number (as
+        NWRRecord does) and for malformed alternate_titles, before anything
+        is added, so the table never holds a partial work.
+        """
+        title = str(work.get("title", "")).strip()
+        if not title:
+            raise ValueError("title is required")
+        swk = str(work.get("submitter_work_number", "")).strip()
+        if not swk:
+            raise ValueError("submitter_work_number is required")
+        alts = _get_str_list(work, "alternate_titles")
+        lang = norm_code(str(work.get("language_code", "EN"))) or "EN"
+        comment = work.get("comment")
+
+        index = len(self.titles)
+        self.titles.append(title)
+        self.swks.append(swk)
+        self.languages.append(lang)
+        self.alt_titles.extend(alts)
+        self.alt_ends.append(len(self.alt_titles))
+        if isinstance(comment, str):
+            comment = norm_text(comment)
+            if comment:
+                self.comments[index] = comment
+
+    def alts(self, index: int) -> list[str]:
+        start = self.alt_ends[index - 1] if index else 0
+        return self.alt_titles[start : self.alt_ends[index]]
+
+    def totals(self) -> GroupTotals:
+        """GRT totals of the WRK group, from the column sizes alone."""
+        n = len(self.titles)
+        tx, rec = RECORD_COUNTS["NWR"]
+        return GroupTotals(
+            txcount=n * tx,
+            reccount=n * rec + len(self.alt_titles) * _ALT_REC + len(self.comments) * _COM_REC,
+        )
+
+    def write_rows(self, out: TextSink, spec: VersionSpec | None = None) -> None:
+        """Write every work's transaction lines (NWR, ALT..., COM) in order."""
+        write = out.write
+        comments = self.comments
+        alt_titles = self.alt_titles
+        start = 0
+        for i, (title, swk, lang, end) in enumerate(
+            zip(self.titles, self.swks, self.languages, self.alt_ends, strict=True)
+        ):
+            write(nwr_line(spec, i, 0, title, swk, lang))
+            write(CRLF)
+            rec_seq = 0
+            for rec_seq, alt in enumerate(alt_titles[start:end], 1):
+                write(alt_line(spec, i, rec_seq, alt))
+                write(CRLF)
+            start = end
+            comment = comments.get(i)
+            if comment is not None:
+                write(com_line(spec, i, rec_seq + 1, comment))
+                write(CRLF)
+
+
+def write_work_table_group(
+    out: TextSink,
+    table: WorkTable,
+    *,
+    group_number: int,
+    group_type: str = "WRK",
+    spec: VersionSpec | None = None,
+) -> GroupTotals:
+    """write_group() for a WorkTable: GRH, every work's lines, GRT."""
+    write_records([GRHRecord(group=group_number, type_=group_type)], out, spec)
+    table.write_rows(out, spec)
+    totals = table.totals()
+    write_records([totals.trailer(group_number)], out, spec)
+    return totals
+
+
+class WorkTableCollector:
+    """
+    Work rule that fills a WorkTable during the validation traversal, so the
+    works are parsed and normalized exactly once per run.
+
+    Works the table cannot hold (blank required fields, malformed
+    alternate_titles) are not errors here; `failed` is set and callers should
+    render from the payload instead, which reports the problem the usual way.
+    """
+
+    code = "WORK.TABLE"
+
+    def __init__(self, table: WorkTable) -> None:
+        self.table = table
+        self.failed = False
+
+    def visit_work(
+        self, report: ValidationReport, ctx: RuleContext, index: int, work: dict[str, Any]
+    ) -> None:
+        if self.failed:
+            return
+        try:
+            self.table.append(work)
+        except ValueError:
+            self.failed = True
@@ -1,149 +1,344 @@
 from __future__ import annotations
 
+import io
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, datetime
 from typing import Any
 
+from cwr_tool.format import OUTPUT_FORMATS
 from cwr_tool.generation.alt_record import ALTRecord
+from cwr_tool.generation.cache import RenderCache, write_groups_cached
 from cwr_tool.generation.com_record import COMRecord
-from cwr_tool.generation.control_records import HDRRecord, TRLRecord
+from cwr_tool.generation.control_records import HDRRecord
+from cwr_tool.generation.delta import WorkDelta
 from cwr_tool.generation.group_builder import (
+    GroupSpec,
     _get_objects,
     build_groups,
-    render_group,
-    total_physical_line_count,
+    iter_groups,
+    write_group,
 )
+from cwr_tool.generation.memo import norm_code
 from cwr_tool.generation.nwr_record import NWRRecord
-from cwr_tool.generation.records import CountableRecord, RenderableRecord, join_records
+from cwr_tool.generation.parallel import DEFAULT_CHUNK_SIZE, write_groups_parallel
+from cwr_tool.generation.records import CountableRecord, write_records
+from cwr_tool.generation.rev_record import REVRecord
 from cwr_tool.generation.spu_record import SPURecord
+from cwr_tool.generation.totals import FileTotals
 from cwr_tool.generation.transaction import Transaction
+from cwr_tool.generation.work_table import WorkTable, _get_str_list, write_work_table_group
+from cwr_tool.reporting.metrics import NULL_METRICS, Metrics
+from cwr_tool.sink import TextSink
+from cwr_tool.spec.registry import SpecRegistry, VersionSpec
 
 
-def _get_str_list(work: dict[str, Any], key: str) -> list[str]:
-    value = work.get(key)
-    if value is None:
-        return []
-    if not isinstance(value, list):
-        raise ValueError(f"'{key}' must be a list of strings")
-    out: list[str] = []
-    for item in value:
-        if not isinstance(item, str):
-            raise ValueError(f"Each item in '{key}' must be a string")
-        s = item.strip()
-        if s:
-            out.append(s)
-    return out
-
-
-def _build_wrk_transactions(payload: dict[str, Any]) -> list[Transaction]:
-    works = _get_objects(payload, "works")
-
-    transactions: list[Transaction] = []
-    for w in works:
-        title = str(w.get("title", "")).strip()
-        swk = str(w.get("submitter_work_number", "")).strip()
-        lang = str(w.get("language_code", "EN")).strip() or "EN"
-
-        tx_records: list[CountableRecord] = [
-            NWRRecord(title=title, submitter_work_number=swk, language_code=lang),
-        ]
+def layout_spec(output_format: str, cwr_version: str) -> VersionSpec | None:
+    """VersionSpec whose layouts render `output_format`, or None for KEY=VALUE."""
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Unsupported output format: {output_format!r}. Supported: {', '.join(OUTPUT_FORMATS)}"
+        )
+    if output_format == "kv":
+        return None
+    return SpecRegistry.get(cwr_version)
 
-        for alt in _get_str_list(w, "alternate_titles"):
-            tx_records.append(ALTRecord(title=alt))
 
-        comment = w.get("comment")
-        if isinstance(comment, str) and comment.strip():
-            tx_records.append(COMRecord(comment=comment))
+def _work_transaction(w: dict[str, Any], header: type[NWRRecord] = NWRRecord) -> Transaction:
+    title = str(w.get("title", "")).strip()
+    swk = str(w.get("submitter_work_number", "")).strip()
+    lang = norm_code(str(w.get("language_code", "EN"))) or "EN"
 
-        # Transaction expects countable records; our record types implement counts().
-        transactions.append(Transaction(records=tx_records))  # type: ignore[arg-type]
+    tx_records: list[CountableRecord] = [
+        header(title=title, submitter_work_number=swk, language_code=lang),
+    ]
 
-    return transactions
+    for alt in _get_str_list(w, "alternate_titles"):
+        tx_records.append(ALTRecord(title=alt))
 
+    comment = w.get("comment")
+    if isinstance(comment, str) and comment.strip():
+        tx_records.append(COMRecord(comment=comment.strip()))
 
-def _build_spu_transactions(payload: dict[str, Any]) -> list[Transaction]:
-    items = _get_objects(payload, "spu")
-    if not items:
-        return []
+    # Transaction expects countable records; our record types implement counts().
+    return Transaction(records=tx_records)
 
-    transactions: list[Transaction] = []
-    for item in items:
-        name = str(item.get("publisher_name", "")).strip()
-        transactions.append(Transaction(records=[SPURecord(publisher_name=name)]))
 
-    return transactions
+def _wrk_transaction(w: dict[str, Any]) -> Transaction:
+    return _work_transaction(w, NWRRecord)
 
 
-def render_minimal_wrk_file(
-    payload: dict[str, Any],
+def _rev_transaction(w: dict[str, Any]) -> Transaction:
+    """A work the receiver already has: same lines, REV instead of NWR."""
+    return _work_transaction(w, REVRecord)
+
+
+def _build_wrk_transactions(payload: Mapping[str, Any]) -> Iterator[Transaction]:
+    for w in _get_objects(payload, "works"):
+        yield _wrk_transaction(w)
+
+
+def _spu_transaction(item: dict[str, Any]) -> Transaction:
+    name = str(item.get("publisher_name", "")).strip()
+    return Transaction(records=[SPURecord(publisher_name=name)])
+
+
+def _build_rev_transactions(payload: Mapping[str, Any]) -> Iterator[Transaction]:
+    for w in _get_objects(payload, "revisions"):
+        yield _rev_transaction(w)
+
+
+def _build_spu_transactions(payload: Mapping[str, Any]) -> Iterator[Transaction]:
+    for item in _get_objects(payload, "spu"):
+        yield _spu_transaction(item)
+
+
+# Group numbers are assigned in this order, only to groups that have transactions.
+# Add more groups later by appending specs, e.g. GroupSpec("PWR", _build_pwr_transactions).
+GROUP_SPECS: tuple[GroupSpec, ...] = (
+    GroupSpec(
+        group_type="WRK",
+        build_transactions=_build_wrk_transactions,
+        source_key="works",
+        build_transaction=_wrk_transaction,
+    ),
+    GroupSpec(
+        group_type="SPU",
+        build_transactions=_build_spu_transactions,
+        source_key="spu",
+        build_transaction=_spu_transaction,
+    ),
+)
+
+# Delta deliveries (see generation.delta): new works, then revised ones.
+_DELTA_GROUP_SPECS: tuple[GroupSpec, ...] = (
+    GroupSpec(
+        group_type="WRK",
+        build_transactions=_build_wrk_transactions,
+        source_key="works",
+        build_transaction=_wrk_transaction,
+    ),
+    GroupSpec(
+        group_type="REV",
+        build_transactions=_build_rev_transactions,
+        source_key="revisions",
+        build_transaction=_rev_transaction,
+    ),
+)
+
+
+def write_minimal_wrk_file(
+    payload: Mapping[str, Any],
+    out: TextSink,
     sender: str,
     receiver: str,
     cwr_version: str = "2.1",
     now: datetime | None = None,
-) -> str:
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    output_format: str = "kv",
+    cache: RenderCache | None = None,
+    works: WorkTable | None = None,
+    metrics: Metrics = NULL_METRICS,
+) -> int:
     """
-    Render a minimal CWR file with:
-      - WRK group from payload["works"]
-      - optional SPU group from payload["spu"]
+    Stream a minimal CWR file (see render_minimal_wrk_file) into `out`.
 
-    The WRK group supports:
-      - alternate_titles -> ALT lines (non-transaction)
-      - comment -> COM line (non-transaction)
+    Transactions are built, rendered and written one at a time, so memory use
+    does not grow with the size of the catalogue. GRT/TRL totals are
+    accumulated (GroupTotals/FileTotals) while the body is written, so no
+    second pass over the data is needed.
+
+    With workers > 1, transactions are built and rendered in chunks of
+    `chunk_size` items on a process pool and reassembled in order; the output
+    is byte-identical to the serial path.
+
+    output_format "fixedwidth" writes every line with the CWR version's
+    compiled layout (see spec.layouts) instead of KEY=VALUE placeholders.
+
+    With a `cache`, unchanged works are written from previously rendered
+    lines and only new or changed ones are rendered (serially: `workers` is
+    not used on this path).
+
+    `works` is payload["works"] already normalized into a WorkTable (see
+    WorkTableCollector); the WRK group is then rendered from it without
+    touching payload["works"] again. Only used by the serial path.
+
+    `metrics` (serial paths) is charged with the time spent building
+    transactions, under "build_transactions".
+
+    Returns:
+      number of physical lines written (equals TRL RECTOTAL)
     """
     if now is None:
         now = datetime.now(UTC)
 
-    records: list[RenderableRecord] = [
-        HDRRecord(sender=sender, receiver=receiver, version=cwr_version, created=now),
-    ]
+    write_records(
+        [HDRRecord(sender=sender, receiver=receiver, version=cwr_version, created=now)],
+        out,
+        layout_spec(output_format, cwr_version),
+    )
+    return write_minimal_wrk_body(
+        payload,
+        out,
+        cwr_version=cwr_version,
+        workers=workers,
+        chunk_size=chunk_size,
+        output_format=output_format,
+        cache=cache,
+        works=works,
+        metrics=metrics,
+    )
 
-    # Build groups (sequential numbering only for present groups)
-    specs = [
-        # Group 1 (if present): WRK
-        # Group 2 (if present): SPU
-        # Add more groups later by appending specs.
-        # e.g., GroupSpec("PWR", _build_pwr_transactions)
-        #       GroupSpec("OPU", _build_opu_transactions)
-        #       GroupSpec("REC", _build_rec_transactions)
-        # etc.
-        #
-        # NOTE: group numbers are assigned by build_groups() in the order below.
-        #
-        # We intentionally keep this declarative so adding groups doesn't touch output math.
-        #
-        # fmt: off
-        # (ruff/black formatting is fine either way; keeping readable)
-        # fmt: on
-    ]
 
-    from cwr_tool.generation.group_builder import (
-        GroupSpec,  # local import avoids circular import risk
-    )
+def write_minimal_wrk_body(
+    payload: Mapping[str, Any],
+    out: TextSink,
+    cwr_version: str = "2.1",
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    output_format: str = "kv",
+    cache: RenderCache | None = None,
+    works: WorkTable | None = None,
+    metrics: Metrics = NULL_METRICS,
+) -> int:
+    """
+    Everything write_minimal_wrk_file() writes after the HDR line: the groups
+    and the TRL. Nothing in it depends on sender or receiver, so one body can
+    be sent under several headers (see pipeline.generate_cwr_fanout).
 
-    specs = [
-        GroupSpec(group_type="WRK", build_transactions=_build_wrk_transactions),
-        GroupSpec(group_type="SPU", build_transactions=_build_spu_transactions),
-    ]
+    Returns:
+      number of physical lines of the whole file, HDR included (TRL RECTOTAL)
+    """
+    spec = layout_spec(output_format, cwr_version)
+
+    if cache is not None:
+        totals = write_groups_cached(
+            payload,
+            GROUP_SPECS,
+            out,
+            cache,
+            version=cwr_version,
+            output_format=output_format,
+            spec=spec,
+        )
+    elif workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            totals = write_groups_parallel(
+                payload,
+                GROUP_SPECS,
+                out,
+                executor,
+                chunk_size=chunk_size,
+                max_pending=2 * workers,
+                spec=spec,
+            )
+    elif works is not None:
+        totals = FileTotals()
+        if len(works):
+            totals.add_group(write_work_table_group(out, works, group_number=1, spec=spec))
+        # GROUP_SPECS[0] is the WRK group rendered above
+        for g in iter_groups(payload, GROUP_SPECS[1:]):
+            totals.add_group(
+                write_group(
+                    out,
+                    group_number=totals.groups + 1,
+                    group_type=g.group_type,
+                    transactions=metrics.timed("build_transactions", g.transactions),
+                    spec=spec,
+                )
+            )
+    else:
+        totals = FileTotals()
+        for g in iter_groups(payload, GROUP_SPECS):
+            group_totals = write_group(
+                out,
+                group_number=g.group_number,
+                group_type=g.group_type,
+                transactions=metrics.timed("build_transactions", g.transactions),
+                spec=spec,
+            )
+            totals.add_group(group_totals)
+
+    write_records([totals.trailer()], out, spec)
+    return totals.rectotal
+
+
+def write_delta_wrk_file(
+    delta: WorkDelta,
+    out: TextSink,
+    sender: str,
+    receiver: str,
+    cwr_version: str = "2.1",
+    now: datetime | None = None,
+    output_format: str = "kv",
+) -> int:
+    """
+    Write a delta CWR file: a WRK group of NWR transactions for new works and
+    a REV group for changed ones.
+
+    Groups go through build_groups(), so an empty side is left out and group
+    numbers stay compact. Removed works have no transaction in this record set
+    and are only reported by the caller.
 
-    built = build_groups(payload, specs)
+    Returns:
+      number of physical lines written (equals TRL RECTOTAL)
+    """
+    if now is None:
+        now = datetime.now(UTC)
+    spec = layout_spec(output_format, cwr_version)
 
-    total_tx = 0
-    for g in built:
-        group_records, txcount, _reccount = render_group(
-            group_number=g.group_number,
-            group_type=g.group_type,
-            transactions=g.transactions,
+    write_records(
+        [HDRRecord(sender=sender, receiver=receiver, version=cwr_version, created=now)],
+        out,
+        spec,
+    )
+    totals = FileTotals()
+    for g in build_groups(delta.payload(), _DELTA_GROUP_SPECS):
+        totals.add_group(
+            write_group(
+                out,
+                group_number=g.group_number,
+                group_type=g.group_type,
+                transactions=g.transactions,
+                spec=spec,
+            )
         )
-        records.extend(group_records)
-        total_tx += txcount
+    write_records([totals.trailer()], out, spec)
+    return totals.rectotal
 
-    groups_count = len(built)
 
-    # RECTOTAL = HDR(1) + all groups (including GRH/GRT) + TRL(1)
-    group_lines = total_physical_line_count(built)
-    rectotal = 2 + group_lines  # HDR + TRL + groups
+def render_minimal_wrk_file(
+    payload: Mapping[str, Any],
+    sender: str,
+    receiver: str,
+    cwr_version: str = "2.1",
+    now: datetime | None = None,
+    output_format: str = "kv",
+) -> str:
+    """
+    Render a minimal CWR file with:
+      - WRK group from payload["works"]
+      - optional SPU group from payload["spu"]
+
+    The WRK group supports:
+      - alternate_titles -> ALT lines (non-transaction)
+      - comment -> COM line (non-transaction)
 
-    records.append(TRLRecord(groups=groups_count, txtotal=total_tx, rectotal=rectotal))
-    return join_records(records)
+    Convenience wrapper over write_minimal_wrk_file() for callers that want
+    the whole file as one string; large catalogues should stream instead.
+    """
+    buf = io.StringIO()
+    write_minimal_wrk_file(
+        payload=payload,
+        out=buf,
+        sender=sender,
+        receiver=receiver,
+        cwr_version=cwr_version,
+        now=now,
+        output_format=output_format,
+    )
+    return buf.getvalue()
 
 
 def render_hello_control_file(
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any, TextIO
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_WS = " \t\r\n"
+_DECODER = json.JSONDecoder()
+
+
+class JsonStreamError(ValueError):
+    """Malformed (or unexpectedly shaped) JSON found while streaming a payload."""
+
+
+class _Cursor:
+    """
+    Chunked read buffer over a text file.
+
+    Consumed text is dropped whenever more is read, so the buffer only ever
+    holds the item currently being decoded (plus one chunk of look-ahead).
+    """
+
+    def __init__(self, fh: TextIO, chunk_size: int) -> None:
+        self._fh = fh
+        self._chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        if self.eof:
+            return False
+        # grow geometrically so one huge item is not re-parsed O(n) times
+        remaining = len(self.buf) - self.pos
+        chunk = self._fh.read(max(self._chunk_size, remaining))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ("" at end of input)."""
+        while True:
+            n = len(self.buf)
+            while self.pos < n and self.buf[self.pos] in _WS:
+                self.pos += 1
+            if self.pos < n:
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, ch: str) -> None:
+        got = self.peek()
+        if got != ch:
+            raise JsonStreamError(f"Expected {ch!r} but found {got or 'end of input'!r}")
+        self.pos += 1
+
+    def decode_value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                if self.fill():
+                    continue
+                raise JsonStreamError(f"{e.msg} (offset {e.pos})") from None
+            # a number (or literal) touching the end of the buffer may be cut short
+            if end >= len(self.buf) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def iter_items(self) -> Iterator[Any]:
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.decode_value()
+            c = self.peek()
+            self.pos += 1
+            if c == ",":
+                continue
+            if c == "]":
+                return
+            raise JsonStreamError(f"Expected ',' or ']' in array but found {c or 'end of input'!r}")
+
+
+def iter_array(path: Path, key: str, *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Yield the items of the top-level array `key` of a `{"works": [...], ...}`
+    JSON file one at a time.
+
+    - Only one item is decoded (and held in memory) at a time.
+    - Other top-level arrays are skipped item by item; other values are decoded
+      and discarded.
+    - A missing key yields nothing.
+    """
+    with path.open(encoding="utf-8") as fh:
+        cur = _Cursor(fh, chunk_size)
+        if cur.peek() != "{":
+            raise JsonStreamError("Input JSON must be an object at the top level")
+        cur.pos += 1
+        if cur.peek() == "}":
+            return
+
+        while True:
+            k = cur.decode_value()
+            if not isinstance(k, str):
+                raise JsonStreamError("Object keys must be strings")
+            cur.expect(":")
+
+            if cur.peek() == "[":
+                items = cur.iter_items()
+                if k == key:
+                    yield from items
+                else:
+                    for _ in items:
+                        pass
+            else:
+                cur.decode_value()
+                if k == key:
+                    raise JsonStreamError(f"'{key}' must be an array")
+
+            c = cur.peek()
+            cur.pos += 1
+            if c == ",":
+                continue
+            if c == "}":
+                return
+            raise JsonStreamError(f"Expected ',' or '}}' but found {c or 'end of input'!r}")
+
+
+class StreamedArray:
+    """Re-iterable view of one top-level array; every iteration re-reads the file."""
+
+    __slots__ = ("path", "key", "chunk_size")
+
+    def __init__(self, path: Path, key: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self.path = path
+        self.key = key
+        self.chunk_size = chunk_size
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter_array(self.path, self.key, chunk_size=self.chunk_size)
+
+
+class StreamingPayload(Mapping[str, Any]):
+    """
+    Read-only payload whose `works` / `spu` arrays are streamed from disk.
+
+    Drop-in for the dict payload accepted by validate_minimal() and the
+    writers: validation and generation each make their own pass over the file,
+    so peak memory stays flat however large the catalogue is.
+    """
+
+    KEYS = ("works", "spu")
+
+    def __init__(self, path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self.path = path
+        self.chunk_size = chunk_size
+
+    def __getitem__(self, key: str) -> StreamedArray:
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return StreamedArray(self.path, key, self.chunk_size)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+
+def is_array(value: object) -> bool:
+    """True for JSON arrays, whether already loaded (list) or streamed."""
+    return isinstance(value, list | StreamedArray)
+
+
+def load_payload(path: Path, *, stream: bool = False) -> Mapping[str, Any]:
+    """
+    Load a payload file for non-interactive callers (batch, service).
+
+    Raises FileNotFoundError for a missing file and JsonStreamError for invalid
+    JSON or a non-object top level. With stream=True the file is only opened
+    lazily (see StreamingPayload).
+    """
+    if stream:
+        if not path.is_file():
+            raise FileNotFoundError(f"File not found: {path}")
+        return StreamingPayload(path)
+
+    try:
+        data: Any = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as e:
+        raise JsonStreamError(f"{e.msg} (line {e.lineno}, col {e.colno})") from None
+    if not isinstance(data, dict):
+        raise JsonStreamError("Input JSON must be an object at the top level")
+    return data
@@ -0,0 +1,201 @@
+"""
+Memory-mapped CWR record reader.
+
+The file is mapped read-only and scanned for line breaks in place; nothing is
+decoded until a record's fields are asked for, so skimming a large inbound
+file (e.g. counting NWRs) costs little more than the page faults.
+
+Both line formats written by this tool are understood:
+- KEY=VALUE placeholder lines ("NWR TITLE=... SWK=..."); keys are mapped to
+  the layout field names so both formats expose the same names
+- fixed-width lines, decoded with the layouts of the CWR version named in HDR
+"""
+
+from __future__ import annotations
+
+import mmap
+import re
+from collections.abc import Iterator
+from pathlib import Path
+
+from cwr_tool.format.fixedwidth import CompiledLayout, FixedWidthError
+from cwr_tool.generation.records import RECORD_TYPES
+from cwr_tool.spec.registry import SpecRegistry, VersionSpec
+
+
+class ParseError(ValueError):
+    """A line that cannot be decoded (bad encoding, no layout, no HDR...)."""
+
+
+# KEY=VALUE keys -> fixed-width layout field names (others are lowercased)
+_KV_NAMES = {
+    "SENDER": "sender_id",
+    "VER": "version",
+    "GROUP": "group_id",
+    "TYPE": "transaction_type",
+    "SWK": "submitter_work_number",
+    "LANG": "language_code",
+    "NAME": "publisher_name",
+}
+_KV_KEY = re.compile(r"(?:^| )([A-Z]+)=")
+
+# Fixed-width HDRs carry the CWR version right after the 2.1 HDR (since 2.2)
+_HDR_21_WIDTH = 101
+_HDR_VERSION = slice(101, 104)
+
+
+def _decode(raw: bytes, line_no: int) -> str:
+    try:
+        return raw.decode("ascii")
+    except UnicodeDecodeError as e:
+        raise ParseError(f"Line {line_no}: non-ASCII byte at column {e.start + 1}") from None
+
+
+def _parse_kv(text: str) -> dict[str, str]:
+    rest = text[4:]
+    matches = list(_KV_KEY.finditer(rest))
+    out: dict[str, str] = {}
+    for m, nxt in zip(matches, [*matches[1:], None], strict=True):
+        key = m.group(1)
+        end = len(rest) if nxt is None else nxt.start()
+        out[_KV_NAMES.get(key, key.lower())] = rest[m.end() : end]
+    return out
+
+
+class ParsedRecord:
+    """
+    One line of a CWR file, decoded on demand.
+
+    `record_type`, `line_no` and `offset` are set while scanning; the line's
+    text and fields are only read from the map when accessed. Records point
+    into the mapped file, so access them before iter_records() finishes.
+    """
+
+    __slots__ = ("record_type", "line_no", "offset", "_mm", "_end", "_kv", "_spec", "_fields")
+
+    def __init__(
+        self,
+        mm: mmap.mmap,
+        offset: int,
+        end: int,
+        line_no: int,
+        record_type: str,
+        kv: bool,
+        spec: VersionSpec | None,
+    ) -> None:
+        self.record_type = record_type
+        self.line_no = line_no
+        self.offset = offset
+        self._mm = mm
+        self._end = end
+        self._kv = kv
+        self._spec = spec
+        self._fields: dict[str, str] | None = None
+
+    @property
+    def known(self) -> bool:
+        """True for record types this tool knows how to decode."""
+        return self.record_type in RECORD_TYPES
+
+    @property
+    def is_fixedwidth(self) -> bool:
+        return not self._kv
+
+    @property
+    def raw(self) -> bytes:
+        return self._mm[self.offset : self._end]
+
+    @property
+    def text(self) -> str:
+        return _decode(self.raw, self.line_no)
+
+    def _layout(self) -> CompiledLayout:
+        if self._spec is None:
+            raise ParseError(f"Line {self.line_no}: fixed-width {self.record_type} before HDR")
+        try:
+            return self._spec.layout(self.record_type)
+        except ValueError as e:
+            raise ParseError(f"Line {self.line_no}: {e}") from None
+
+    def __getitem__(self, name: str) -> str:
+        """Decode a single field (fixed-width: only that field's columns are read)."""
+        if self._kv or self._fields is not None:
+            return self.fields()[name]
+        try:
+            start, end = self._layout().span(name)
+        except FixedWidthError:
+            raise KeyError(name) from None
+        return _decode(self._mm[self.offset + start : self.offset + end], self.line_no).strip()
+
+    def get(self, name: str, default: str | None = None) -> str | None:
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def fields(self) -> dict[str, str]:
+        """All named fields of the line (decoded once, then cached)."""
+        if self._fields is None:
+            text = self.text
+            if self._kv:
+                self._fields = _parse_kv(text)
+            else:
+                layout = self._layout()
+                if len(text) != layout.width:
+                    raise ParseError(
+                        f"Line {self.line_no}: {self.record_type} is {len(text)} characters, "
+                        f"layout expects {layout.width}"
+                    )
+                self._fields = {n: text[slice(*layout.span(n))].strip() for n in layout.names}
+        return self._fields
+
+
+def _hdr_spec(record: ParsedRecord) -> VersionSpec:
+    if record.is_fixedwidth:
+        text = record.text
+        version = "2.1" if len(text) == _HDR_21_WIDTH else text[_HDR_VERSION]
+    else:
+        version = record.fields().get("version", "")
+    try:
+        return SpecRegistry.get(version.strip())
+    except ValueError as e:
+        raise ParseError(f"Line {record.line_no}: {e}") from None
+
+
+def iter_records(path: Path) -> Iterator[ParsedRecord]:
+    """
+    Yield every record of a CWR file, in file order.
+
+    Lines end in CRLF (a bare LF and a missing final terminator are tolerated);
+    blank lines are skipped. Only HDR is decoded eagerly, to pick the version
+    layouts for fixed-width lines that follow.
+    """
+    with path.open("rb") as fh:
+        if fh.seek(0, 2) == 0:
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from _scan(mm)
+
+
+def _scan(mm: mmap.mmap) -> Iterator[ParsedRecord]:
+    size = len(mm)
+    spec: VersionSpec | None = None
+    pos = 0
+    line_no = 0
+    while pos < size:
+        nl = mm.find(b"\n", pos)
+        nxt = size if nl == -1 else nl + 1
+        end = size if nl == -1 else nl
+        if end > pos and mm[end - 1] == 0x0D:
+            end -= 1
+        line_no += 1
+
+        if end > pos:
+            record_type = _decode(mm[pos : pos + 3], line_no)
+            kv = end - pos <= 3 or mm[pos + 3] == 0x20
+            record = ParsedRecord(mm, pos, end, line_no, record_type, kv, spec)
+            if record_type == "HDR":
+                spec = record._spec = _hdr_spec(record)
+            yield record
+
+        pos = nxt
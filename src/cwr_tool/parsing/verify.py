@@ -0,0 +1,204 @@
+"""
+Round-trip check of GRT/TRL totals against the body of an existing CWR file.
+
+One pass over iter_records() with O(1) state per group: only GRT and TRL
+fields are decoded; every other line contributes its record type alone.
+Body lines are counted with generation.records.RECORD_COUNTS (the rules of
+Transaction.counts()); record types this tool does not write are counted as
+non-transaction detail lines.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from cwr_tool.generation.records import RECORD_COUNTS
+from cwr_tool.generation.totals import FileTotals, GroupTotals
+from cwr_tool.parsing.reader import ParsedRecord, ParseError, iter_records
+from cwr_tool.reporting.models import Severity, ValidationReport
+
+_DETAIL = (0, 1)
+
+
+@dataclass(slots=True)
+class _OpenGroup:
+    line: int
+    group_id: str | None
+    totals: GroupTotals
+
+
+def _issue(
+    report: ValidationReport,
+    code: str,
+    message: str,
+    *,
+    line: int,
+    record_type: str | None = None,
+    field: str | None = None,
+    **context: Any,
+) -> None:
+    report.add_issue(
+        code,
+        Severity.ERROR,
+        message,
+        record_type=record_type,
+        field=field,
+        line=line,
+        context=context,
+    )
+
+
+def _check_count(
+    report: ValidationReport, rec: ParsedRecord, name: str, actual: int, label: str
+) -> None:
+    raw = rec.get(name)
+    if raw is None or not raw.isdigit():
+        _issue(
+            report,
+            f"VERIFY.{rec.record_type}.FIELD_INVALID",
+            f"{rec.record_type} {label} is missing or not numeric.",
+            line=rec.line_no,
+            record_type=rec.record_type,
+            field=name,
+            value=raw,
+        )
+    elif int(raw) != actual:
+        _issue(
+            report,
+            f"VERIFY.{rec.record_type}.{label}_MISMATCH",
+            f"{rec.record_type} {label} is {int(raw)} but the body has {actual}.",
+            line=rec.line_no,
+            record_type=rec.record_type,
+            field=name,
+            expected=actual,
+            found=int(raw),
+        )
+
+
+def verify_file(path: Path) -> ValidationReport:
+    """
+    Check that every GRT and the TRL agree with the records actually present.
+
+    Reports (all errors, with the 1-based line number in pointer.line):
+    - GRT TXCOUNT/RECCOUNT vs the group's body, and GROUP vs its GRH
+    - TRL GROUPS/TXTOTAL vs the GRTs seen, RECTOTAL vs the file's line count
+    - structure: HDR first, TRL last, groups opened/closed, undecodable lines
+    """
+    report = ValidationReport(ok=True)
+    file_totals = FileTotals()
+    group: _OpenGroup | None = None
+    lines = 0
+    last_line = 0
+    trl_line: int | None = None
+    trailing_reported = False
+
+    records = iter_records(path)
+    while True:
+        try:
+            rec = next(records, None)
+        except ParseError as e:
+            # the scanner itself failed (e.g. unusable HDR): nothing after it can be trusted
+            _issue(report, "VERIFY.PARSE.ERROR", str(e), line=last_line + 1)
+            return report
+        if rec is None:
+            break
+        lines += 1
+        last_line = rec.line_no
+        rt = rec.record_type
+
+        if lines == 1 and rt != "HDR":
+            _issue(report, "VERIFY.HDR.MISSING", "File does not start with HDR.", line=1)
+        if trl_line is not None and not trailing_reported:
+            _issue(
+                report,
+                "VERIFY.TRL.NOT_LAST",
+                "Records follow TRL.",
+                line=rec.line_no,
+                record_type=rt,
+                trl_line=trl_line,
+            )
+            trailing_reported = True
+
+        try:
+            if rt == "GRH":
+                if group is not None:
+                    _issue(
+                        report,
+                        "VERIFY.GRT.MISSING",
+                        "Group is not closed by a GRT before the next GRH.",
+                        line=rec.line_no,
+                        record_type=rt,
+                        group_line=group.line,
+                    )
+                    file_totals.add_group(group.totals)
+                group = _OpenGroup(rec.line_no, rec.get("group_id"), GroupTotals())
+
+            elif rt == "GRT":
+                if group is None:
+                    _issue(
+                        report,
+                        "VERIFY.GRH.MISSING",
+                        "GRT without an open group.",
+                        line=rec.line_no,
+                        record_type=rt,
+                    )
+                    continue
+                totals = group.totals
+                _check_count(report, rec, "txcount", totals.txcount, "TXCOUNT")
+                _check_count(report, rec, "reccount", totals.reccount, "RECCOUNT")
+                group_id = rec.get("group_id")
+                if group.group_id is not None and group_id != group.group_id:
+                    _issue(
+                        report,
+                        "VERIFY.GRT.GROUP_MISMATCH",
+                        f"GRT closes group {group_id} but GRH opened {group.group_id}.",
+                        line=rec.line_no,
+                        record_type=rt,
+                        field="group_id",
+                        expected=group.group_id,
+                        found=group_id,
+                    )
+                file_totals.add_group(totals)
+                group = None
+
+            elif rt == "TRL":
+                if group is not None:
+                    _issue(
+                        report,
+                        "VERIFY.GRT.MISSING",
+                        "Last group is not closed by a GRT.",
+                        line=rec.line_no,
+                        record_type=rt,
+                        group_line=group.line,
+                    )
+                    file_totals.add_group(group.totals)
+                    group = None
+                _check_count(report, rec, "groups", file_totals.groups, "GROUPS")
+                _check_count(report, rec, "txtotal", file_totals.txtotal, "TXTOTAL")
+                _check_count(report, rec, "rectotal", lines, "RECTOTAL")
+                trl_line = rec.line_no
+
+            elif rt != "HDR":
+                if group is None:
+                    _issue(
+                        report,
+                        "VERIFY.RECORD.OUTSIDE_GROUP",
+                        f"{rt} is not inside a group.",
+                        line=rec.line_no,
+                        record_type=rt,
+                    )
+                    continue
+                dtx, drec = RECORD_COUNTS.get(rt, _DETAIL)
+                group.totals.txcount += dtx
+                group.totals.reccount += drec
+
+        except ParseError as e:
+            _issue(report, "VERIFY.PARSE.ERROR", str(e), line=rec.line_no, record_type=rt)
+
+    if lines == 0:
+        _issue(report, "VERIFY.HDR.MISSING", "File is empty.", line=1)
+    elif trl_line is None:
+        _issue(report, "VERIFY.TRL.MISSING", "File does not end with TRL.", line=last_line + 1)
+    return report
@@ -0,0 +1,271 @@
+"""
+Validation issues and the compact store reports keep them in.
+
+A bad catalogue can produce millions of issues. Keeping each one as a
+ValidationIssue (plus its Pointer) costs two Pydantic objects per issue, so
+IssueStore keeps them as parallel columns instead: interned strings for the
+code, message and pointer paths, one byte for the severity, machine ints for
+the indexes. ValidationIssue objects are only built when the store is read
+(iteration, indexing); serializing a report goes straight from the columns
+to plain dicts.
+
+IssueLimits bounds the store: past `max_issues` issues in total, or
+`per_code` issues of one code, further issues are only counted (per code,
+in `omitted`). Errors are counted either way, so a report stays not-ok when
+the error that made it so was not kept.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any, overload
+
+from pydantic import BaseModel, Field, GetCoreSchemaHandler
+from pydantic_core import CoreSchema, core_schema
+
+
+class Severity(StrEnum):
+    INFO = "info"
+    WARNING = "warning"
+    ERROR = "error"
+
+
+class Pointer(BaseModel):
+    record_type: str | None = None
+    path: str | None = None
+    field: str | None = None
+    index: int | None = None
+    line: int | None = None  # 1-based line number when the issue is in a CWR file
+
+
+class ValidationIssue(BaseModel):
+    code: str
+    severity: Severity
+    message: str
+    pointer: Pointer = Field(default_factory=Pointer)
+    context: dict[str, Any] = Field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class IssueLimits:
+    """How many issues a report keeps: in total, and per issue code (None: no limit)."""
+
+    max_issues: int | None = None
+    per_code: int | None = None
+
+    def __post_init__(self) -> None:
+        for name in ("max_issues", "per_code"):
+            value = getattr(self, name)
+            if value is not None and value < 0:
+                raise ValueError(f"{name} must be >= 0")
+
+
+NO_LIMITS = IssueLimits()
+
+_SEVERITIES = tuple(Severity)
+_SEVERITY_IDS = {s: i for i, s in enumerate(_SEVERITIES)}
+_ERROR = _SEVERITY_IDS[Severity.ERROR]
+
+
+class IssueStore(Sequence[ValidationIssue]):
+    """
+    Append-only, columnar sequence of ValidationIssue.
+
+    Reading an item materializes a new ValidationIssue each time: changing
+    it does not change the store.
+    """
+
+    __slots__ = (
+        "limits",
+        "omitted",
+        "errors",
+        "_kept",
+        "_ids",
+        "_strings",
+        "_code",
+        "_severity",
+        "_message",
+        "_record_type",
+        "_path",
+        "_field",
+        "_index",
+        "_line",
+        "_context",
+    )
+
+    def __init__(
+        self, issues: Iterable[ValidationIssue] = (), *, limits: IssueLimits = NO_LIMITS
+    ) -> None:
+        self.limits = limits
+        # code -> issues counted but not kept
+        self.omitted: dict[str, int] = {}
+        # errors added, kept or not
+        self.errors = 0
+        # code -> issues kept
+        self._kept: dict[str, int] = {}
+        # interned strings; id 0 is None
+        self._ids: dict[str | None, int] = {None: 0}
+        self._strings: list[str | None] = [None]
+        self._code = array("I")
+        self._severity = bytearray()
+        self._message = array("I")
+        self._record_type = array("I")
+        self._path = array("I")
+        self._field = array("I")
+        # -1 is None
+        self._index = array("q")
+        self._line = array("q")
+        self._context: list[dict[str, Any] | None] = []
+        for issue in issues:
+            self.append(issue)
+
+    def _id(self, s: str | None) -> int:
+        i = self._ids.get(s)
+        if i is None:
+            i = self._ids[s] = len(self._strings)
+            self._strings.append(s)
+        return i
+
+    def add(
+        self,
+        code: str,
+        severity: Severity,
+        message: str,
+        *,
+        record_type: str | None = None,
+        path: str | None = None,
+        field: str | None = None,
+        index: int | None = None,
+        line: int | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> bool:
+        """Add one issue from its fields; False if it was only counted (see IssueLimits)."""
+        sev = _SEVERITY_IDS[severity]
+        if sev == _ERROR:
+            self.errors += 1
+        kept = self._kept.get(code, 0)
+        limits = self.limits
+        if (limits.per_code is not None and kept >= limits.per_code) or (
+            limits.max_issues is not None and len(self._severity) >= limits.max_issues
+        ):
+            self.omitted[code] = self.omitted.get(code, 0) + 1
+            return False
+        self._kept[code] = kept + 1
+
+        self._code.append(self._id(code))
+        self._severity.append(sev)
+        self._message.append(self._id(message))
+        self._record_type.append(self._id(record_type))
+        self._path.append(self._id(path))
+        self._field.append(self._id(field))
+        self._index.append(-1 if index is None else index)
+        self._line.append(-1 if line is None else line)
+        self._context.append(context or None)
+        return True
+
+    def append(self, issue: ValidationIssue) -> bool:
+        p = issue.pointer
+        return self.add(
+            issue.code,
+            issue.severity,
+            issue.message,
+            record_type=p.record_type,
+            path=p.path,
+            field=p.field,
+            index=p.index,
+            line=p.line,
+            context=issue.context,
+        )
+
+    def extend(self, other: IssueStore) -> None:
+        """Add every issue of `other` in order, and what `other` only counted."""
+        kept_errors = 0
+        for row in other.rows():
+            if row["severity"] is Severity.ERROR:
+                kept_errors += 1
+            pointer = row["pointer"]
+            self.add(
+                row["code"],
+                row["severity"],
+                row["message"],
+                context=row["context"],
+                **pointer,
+            )
+        self.errors += other.errors - kept_errors
+        for code, n in other.omitted.items():
+            self.omitted[code] = self.omitted.get(code, 0) + n
+
+    def row(self, i: int) -> dict[str, Any]:
+        """Issue `i` as the plain dict ValidationIssue.model_dump() would return."""
+        s = self._strings
+        index = self._index[i]
+        line = self._line[i]
+        return {
+            "code": s[self._code[i]],
+            "severity": _SEVERITIES[self._severity[i]],
+            "message": s[self._message[i]],
+            "pointer": {
+                "record_type": s[self._record_type[i]],
+                "path": s[self._path[i]],
+                "field": s[self._field[i]],
+                "index": None if index < 0 else index,
+                "line": None if line < 0 else line,
+            },
+            "context": self._context[i] or {},
+        }
+
+    def rows(self) -> Iterator[dict[str, Any]]:
+        """Every issue as a plain dict (see row()), without building models."""
+        return map(self.row, range(len(self)))
+
+    def _issue(self, i: int) -> ValidationIssue:
+        row = self.row(i)
+        row["pointer"] = Pointer.model_construct(**row["pointer"])
+        return ValidationIssue.model_construct(**row)
+
+    def __len__(self) -> int:
+        return len(self._severity)
+
+    @overload
+    def __getitem__(self, i: int) -> ValidationIssue: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> list[ValidationIssue]: ...
+
+    def __getitem__(self, i: int | slice) -> ValidationIssue | list[ValidationIssue]:
+        if isinstance(i, slice):
+            return [self._issue(j) for j in range(*i.indices(len(self)))]
+        n = len(self)
+        if not -n <= i < n:
+            raise IndexError("issue index out of range")
+        return self._issue(i % n)
+
+    def __iter__(self) -> Iterator[ValidationIssue]:
+        return map(self._issue, range(len(self)))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, IssueStore | list | tuple):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"IssueStore({len(self)} issues, omitted={sum(self.omitted.values())})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        # Validates from an IssueStore (kept as is) or a list of issues
+        # (JSON input, or ValidationReport(issues=[...])); dumps as that list.
+        from_list = core_schema.no_info_after_validator_function(
+            cls, handler.generate_schema(list[ValidationIssue])
+        )
+        return core_schema.union_schema(
+            [core_schema.is_instance_schema(cls), from_list],
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda store: list(store.rows())
+            ),
+        )
@@ -0,0 +1,150 @@
+"""
+Opt-in per-stage instrumentation (wall time, record and byte counts).
+
+A run creates a Metrics and passes it down; code that does the work marks
+its stages with `stage()`, wraps lazy iterators with `timed()` and its
+output sink with `sink()`. The result also has the hit/miss counts of the
+generation memos (see generation.memo) over the run. NULL_METRICS is the
+default everywhere: its `timed()`/`sink()` return their argument unchanged
+and `stage()` is a shared no-op context, so an uninstrumented run pays a
+handful of calls per run and nothing per record.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import TypeVar
+
+from cwr_tool.generation.memo import memo_stats
+from cwr_tool.reporting.models import MemoStats, RunMetrics, StageMetrics
+from cwr_tool.sink import TextSink
+
+T = TypeVar("T")
+
+_clock = time.perf_counter
+
+
+class _MeteredSink:
+    """TextSink that charges write time and characters (= ASCII bytes) to a stage."""
+
+    __slots__ = ("_out", "_stage")
+
+    def __init__(self, out: TextSink, stage: StageMetrics) -> None:
+        self._out = out
+        self._stage = stage
+
+    def write(self, s: str, /) -> int:
+        t0 = _clock()
+        n = self._out.write(s)
+        self._stage.seconds += _clock() - t0
+        self._stage.bytes += len(s)
+        return n
+
+
+class Metrics:
+    """
+    Stage timings and counters for one run.
+
+    Stages accumulate: entering the same stage twice adds up. `stage(name,
+    exclude=...)` leaves out time charged to the excluded stages while it was
+    open, so an enclosing stage (e.g. "render") reports only its own share.
+    """
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self._started = _clock()
+        self._stages: dict[str, StageMetrics] = {}
+        self._memo_before = memo_stats()
+
+    def get(self, name: str) -> StageMetrics:
+        st = self._stages.get(name)
+        if st is None:
+            st = self._stages[name] = StageMetrics()
+        return st
+
+    @contextmanager
+    def _stage(self, name: str, exclude: Sequence[str]) -> Iterator[StageMetrics]:
+        st = self.get(name)
+        excluded = [self.get(n) for n in exclude]
+        before = sum(e.seconds for e in excluded)
+        t0 = _clock()
+        try:
+            yield st
+        finally:
+            nested = sum(e.seconds for e in excluded) - before
+            st.seconds += _clock() - t0 - nested
+
+    def stage(self, name: str, exclude: Sequence[str] = ()) -> AbstractContextManager[StageMetrics]:
+        return self._stage(name, exclude)
+
+    def count(self, name: str, *, records: int = 0, bytes: int = 0) -> None:
+        st = self.get(name)
+        st.records += records
+        st.bytes += bytes
+
+    def timed(self, name: str, items: Iterable[T]) -> Iterator[T]:
+        """Yield from `items`, charging the time spent producing each one to `name`."""
+        st = self.get(name)
+        it = iter(items)
+        while True:
+            t0 = _clock()
+            try:
+                item = next(it)
+            except StopIteration:
+                st.seconds += _clock() - t0
+                return
+            st.seconds += _clock() - t0
+            st.records += 1
+            yield item
+
+    def sink(self, name: str, out: TextSink) -> TextSink:
+        return _MeteredSink(out, self.get(name))
+
+    def _memo(self) -> dict[str, MemoStats]:
+        out = memo_stats()
+        for kind, stats in out.items():
+            before = self._memo_before.get(kind)
+            # counters only go down when the memos were cleared meanwhile
+            if before is not None and before.hits <= stats.hits and before.misses <= stats.misses:
+                stats.hits -= before.hits
+                stats.misses -= before.misses
+        return out
+
+    def result(self) -> RunMetrics:
+        return RunMetrics(
+            seconds=_clock() - self._started,
+            stages={k: v.model_copy() for k, v in self._stages.items()},
+            memo=self._memo(),
+        )
+
+
+class _NullMetrics(Metrics):
+    enabled = False
+
+    def __init__(self) -> None:
+        self._scratch = StageMetrics()
+        self._context = nullcontext(self._scratch)
+
+    def get(self, name: str) -> StageMetrics:
+        return self._scratch
+
+    def stage(self, name: str, exclude: Sequence[str] = ()) -> AbstractContextManager[StageMetrics]:
+        return self._context
+
+    def count(self, name: str, *, records: int = 0, bytes: int = 0) -> None:
+        pass
+
+    def timed(self, name: str, items: Iterable[T]) -> Iterator[T]:
+        return iter(items)
+
+    def sink(self, name: str, out: TextSink) -> TextSink:
+        return out
+
+    def result(self) -> RunMetrics:
+        return RunMetrics()
+
+
+NULL_METRICS: Metrics = _NullMetrics()
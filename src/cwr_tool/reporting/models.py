@@ -1,38 +1,170 @@
 from __future__ import annotations
 
-from enum import StrEnum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 
-
-class Severity(StrEnum):
-    INFO = "info"
-    WARNING = "warning"
-    ERROR = "error"
-
-
-class Pointer(BaseModel):
-    record_type: str | None = None
-    path: str | None = None
-    field: str | None = None
-    index: int | None = None
-
-
-class ValidationIssue(BaseModel):
-    code: str
-    severity: Severity
-    message: str
-    pointer: Pointer = Field(default_factory=Pointer)
-    context: dict[str, Any] = Field(default_factory=dict)
+# Issue models live with their store; re-exported here with the other report models
+from cwr_tool.reporting.issues import IssueLimits as IssueLimits
+from cwr_tool.reporting.issues import IssueStore as IssueStore
+from cwr_tool.reporting.issues import Pointer as Pointer
+from cwr_tool.reporting.issues import Severity as Severity
+from cwr_tool.reporting.issues import ValidationIssue as ValidationIssue
 
 
 class ValidationReport(BaseModel):
     ok: bool
     version: str = "0.1"
-    issues: list[ValidationIssue] = Field(default_factory=list)
+    issues: IssueStore = Field(default_factory=IssueStore)
+
+    @classmethod
+    def limited(cls, limits: IssueLimits | None) -> ValidationReport:
+        """An empty ok report that keeps at most what `limits` allows."""
+        if limits is None:
+            return cls(ok=True)
+        return cls(ok=True, issues=IssueStore(limits=limits))
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def omitted(self) -> dict[str, int] | None:
+        """Issues counted but not kept (see IssueLimits), per code."""
+        return dict(self.issues.omitted) or None
 
     def add(self, issue: ValidationIssue) -> None:
         self.issues.append(issue)
         if issue.severity == Severity.ERROR:
             self.ok = False
+
+    def add_issue(
+        self,
+        code: str,
+        severity: Severity,
+        message: str,
+        *,
+        record_type: str | None = None,
+        path: str | None = None,
+        field: str | None = None,
+        index: int | None = None,
+        line: int | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> None:
+        """add() without building the ValidationIssue (see IssueStore.add)."""
+        self.issues.add(
+            code,
+            severity,
+            message,
+            record_type=record_type,
+            path=path,
+            field=field,
+            index=index,
+            line=line,
+            context=context,
+        )
+        if severity == Severity.ERROR:
+            self.ok = False
+
+    def extend(self, other: IssueStore) -> None:
+        """Add another store's issues (e.g. a validation shard's) in order."""
+        self.issues.extend(other)
+        if other.errors:
+            self.ok = False
+
+
+class CacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    stored: int = 0
+
+
+class DeltaStats(BaseModel):
+    new: int = 0
+    changed: int = 0
+    unchanged: int = 0
+    removed: list[str] = Field(default_factory=list)
+
+
+class StageMetrics(BaseModel):
+    seconds: float = 0.0
+    records: int = 0
+    bytes: int = 0
+
+
+class MemoStats(BaseModel):
+    """Lookups of the in-process memos (see generation.memo)."""
+
+    hits: int = 0
+    misses: int = 0
+    size: int = 0  # entries held
+    maxsize: int = 0
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class RunMetrics(BaseModel):
+    """Where a run spent its time (see reporting.metrics.Metrics)."""
+
+    seconds: float = 0.0
+    stages: dict[str, StageMetrics] = Field(default_factory=dict)
+    # memo lookups made during the run, per kind ("values", "lines")
+    memo: dict[str, MemoStats] = Field(default_factory=dict)
+
+
+class GenerationReport(ValidationReport):
+    """Validation report of a generate run, plus how the file was produced."""
+
+    cache: CacheStats | None = None
+    delta: DeltaStats | None = None
+    metrics: RunMetrics | None = None
+    # multi-version runs: time, lines and bytes per CWR version written
+    versions: dict[str, StageMetrics] | None = None
+
+
+class BatchEntryResult(BaseModel):
+    input_path: str
+    sender: str
+    receiver: str
+    cwr_version: str
+    file_sequence: int
+    ok: bool
+    output_path: str | None = None
+    report_path: str | None = None
+    error_count: int = 0
+    error: str | None = None
+
+
+class BatchSummary(BaseModel):
+    ok: bool
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    entries: list[BatchEntryResult] = Field(default_factory=list)
+
+
+class BenchStage(BaseModel):
+    """Best-of-N timing of one pipeline stage (see cwr_tool.bench.runner)."""
+
+    name: str
+    seconds: float
+    records: int
+    records_per_sec: float
+    bytes: int = 0
+    # Peak RSS of the whole process when this stage's best run ended: it
+    # includes every earlier stage and run, so it never goes down from stage
+    # to stage and is not this stage's own memory use. None where unavailable.
+    process_peak_rss_mib: float | None = None
+
+
+class BenchReport(BaseModel):
+    tool_version: str
+    python: str
+    created: str
+    shape: dict[str, int]
+    cwr_version: str
+    output_format: str
+    repeat: int
+    stages: list[BenchStage] = Field(default_factory=list)
+    peak_rss_mib: float | None = None  # process peak over the whole run
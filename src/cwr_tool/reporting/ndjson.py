@@ -0,0 +1,30 @@
+"""
+Newline-delimited JSON report output.
+
+`model_dump_json()` builds the whole report as one string; for a report
+with millions of issues that string alone can be larger than the payload.
+write_report_ndjson() streams it instead: a first line with everything but
+the issues (plus "issue_count"), then one compact line per issue, written
+straight from the IssueStore columns.
+"""
+
+from __future__ import annotations
+
+import json
+
+from cwr_tool.reporting.models import ValidationReport
+from cwr_tool.sink import TextSink
+
+_dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def write_report_ndjson(report: ValidationReport, out: TextSink) -> int:
+    """Write `report` as NDJSON into `out`; returns the number of lines."""
+    head = report.model_dump(mode="json", exclude={"issues"})
+    head["issue_count"] = len(report.issues)
+    out.write(_dumps(head) + "\n")
+    n = 1
+    for row in report.issues.rows():
+        out.write(_dumps(row) + "\n")
+        n += 1
+    return n
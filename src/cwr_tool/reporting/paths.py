@@ -0,0 +1,10 @@
+"""Where reports are written next to generated files (no heavy imports)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def report_path_for(output_path: Path) -> Path:
+    """Where the JSON report for a generated file lives (`<file>.report.json`)."""
+    return output_path.with_suffix(output_path.suffix + ".report.json")
@@ -0,0 +1,4 @@
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# `validate`/`generate` send their work to this server URL when set
+SERVER_ENV = "CWR_TOOL_SERVER"
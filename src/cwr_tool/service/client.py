@@ -0,0 +1,184 @@
+"""
+Client for a running `cwr-tool serve` (see service.server).
+
+One HTTP/1.1 connection is kept open across calls; if the server closed it
+in the meantime (idle timeout, restart) the request is retried once on a
+fresh connection.
+
+Reports are returned as the server sent them (ServerReport: the JSON text),
+so a client never imports Pydantic; ServerReport.parse() gives the
+ValidationReport model when one is needed.
+"""
+
+from __future__ import annotations
+
+import json
+import socket
+from collections.abc import Mapping
+from dataclasses import dataclass
+from http.client import HTTPConnection, HTTPException
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlencode, urlsplit
+
+from cwr_tool.service import DEFAULT_HOST, DEFAULT_PORT
+
+if TYPE_CHECKING:
+    from cwr_tool.reporting.models import ValidationReport
+
+DEFAULT_URL = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"
+
+
+class ServiceError(RuntimeError):
+    """The server could not be reached or rejected the request."""
+
+
+@dataclass(frozen=True, slots=True)
+class ServerReport:
+    """A ValidationReport as the server sent it; `ok` is read from the HTTP status."""
+
+    ok: bool
+    json: str
+
+    def parse(self) -> ValidationReport:
+        from cwr_tool.reporting.models import ValidationReport
+
+        return ValidationReport.model_validate_json(self.json)
+
+
+def _body(payload: bytes | Mapping[str, Any]) -> bytes:
+    return payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+
+
+def _multipart(content_type: str, data: bytes) -> list[bytes]:
+    """Bodies of the parts of a multipart response (see server._send_multipart)."""
+    boundary = content_type.partition("boundary=")[2].strip('"')
+    if not boundary:
+        raise ServiceError(f"server sent {content_type!r} without a boundary")
+    delimiter = b"\r\n--" + boundary.encode("ascii")
+    # first piece: preamble, last piece: the closing "--" and epilogue
+    pieces = (b"\r\n" + data).split(delimiter)[1:-1]
+    return [piece.partition(b"\r\n\r\n")[2] for piece in pieces]
+
+
+class CWRClient:
+    def __init__(self, url: str = DEFAULT_URL, *, timeout: float = 300.0) -> None:
+        parts = urlsplit(url)
+        if parts.scheme != "http" or not parts.hostname:
+            raise ValueError(f"Unsupported server URL: {url!r} (expected http://host:port)")
+        self._host = parts.hostname
+        self._port = parts.port or DEFAULT_PORT
+        self._timeout = timeout
+        self._conn: HTTPConnection | None = None
+
+    def __enter__(self) -> CWRClient:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _connect(self) -> HTTPConnection:
+        conn = HTTPConnection(self._host, self._port, timeout=self._timeout)
+        conn.connect()
+        # request headers and body are sent separately (see server._Handler)
+        if conn.sock is not None:
+            conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return conn
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        body: bytes | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> tuple[int, dict[str, str], bytes]:
+        for attempt in (1, 2):
+            try:
+                if self._conn is None:
+                    self._conn = self._connect()
+                self._conn.request(method, path, body=body, headers=dict(headers or {}))
+                resp = self._conn.getresponse()
+                data = resp.read()
+            except (HTTPException, ConnectionError) as e:
+                self.close()
+                if attempt == 2:
+                    raise ServiceError(f"cwr-tool server request failed: {e}") from e
+                continue
+            except OSError as e:
+                self.close()
+                raise ServiceError(f"cwr-tool server unreachable: {e}") from e
+            if resp.will_close:
+                self.close()
+            return resp.status, {k.lower(): v for k, v in resp.getheaders()}, data
+        raise AssertionError("unreachable")
+
+    @staticmethod
+    def _error(status: int, data: bytes) -> ServiceError:
+        try:
+            message = json.loads(data)["error"]
+        except (ValueError, KeyError, TypeError):
+            message = data[:200].decode("utf-8", errors="replace")
+        return ServiceError(f"server returned {status}: {message}")
+
+    def health(self) -> dict[str, Any]:
+        status, _headers, data = self._request("GET", "/health")
+        if status != 200:
+            raise self._error(status, data)
+        result: dict[str, Any] = json.loads(data)
+        return result
+
+    def validate(
+        self, payload: bytes | Mapping[str, Any], *, version: str = "2.1", mode: str = "minimal"
+    ) -> ServerReport:
+        query = urlencode({"version": version, "mode": mode})
+        status, _headers, data = self._request("POST", f"/validate?{query}", _body(payload))
+        if status not in (200, 422):
+            raise self._error(status, data)
+        return ServerReport(ok=status == 200, json=data.decode("utf-8"))
+
+    def generate(
+        self,
+        payload: bytes | Mapping[str, Any],
+        *,
+        version: str = "2.1",
+        sender: str = "SUB",
+        receiver: str = "000",
+        file_sequence: int = 1,
+        output_format: str = "kv",
+        mode: str = "minimal",
+    ) -> tuple[ServerReport, bytes | None, str]:
+        """
+        Returns (report, file bytes, suggested filename); bytes and filename
+        are None/"" when validation failed. The report is the server's, with
+        its warnings, in either case.
+        """
+        query = urlencode(
+            {
+                "version": version,
+                "sender": sender,
+                "receiver": receiver,
+                "file_seq": file_sequence,
+                "format": output_format,
+                "mode": mode,
+            }
+        )
+        status, headers, data = self._request(
+            "POST", f"/generate?{query}", _body(payload), {"Accept": "multipart/mixed"}
+        )
+        if status == 422:
+            return ServerReport(ok=False, json=data.decode("utf-8")), None, ""
+        if status != 200:
+            raise self._error(status, data)
+        content_type = headers.get("content-type", "")
+        if not content_type.startswith("multipart/mixed"):
+            raise ServiceError("server did not send a report with the file (upgrade the server)")
+        parts = _multipart(content_type, data)
+        if len(parts) != 2:
+            raise ServiceError(f"server sent {len(parts)} parts, expected report and file")
+        report_json, body = parts
+        report = ServerReport(ok=True, json=report_json.decode("utf-8"))
+        return report, body, headers.get("x-cwr-filename", "")
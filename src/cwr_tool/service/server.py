@@ -0,0 +1,228 @@
+"""
+Long-running local generation service (`cwr-tool serve`).
+
+Keeps the interpreter, Pydantic models and compiled layouts warm so callers
+that would otherwise start `cwr-tool` per file pay that cost once.
+
+HTTP/1.1 with keep-alive; the request body is the JSON payload and options
+go in the query string:
+
+- GET  /health                      -> {"ok": true, "version": ...}
+- POST /validate?version=&mode=     -> ValidationReport JSON (200 ok, 422 not ok)
+- POST /generate?version=&sender=&receiver=&file_seq=&format=&mode=
+      -> 200 with the CWR file (X-CWR-Filename: suggested name), or
+         422 with the ValidationReport JSON
+
+A /generate request with `Accept: multipart/mixed` gets the report on
+success too: a multipart/mixed body whose first part is the ValidationReport
+JSON (warnings included) and whose second part is the CWR file.
+
+Connections are served by a fixed pool of worker threads. A keep-alive
+connection holds its worker until it closes or has been idle for
+IDLE_TIMEOUT seconds, so the pool size bounds concurrent connections.
+"""
+
+from __future__ import annotations
+
+import json
+import secrets
+import socket
+import threading
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from cwr_tool import __version__
+from cwr_tool.format import OUTPUT_FORMATS
+from cwr_tool.generation.pipeline import generate_cwr_file
+from cwr_tool.service import DEFAULT_HOST, DEFAULT_PORT
+from cwr_tool.validation.engine import validate_minimal
+
+IDLE_TIMEOUT = 30.0
+MAX_BODY = 1 << 30
+
+
+class RequestError(ValueError):
+    """A request the service cannot serve (answered with 4xx and {"error": ...})."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def _param(params: Mapping[str, list[str]], name: str, default: str) -> str:
+    values = params.get(name)
+    return values[-1] if values else default
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = f"cwr-tool/{__version__}"
+    timeout = IDLE_TIMEOUT
+    # headers and body go out in separate writes; without this, Nagle's
+    # algorithm and delayed ACKs add ~40 ms to every keep-alive response
+    disable_nagle_algorithm = True
+
+    server: CWRServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status: int, body: bytes, content_type: str, **headers: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name.replace("_", "-"), value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, text: str) -> None:
+        self._send(status, text.encode("utf-8"), "application/json")
+
+    def _send_multipart(self, parts: list[tuple[str, bytes]], **headers: str) -> None:
+        boundary = f"cwr-{secrets.token_hex(16)}"
+        chunks: list[bytes] = []
+        for content_type, body in parts:
+            head = f"--{boundary}\r\nContent-Type: {content_type}\r\n\r\n"
+            chunks += [head.encode("ascii"), body, b"\r\n"]
+        chunks.append(f"--{boundary}--\r\n".encode("ascii"))
+        self._send(200, b"".join(chunks), f"multipart/mixed; boundary={boundary}", **headers)
+
+    def _read_payload(self) -> dict[str, Any]:
+        length = self.headers.get("Content-Length", "")
+        if not length.isdigit():
+            # the body (if any) cannot be skipped: drop the connection after replying
+            self.close_connection = True
+            raise RequestError(411, "Content-Length is required")
+        size = int(length)
+        if size > MAX_BODY:
+            self.close_connection = True
+            raise RequestError(413, "payload too large")
+        try:
+            data: Any = json.loads(self.rfile.read(size))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise RequestError(400, f"Invalid JSON: {e}") from None
+        if not isinstance(data, dict):
+            raise RequestError(400, "Input JSON must be an object at the top level")
+        return data
+
+    def do_GET(self) -> None:
+        if urlsplit(self.path).path != "/health":
+            self._send_json(404, json.dumps({"error": "not found"}))
+            return
+        self._send_json(200, json.dumps({"ok": True, "version": __version__}))
+
+    def do_POST(self) -> None:
+        url = urlsplit(self.path)
+        params = parse_qs(url.query)
+        try:
+            if url.path == "/validate":
+                self._validate(params)
+            elif url.path == "/generate":
+                self._generate(params)
+            else:
+                # unread body: the connection cannot be reused
+                self.close_connection = True
+                raise RequestError(404, "not found")
+        except (RequestError, ValueError) as e:
+            status = e.status if isinstance(e, RequestError) else 400
+            self._send_json(status, json.dumps({"error": str(e)}))
+
+    def _validate(self, params: Mapping[str, list[str]]) -> None:
+        payload = self._read_payload()
+        report = validate_minimal(
+            payload,
+            version=_param(params, "version", "2.1"),
+            mode=_param(params, "mode", "minimal"),
+        )
+        self._send_json(200 if report.ok else 422, report.model_dump_json(indent=2))
+
+    def _generate(self, params: Mapping[str, list[str]]) -> None:
+        payload = self._read_payload()
+        output_format = _param(params, "format", "kv")
+        if output_format not in OUTPUT_FORMATS:
+            raise RequestError(400, f"format must be one of: {', '.join(OUTPUT_FORMATS)}")
+        try:
+            file_seq = int(_param(params, "file_seq", "1"))
+        except ValueError:
+            raise RequestError(400, "file_seq must be an integer") from None
+        if not 1 <= file_seq <= 9999:
+            raise RequestError(400, "file_seq must be between 1 and 9999")
+
+        report, text, filename = generate_cwr_file(
+            payload,
+            cwr_version=_param(params, "version", "2.1"),
+            sender=_param(params, "sender", "SUB"),
+            receiver=_param(params, "receiver", "000"),
+            file_sequence=file_seq,
+            output_format=output_format,
+            validation_mode=_param(params, "mode", "minimal"),
+        )
+        if not report.ok:
+            self._send_json(422, report.model_dump_json(indent=2))
+            return
+        body = text.encode("ascii", errors="strict")
+        if "multipart/mixed" in self.headers.get("Accept", ""):
+            report_json = report.model_dump_json(indent=2).encode("utf-8")
+            self._send_multipart(
+                [("application/json", report_json), ("text/plain; charset=ascii", body)],
+                X_CWR_Filename=filename,
+            )
+            return
+        self._send(200, body, "text/plain; charset=ascii", X_CWR_Filename=filename)
+
+
+class CWRServer(HTTPServer):
+    """HTTPServer whose connections are handled on a fixed thread pool."""
+
+    def __init__(self, address: tuple[str, int], *, workers: int = 4, verbose: bool = False):
+        super().__init__(address, _Handler)
+        self.verbose = verbose
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cwr-serve")
+        self._open: set[socket.socket] = set()
+        self._lock = threading.Lock()
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        self._pool.submit(self._handle, request, client_address)
+
+    def _handle(self, request: socket.socket, client_address: Any) -> None:
+        with self._lock:
+            self._open.add(request)
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            with self._lock:
+                self._open.discard(request)
+            self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        # wake handlers waiting on idle keep-alive connections
+        with self._lock:
+            for conn in self._open:
+                with suppress(OSError):
+                    conn.shutdown(socket.SHUT_RDWR)
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+
+def serve(
+    host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, *, workers: int = 4, verbose: bool = False
+) -> None:
+    """Serve until interrupted (Ctrl+C)."""
+    with (
+        CWRServer((host, port), workers=workers, verbose=verbose) as server,
+        suppress(KeyboardInterrupt),
+    ):
+        server.serve_forever()
@@ -0,0 +1,11 @@
+"""Where text output goes: the write-only interface generation and reporting share."""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+
+class TextSink(Protocol):
+    """Anything text can be streamed into (open text file, StringIO, socket wrapper...)."""
+
+    def write(self, s: str, /) -> int: ...
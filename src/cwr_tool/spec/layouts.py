@@ -0,0 +1,150 @@
+"""
+Fixed-width record layouts per CWR version.
+
+Field order and widths follow the CISAC CWR 2.1 / 2.2 user manuals for the
+fields this tool populates today; everything else is emitted as blank filler
+of the right width so lines have their full specified length.
+
+Notes:
+- Non-constant field names are the positional order expected by
+  CompiledLayout.render_row(); the records in generation/ rely on it.
+- COM carries this tool's free-text comment line (not the CWR component record).
+- 3.0 / 3.1 reuse the 2.2 body layouts until their record sets are modelled.
+"""
+
+from __future__ import annotations
+
+from cwr_tool.format.fixedwidth import CompiledLayout, FieldSpec, LayoutField, compile_layout
+
+
+def _text(name: str, width: int, *, required: bool = False) -> LayoutField:
+    return LayoutField(name, FieldSpec(width=width, required=required))
+
+
+def _num(name: str, width: int, *, required: bool = False) -> LayoutField:
+    spec = FieldSpec(width=width, align="right", pad="0", required=required)
+    return LayoutField(name, spec, numeric=True)
+
+
+def _const(value: str, width: int) -> LayoutField:
+    return LayoutField("", FieldSpec(width=width), const=value)
+
+
+def _blank(width: int) -> LayoutField:
+    return _const("", width)
+
+
+def _prefix(record_type: str) -> list[LayoutField]:
+    # Record prefix shared by transaction/detail records (19 chars)
+    return [_const(record_type, 3), _num("tx_seq", 8), _num("rec_seq", 8)]
+
+
+def _hdr(version: str) -> list[LayoutField]:
+    fields = [
+        _const("HDR", 3),
+        _const("PB", 2),  # sender type
+        _text("sender_id", 9, required=True),
+        _text("sender_name", 45, required=True),
+        _const("01.10", 5),  # EDI standard version
+        _num("creation_date", 8, required=True),
+        _num("creation_time", 6, required=True),
+        _num("transmission_date", 8, required=True),
+        _blank(15),  # character set (blank = ASCII)
+    ]
+    if version != "2.1":
+        fields += [
+            _const(version, 3),  # CWR version
+            LayoutField("", FieldSpec(width=3, align="right", pad="0"), numeric=True, const="1"),
+            _const("CWR-TOOL", 30),  # software package
+            _text("software_version", 30),
+        ]
+    return fields
+
+
+def _grh(version: str) -> list[LayoutField]:
+    major, minor = version.split(".")
+    return [
+        _const("GRH", 3),
+        _text("transaction_type", 3, required=True),
+        _num("group_id", 5, required=True),
+        _const(f"{int(major):02d}.{minor}0", 5),  # version for this transaction type
+        _blank(10),  # batch request
+        _blank(2),  # submission/distribution type
+    ]
+
+
+_GRT = [
+    _const("GRT", 3),
+    _num("group_id", 5, required=True),
+    _num("txcount", 8, required=True),
+    _num("reccount", 8, required=True),
+    _blank(3),  # currency indicator
+    _blank(10),  # total monetary value
+]
+
+_TRL = [
+    _const("TRL", 3),
+    _num("groups", 5, required=True),
+    _num("txtotal", 8, required=True),
+    _num("rectotal", 8, required=True),
+]
+
+
+def _work_header(record_type: str) -> list[LayoutField]:
+    # NWR and REV share one layout
+    return [
+        *_prefix(record_type),
+        _text("title", 60, required=True),
+        _text("language_code", 2),
+        _text("submitter_work_number", 14, required=True),
+        # ISWC(11) copyright date(8) copyright number(12) distribution category(3)
+        # duration(6) recorded ind(1) text-music rel(3) composite type(3)
+        # version type(3) excerpt type(3) arrangement(3) lyric adaptation(3)
+        # contact name(30) contact id(10) work type(2) grand rights(1)
+        # composite count(3) printed edition date(8) exceptional clause(1)
+        # opus(25) catalogue(25)
+        _blank(11 + 8 + 12 + 3 + 6 + 1 + 3 + 3 + 3 + 3 + 3 + 3 + 30 + 10 + 2 + 1 + 3 + 8 + 1),
+        _blank(25 + 25),
+        _blank(1),  # priority flag
+    ]
+
+
+_ALT = [
+    *_prefix("ALT"),
+    _text("title", 60, required=True),
+    _const("AT", 2),  # title type: alternative title
+    _blank(2),  # language code
+]
+
+_COM = [
+    *_prefix("COM"),
+    _text("comment", 160),
+]
+
+
+_SPU = [
+    *_prefix("SPU"),
+    _num("publisher_sequence", 2),
+    _blank(9),  # interested party #
+    _text("publisher_name", 45, required=True),
+    # unknown ind(1) type(2) tax id(9) IPI name(11) agreement(14)
+    # PR soc(3) share(5) MR soc(3) share(5) SR soc(3) share(5)
+    # special agreements(1) first recording refusal(1) filler(1)
+    # IPI base(13) ISAC(14) society agreement(14) agreement type(2) USA license(1)
+    _blank(1 + 2 + 9 + 11 + 14 + 3 + 5 + 3 + 5 + 3 + 5 + 1 + 1 + 1 + 13 + 14 + 14 + 2 + 1),
+]
+
+
+def build_layouts(version: str) -> dict[str, CompiledLayout]:
+    """Compile every record layout for one CWR version (done once, at import)."""
+    return {
+        "HDR": compile_layout(_hdr(version)),
+        "GRH": compile_layout(_grh(version)),
+        "GRT": compile_layout(_GRT),
+        "TRL": compile_layout(_TRL),
+        "NWR": compile_layout(_work_header("NWR")),
+        "REV": compile_layout(_work_header("REV")),
+        "ALT": compile_layout(_ALT),
+        "COM": compile_layout(_COM),
+        "SPU": compile_layout(_SPU),
+    }
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 
+from cwr_tool.format.fixedwidth import CompiledLayout
 from cwr_tool.models.input import CWRVersion
+from cwr_tool.spec.layouts import build_layouts
 
 
 @dataclass(frozen=True, slots=True)
@@ -10,15 +13,25 @@ class VersionSpec:
     """
     Version overlay for requirements and behavior.
 
+    - layouts: compiled fixed-width layout per record type (see spec/layouts.py)
+
     We’ll fill this out with:
     - required groups/records
     - allowed record types per group
-    - field lengths / layouts (fixed-width)
     - code sets and charsets per version
     """
 
     version: CWRVersion
     supports_spu_group: bool = True
+    layouts: Mapping[str, CompiledLayout] = field(default_factory=dict)
+
+    def layout(self, record_type: str) -> CompiledLayout:
+        try:
+            return self.layouts[record_type]
+        except KeyError:
+            raise ValueError(
+                f"No fixed-width layout for {record_type} in CWR {self.version}"
+            ) from None
 
     # For now, WRK minimal writer always exists in our pipeline.
     # Later: declare required control records etc.
@@ -27,13 +40,14 @@ class VersionSpec:
 class SpecRegistry:
     """
     Central place to fetch per-version rules and generation config.
+
+    Specs (including their compiled layouts) are built once at import and
+    shared; renderers look layouts up instead of rebuilding them per record.
     """
 
     _SPECS: dict[CWRVersion, VersionSpec] = {
-        CWRVersion.V21: VersionSpec(version=CWRVersion.V21, supports_spu_group=True),
-        CWRVersion.V22: VersionSpec(version=CWRVersion.V22, supports_spu_group=True),
-        CWRVersion.V30: VersionSpec(version=CWRVersion.V30, supports_spu_group=True),
-        CWRVersion.V31: VersionSpec(version=CWRVersion.V31, supports_spu_group=True),
+        v: VersionSpec(version=v, supports_spu_group=True, layouts=build_layouts(v.value))
+        for v in CWRVersion
     }
 
     @classmethod
@@ -1,17 +1,86 @@
 from __future__ import annotations
 
-from cwr_tool.reporting.models import Pointer, Severity, ValidationIssue, ValidationReport
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from cwr_tool.reporting.models import (
+    IssueLimits,
+    Pointer,
+    Severity,
+    ValidationIssue,
+    ValidationReport,
+)
 from cwr_tool.spec.registry import SpecRegistry
+from cwr_tool.validation.modes import ValidationMode
+from cwr_tool.validation.parallel import DEFAULT_SHARD_SIZE, run_sharded
+from cwr_tool.validation.rules.base import AnyRule, RuleContext, RulePack
+from cwr_tool.validation.rules.charset_rules import SPUCharsetRule, WorkCharsetRule
+from cwr_tool.validation.rules.cross_work_rules import (
+    AltTitleSameAsTitleRule,
+    DuplicateSubmitterWorkNumberRule,
+    DuplicateTitleLanguageRule,
+)
+from cwr_tool.validation.rules.model_rules import (
+    CompiledSPUFieldsRule,
+    CompiledWorkFieldsRule,
+    ModelSPUFieldsRule,
+    ModelWorkFieldsRule,
+)
+from cwr_tool.validation.rules.schema_rules import (
+    SubmitterWorkNumberRequiredRule,
+    TitleRequiredRule,
+    WorksRequiredRule,
+)
+
+MINIMAL_RULES = RulePack(
+    name="minimal",
+    rules=[
+        WorksRequiredRule(),
+        TitleRequiredRule(),
+        SubmitterWorkNumberRequiredRule(),
+        AltTitleSameAsTitleRule(),
+        DuplicateSubmitterWorkNumberRule(),
+        DuplicateTitleLanguageRule(),
+        WorkCharsetRule(),
+        SPUCharsetRule(),
+    ],
+)
+
 
+MODE_RULES: dict[ValidationMode, RulePack] = {
+    ValidationMode.MINIMAL: MINIMAL_RULES,
+    ValidationMode.STRICT: RulePack(
+        name="strict",
+        rules=[*MINIMAL_RULES.rules, ModelWorkFieldsRule(), ModelSPUFieldsRule()],
+    ),
+    ValidationMode.FAST: RulePack(
+        name="fast",
+        rules=[*MINIMAL_RULES.rules, CompiledWorkFieldsRule(), CompiledSPUFieldsRule()],
+    ),
+    ValidationMode.TRUSTED: RulePack(name="trusted", rules=[WorksRequiredRule()]),
+}
 
-def validate_minimal(payload: dict, *, version: str = "2.1") -> ValidationReport:
+
+def run_rule_pack(
+    pack: RulePack,
+    payload: Mapping[str, Any],
+    *,
+    version: str = "2.1",
+    workers: int = 1,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    issue_limits: IssueLimits | None = None,
+) -> ValidationReport:
     """
-    MVP validation entry point.
+    Run a rule pack over a payload.
 
     - Loads version spec (fails early if unsupported)
-    - Runs minimal schema checks (works array, required fields)
+    - Runs every rule in the pack with a single traversal of payload["works"]
+    - workers > 1: the traversal is sharded across processes (see
+      validation.parallel); the report is the same as a serial run's
+    - issue_limits: keep only that many issues (see IssueLimits); the rest
+      are counted in the report's `omitted`
     """
-    report = ValidationReport(ok=True)
+    report = ValidationReport.limited(issue_limits)
 
     # Ensure version is supported
     try:
@@ -27,53 +96,46 @@ def validate_minimal(payload: dict, *, version: str = "2.1") -> ValidationReport
         )
         return report
 
-    if (
-        "works" not in payload
-        or not isinstance(payload["works"], list)
-        or len(payload["works"]) == 0
-    ):
-        report.add(
-            ValidationIssue(
-                code="SCHEMA.WORKS.MISSING",
-                severity=Severity.ERROR,
-                message="Input must include a non-empty 'works' array.",
-                pointer=Pointer(path="/works"),
-            )
-        )
-        return report
+    ctx = RuleContext(version=version)
+    if workers > 1:
+        run_sharded(pack, report, ctx, payload, workers=workers, shard_size=shard_size)
+    else:
+        pack.run(report, ctx, payload)
+    return report
 
-    for i, work in enumerate(payload["works"]):
-        if not isinstance(work, dict):
-            report.add(
-                ValidationIssue(
-                    code="SCHEMA.WORK.NOT_OBJECT",
-                    severity=Severity.ERROR,
-                    message="Each work must be an object.",
-                    pointer=Pointer(path="/works", index=i),
-                )
-            )
-            continue
-
-        title = work.get("title")
-        if not title or not isinstance(title, str):
-            report.add(
-                ValidationIssue(
-                    code="WORK.TITLE.REQUIRED",
-                    severity=Severity.ERROR,
-                    message="Work title is required.",
-                    pointer=Pointer(path="/works/title", index=i),
-                )
-            )
 
-        swn = work.get("submitter_work_number")
-        if not swn or not isinstance(swn, str):
-            report.add(
-                ValidationIssue(
-                    code="WORK.SUBMITTER_WORK_NUMBER.REQUIRED",
-                    severity=Severity.ERROR,
-                    message="submitter_work_number is required (string).",
-                    pointer=Pointer(path="/works/submitter_work_number", index=i),
-                )
-            )
+def validate_minimal(
+    payload: Mapping[str, Any],
+    *,
+    version: str = "2.1",
+    extra_rules: Sequence[AnyRule] = (),
+    mode: ValidationMode | str = ValidationMode.MINIMAL,
+    workers: int = 1,
+    issue_limits: IssueLimits | None = None,
+) -> ValidationReport:
+    """
+    MVP validation entry point: the minimal rule pack (works array, required
+    fields, duplicate work numbers/titles across works) plus the input
+    contract checks selected by `mode` (see ValidationMode).
 
-    return report
+    `works` may be a list or a streamed array (see ingest.json_stream); it is
+    traversed exactly once either way. `extra_rules` join that traversal
+    (e.g. generation.work_table.WorkTableCollector).
+
+    With `workers` > 1 the works are validated in shards on a process pool.
+    Work rules then run in the workers, so extra rules that keep state on
+    the instance (like WorkTableCollector) cannot take part: only extra
+    rules without visit_work are accepted.
+
+    `issue_limits` bounds how many issues the report keeps (see
+    reporting.issues.IssueLimits); `ok` still reflects every error.
+
+    Raises ValueError for an unknown mode or for extra work rules with
+    workers > 1.
+    """
+    pack = MODE_RULES[ValidationMode(mode)]
+    if workers > 1 and any(hasattr(r, "visit_work") for r in extra_rules):
+        raise ValueError("extra work rules cannot run in parallel validation (workers > 1)")
+    if extra_rules:
+        pack = RulePack(name=pack.name, rules=[*pack.rules, *extra_rules])
+    return run_rule_pack(pack, payload, version=version, workers=workers, issue_limits=issue_limits)
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from enum import StrEnum
+
+
+class ValidationMode(StrEnum):
+    """
+    How much of the input contract (models/input.py) validation checks.
+
+    - minimal: the minimal rules only (works array, required title and
+      work number, duplicates, character set): what rendering needs. Default,
+      so payloads accepted before the modes existed still are.
+    - strict: the minimal rules plus Pydantic validation of every work and
+      SPU entry (TypeAdapter, in batches) against the full input contract
+    - fast: the same checks as strict, by a checker compiled from the models
+      (a small fraction of Pydantic's cost on large catalogues)
+    - trusted: only "works is a non-empty array"; no per-work checks, and no
+      duplicate checks either. For payloads produced by our own tooling.
+
+    Kept apart from validation.engine so the CLI can declare its options
+    without importing the validation stack.
+    """
+
+    MINIMAL = "minimal"
+    STRICT = "strict"
+    FAST = "fast"
+    TRUSTED = "trusted"
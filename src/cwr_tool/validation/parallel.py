@@ -0,0 +1,141 @@
+"""
+Sharded validation of payload["works"] on a process pool.
+
+The parent runs the payload-level rules, cuts the works array into shards
+and sends them to worker processes, which run the pack's work rules with a
+shard-local report and RuleContext. Results are merged in shard order:
+issues are appended as-is (each shard's traversal emits them in the same
+order a serial run would), DuplicateIndexes and rule buffers are folded into
+the parent's context, and the finishing rules then run once over the
+merged state. The report is identical to a serial run, issue for issue.
+
+Shards are cut after every `shard_size` objects, rounded up to a multiple
+of every BatchingRule's batch_size, so batching rules flush at the same
+works as in a serial run.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from cwr_tool.reporting.models import IssueLimits, IssueStore, ValidationReport
+from cwr_tool.validation.rules.base import DuplicateIndex, RuleContext, RulePack
+
+DEFAULT_SHARD_SIZE = 10_000
+
+# Set in each worker by _init_worker (the pack is sent once, not per shard)
+_worker_pack: RulePack | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ShardResult:
+    issues: IssueStore
+    indexes: dict[str, DuplicateIndex]
+    buffers: dict[str, list[Any]]
+    count: int
+
+
+def _init_worker(pack: RulePack) -> None:
+    global _worker_pack
+    _worker_pack = pack
+
+
+def validate_shard(
+    items: Sequence[Any],
+    start: int,
+    version: str,
+    pack: RulePack | None = None,
+    limits: IssueLimits | None = None,
+) -> ShardResult:
+    """
+    Run the work rules over one shard; `start` is its first item's index in works.
+
+    `limits` are the parent report's: a shard keeps at least every issue the
+    parent will keep from it, and counts the rest.
+    """
+    pack = pack if pack is not None else _worker_pack
+    if pack is None:
+        raise RuntimeError("validate_shard() needs a pack outside pool workers")
+    report = ValidationReport.limited(limits)
+    ctx = RuleContext(version=version)
+    count = pack.traverse(report, ctx, items, start)
+    return ShardResult(report.issues, ctx.indexes, ctx.buffers, count)
+
+
+def aligned_shard_size(pack: RulePack, shard_size: int) -> int:
+    """shard_size rounded up to a multiple of every batching rule's batch_size."""
+    step = math.lcm(*(getattr(r, "batch_size", 1) for r in pack.work_rules))
+    return max(step, -(-shard_size // step) * step)
+
+
+def iter_shards(works: Iterable[Any], shard_size: int) -> Iterator[tuple[int, list[Any]]]:
+    """
+    (start index, items) shards of `works`, each cut right after its
+    `shard_size`-th object. Non-object items do not count towards the size
+    (work rules never see them).
+    """
+    shard: list[Any] = []
+    start = 0
+    objects = 0
+    for item in works:
+        shard.append(item)
+        if isinstance(item, dict):
+            objects += 1
+            if objects == shard_size:
+                yield start, shard
+                start += len(shard)
+                shard = []
+                objects = 0
+    if shard:
+        yield start, shard
+
+
+def run_sharded(
+    pack: RulePack,
+    report: ValidationReport,
+    ctx: RuleContext,
+    payload: object,
+    *,
+    workers: int,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+) -> None:
+    """
+    RulePack.run() with the traversal spread over `workers` processes.
+
+    At most 2 * workers shards are in flight, so a streamed works array is
+    still read incrementally.
+    """
+    works = pack.apply(report, ctx, payload)
+    if works is None:
+        return
+
+    size = aligned_shard_size(pack, shard_size)
+    work_count = 0
+    pending: deque[Future[ShardResult]] = deque()
+
+    def merge(result: ShardResult) -> None:
+        nonlocal work_count
+        report.extend(result.issues)
+        ctx.merge(result.indexes, result.buffers)
+        work_count += result.count
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(pack,)
+    ) as executor:
+        for start, items in iter_shards(works, size):
+            pending.append(
+                executor.submit(
+                    validate_shard, items, start, ctx.version, None, report.issues.limits
+                )
+            )
+            if len(pending) >= 2 * workers:
+                merge(pending.popleft().result())
+        while pending:
+            merge(pending.popleft().result())
+
+    pack.finish(report, ctx, work_count)
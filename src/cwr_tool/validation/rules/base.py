@@ -1,9 +1,49 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Protocol
+from collections.abc import Hashable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Protocol, cast
 
-from cwr_tool.reporting.models import Pointer, Severity, ValidationIssue, ValidationReport
+from cwr_tool.ingest.json_stream import is_array
+from cwr_tool.reporting.models import Severity, ValidationReport
+
+
+class DuplicateIndex:
+    """
+    Hash index of key -> work indexes, built incrementally during the traversal.
+
+    Adding a key is O(1). Only keys seen more than once get a list, so a
+    payload without duplicates costs one dict entry per key.
+    """
+
+    __slots__ = ("_first", "_dups")
+
+    def __init__(self) -> None:
+        self._first: dict[Hashable, int] = {}
+        self._dups: dict[Hashable, list[int]] = {}
+
+    def add(self, key: Hashable, index: int) -> None:
+        first = self._first.setdefault(key, index)
+        if first == index:
+            return
+        dups = self._dups.get(key)
+        if dups is None:
+            self._dups[key] = [first, index]
+        else:
+            dups.append(index)
+
+    def merge(self, other: DuplicateIndex) -> None:
+        """
+        Add every (key, index) of `other`, an index over works that all come
+        after the ones already added here (e.g. the next shard).
+        """
+        for key, first in other._first.items():
+            for index in other._dups.get(key, (first,)):
+                self.add(key, index)
+
+    def duplicates(self) -> Iterator[tuple[Hashable, list[int]]]:
+        """Repeated keys with every index that used them, in order of first use."""
+        return iter(sorted(self._dups.items(), key=lambda kv: kv[1][0]))
 
 
 @dataclass(frozen=True, slots=True)
@@ -11,33 +51,203 @@ class RuleContext:
     """
     Context provided to rules.
 
+    - indexes: per-payload hash indexes (see DuplicateIndex) that cross-work
+      rules fill during the traversal and read in finish(), so checks such as
+      "duplicate submitter work number" stay O(1) per work.
+    - buffers: per-payload scratch lists for rules that check works in
+      batches (filled in visit_work, flushed when full and in finish()).
+
     We will extend this with:
     - spec (VersionSpec)
-    - normalized/derived indexes (writer totals, publisher totals, etc.)
+    - more normalized/derived indexes (writer totals, publisher totals, etc.)
     - path tracking helpers
     """
 
     version: str
+    indexes: dict[str, DuplicateIndex] = field(default_factory=dict)
+    buffers: dict[str, list[Any]] = field(default_factory=dict)
+
+    def index(self, name: str) -> DuplicateIndex:
+        idx = self.indexes.get(name)
+        if idx is None:
+            idx = self.indexes[name] = DuplicateIndex()
+        return idx
+
+    def buffer(self, name: str) -> list[Any]:
+        buf = self.buffers.get(name)
+        if buf is None:
+            buf = self.buffers[name] = []
+        return buf
+
+    def merge(
+        self, indexes: Mapping[str, DuplicateIndex], buffers: Mapping[str, list[Any]]
+    ) -> None:
+        """Fold in the state of a traversal over later works (see validation.parallel)."""
+        for name, idx in indexes.items():
+            self.index(name).merge(idx)
+        for name, items in buffers.items():
+            self.buffer(name).extend(items)
 
 
 class Rule(Protocol):
+    """Payload-level rule, run once before the works traversal."""
+
     code: str
 
     def apply(self, report: ValidationReport, ctx: RuleContext, payload: object) -> None: ...
 
 
+class WorkRule(Protocol):
+    """
+    Per-work rule.
+
+    Instead of looping over payload["works"] itself, it is handed every work
+    object during the pack's single traversal. Items that are not objects are
+    reported by the pack and never reach work rules.
+    """
+
+    code: str
+
+    def visit_work(
+        self, report: ValidationReport, ctx: RuleContext, index: int, work: dict[str, Any]
+    ) -> None: ...
+
+
+class SPURule(Protocol):
+    """
+    Per-SPU-item rule, the visit_work of payload["spu"].
+
+    Handed every item of the array (objects or not) during the pack's single
+    pass over it, right after the payload-level rules; `finish_spu`, when
+    the rule has one, runs once that pass is over.
+    """
+
+    code: str
+
+    def visit_spu(
+        self, report: ValidationReport, ctx: RuleContext, index: int, item: Any
+    ) -> None: ...
+
+
+class BatchingRule(WorkRule, Protocol):
+    """
+    Work rule that buffers works and reports on them every `batch_size`
+    objects (and in finish()). Sharded validation cuts shards on multiples
+    of `batch_size` so such rules report in the same order as a serial run.
+    """
+
+    batch_size: int
+
+
+class FinishingRule(Protocol):
+    """Rule that reports once the traversal is over (emptiness, cross-work checks...)."""
+
+    code: str
+
+    def finish(self, report: ValidationReport, ctx: RuleContext, work_count: int) -> None: ...
+
+
+AnyRule = Rule | WorkRule | SPURule | FinishingRule
+
+
 @dataclass(frozen=True, slots=True)
 class RulePack:
     """
     A pack of rules to run in order (schema, semantics, cross-record, etc.).
+
+    A rule takes part in every phase it implements:
+      1. apply(payload)          - once, before the traversal
+         visit_spu(index, item)  - then for each SPU item, during ONE shared
+         finish_spu(count)         pass over payload["spu"], and once after it
+      2. visit_work(index, work) - for each work, during ONE shared pass
+      3. finish(work_count)      - once, after the traversal
+
+    Adding rules therefore adds work per item, never extra passes over the
+    works or spu arrays (which may be streamed from disk).
     """
 
     name: str
-    rules: list[Rule]
+    rules: Sequence[AnyRule]
+
+    _payload_rules: tuple[Rule, ...] = field(init=False, repr=False)
+    _spu_rules: tuple[SPURule, ...] = field(init=False, repr=False)
+    _work_rules: tuple[WorkRule, ...] = field(init=False, repr=False)
+    _finishing_rules: tuple[FinishingRule, ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        setattr_ = object.__setattr__
+        setattr_(self, "_payload_rules", tuple(r for r in self.rules if hasattr(r, "apply")))
+        setattr_(self, "_spu_rules", tuple(r for r in self.rules if hasattr(r, "visit_spu")))
+        setattr_(self, "_work_rules", tuple(r for r in self.rules if hasattr(r, "visit_work")))
+        setattr_(self, "_finishing_rules", tuple(r for r in self.rules if hasattr(r, "finish")))
+
+    @property
+    def work_rules(self) -> tuple[WorkRule, ...]:
+        return self._work_rules
 
     def run(self, report: ValidationReport, ctx: RuleContext, payload: object) -> None:
-        for r in self.rules:
+        works = self.apply(report, ctx, payload)
+        if works is None:
+            return
+        self.finish(report, ctx, self.traverse(report, ctx, works))
+
+    def apply(
+        self, report: ValidationReport, ctx: RuleContext, payload: object
+    ) -> Iterable[Any] | None:
+        """Phase 1: payload rules and the SPU pass; returns the works array, if any."""
+        for r in self._payload_rules:
             r.apply(report, ctx, payload)
+        if not isinstance(payload, Mapping):
+            return None
+
+        spu = payload.get("spu")
+        if self._spu_rules and is_array(spu):
+            self._traverse_spu(report, ctx, cast(Iterable[Any], spu))
+
+        works = payload.get("works")
+        return cast(Iterable[Any], works) if is_array(works) else None
+
+    def _traverse_spu(self, report: ValidationReport, ctx: RuleContext, spu: Iterable[Any]) -> None:
+        visitors = [r.visit_spu for r in self._spu_rules]
+        n = 0
+        for n, item in enumerate(spu, 1):
+            for visit in visitors:
+                visit(report, ctx, n - 1, item)
+        for r in self._spu_rules:
+            finish_spu = getattr(r, "finish_spu", None)
+            if finish_spu is not None:
+                finish_spu(report, ctx, n)
+
+    def finish(self, report: ValidationReport, ctx: RuleContext, work_count: int) -> None:
+        """Phase 3: finishing rules, once every work has been visited."""
+        for f in self._finishing_rules:
+            f.finish(report, ctx, work_count)
+
+    def traverse(
+        self,
+        report: ValidationReport,
+        ctx: RuleContext,
+        works: Iterable[Any],
+        start: int = 0,
+    ) -> int:
+        """Dispatch each work to every work rule in a single pass; returns items seen."""
+        visitors = [r.visit_work for r in self._work_rules]
+        n = 0
+        for i, work in enumerate(works, start):
+            n += 1
+            if not isinstance(work, dict):
+                add_issue(
+                    report,
+                    code="SCHEMA.WORK.NOT_OBJECT",
+                    severity=Severity.ERROR,
+                    message="Each work must be an object.",
+                    path="/works",
+                    index=i,
+                )
+                continue
+            for visit in visitors:
+                visit(report, ctx, i, work)
+        return n
 
 
 def add_issue(
@@ -46,13 +256,8 @@ def add_issue(
     code: str,
     severity: Severity,
     message: str,
-    pointer: Pointer | None = None,
+    path: str | None = None,
+    index: int | None = None,
+    context: dict[str, Any] | None = None,
 ) -> None:
-    report.add(
-        ValidationIssue(
-            code=code,
-            severity=severity,
-            message=message,
-            pointer=pointer or Pointer(),
-        )
-    )
+    report.add_issue(code, severity, message, path=path, index=index, context=context)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from cwr_tool.format.charset import find_invalid, is_cwr_text
+from cwr_tool.reporting.models import Severity, ValidationReport
+from cwr_tool.validation.rules.base import RuleContext
+
+# Work fields that end up in records (alternate_titles is checked per item).
+WORK_TEXT_FIELDS = ("title", "submitter_work_number", "language_code", "comment")
+
+
+def _check(
+    report: ValidationReport,
+    code: str,
+    section: str,
+    index: int,
+    name: str,
+    value: object,
+    item: int | None = None,
+) -> None:
+    # Fast path: most values are plain ASCII already. Surrounding whitespace
+    # is stripped before rendering, so it does not count.
+    if not isinstance(value, str) or is_cwr_text(value):
+        return
+    found = find_invalid(value.strip())
+    if found is None:
+        return
+    position, char = found
+    context: dict[str, Any] = {"char": char, "position": position}
+    if item is not None:
+        context["item"] = item
+    report.add_issue(
+        code,
+        Severity.ERROR,
+        f"{section} '{name}' has a character outside the CWR character set: {char!r}.",
+        path=f"/{section}/{name}",
+        index=index,
+        context=context,
+    )
+
+
+class WorkCharsetRule:
+    """Work text that cannot be transliterated to printable ASCII."""
+
+    code = "WORK.CHARSET.INVALID"
+
+    def visit_work(
+        self, report: ValidationReport, ctx: RuleContext, index: int, work: dict[str, Any]
+    ) -> None:
+        for name in WORK_TEXT_FIELDS:
+            _check(report, self.code, "works", index, name, work.get(name))
+        alts = work.get("alternate_titles")
+        if isinstance(alts, list):
+            for j, alt in enumerate(alts):
+                _check(report, self.code, "works", index, "alternate_titles", alt, item=j)
+
+
+class SPUCharsetRule:
+    """Publisher names that cannot be transliterated to printable ASCII."""
+
+    code = "SPU.CHARSET.INVALID"
+
+    def visit_spu(self, report: ValidationReport, ctx: RuleContext, index: int, item: Any) -> None:
+        if isinstance(item, Mapping):
+            _check(report, self.code, "spu", index, "publisher_name", item.get("publisher_name"))
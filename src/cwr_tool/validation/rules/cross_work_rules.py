@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from cwr_tool.reporting.models import Severity, ValidationReport
+from cwr_tool.validation.rules.base import RuleContext
+
+_NON_ALNUM = re.compile(r"[^0-9A-Z]+")
+
+# Work indexes listed in the context of a duplicate value's first issue.
+MAX_LISTED_INDEXES = 100
+
+
+def normalize_title(title: str) -> str:
+    """
+    Comparison key for titles: case, punctuation and spacing differences are
+    ignored, so "Hello, World!" and "HELLO  WORLD" collide.
+    """
+    return _NON_ALNUM.sub(" ", title.upper()).strip()
+
+
+def _report_duplicates(
+    report: ValidationReport,
+    ctx: RuleContext,
+    *,
+    index_name: str,
+    code: str,
+    severity: Severity,
+    path: str,
+    message: str,
+) -> None:
+    # One issue per work; only the first lists the other works (capped), the
+    # rest point back at it, so the report grows linearly with duplicates.
+    for key, indexes in ctx.index(index_name).duplicates():
+        first = indexes[0]
+        report.add_issue(
+            code,
+            severity,
+            message,
+            path=path,
+            index=first,
+            context={
+                "value": key,
+                "count": len(indexes),
+                "indexes": indexes[:MAX_LISTED_INDEXES],
+            },
+        )
+        for i in indexes[1:]:
+            report.add_issue(
+                code,
+                severity,
+                message,
+                path=path,
+                index=i,
+                context={"value": key, "count": len(indexes), "first": first},
+            )
+
+
+class DuplicateSubmitterWorkNumberRule:
+    code = "WORK.SUBMITTER_WORK_NUMBER.DUPLICATE"
+
+    def visit_work(
+        self, report: ValidationReport, ctx: RuleContext, index: int, work: dict[str, Any]
+    ) -> None:
+        swn = work.get("submitter_work_number")
+        if isinstance(swn, str) and swn.strip():
+            ctx.index("swk").add(swn.strip(), index)
+
+    def finish(self, report: ValidationReport, ctx: RuleContext, work_count: int) -> None:
+        _report_duplicates(
+            report,
+            ctx,
+            index_name="swk",
+            code=self.code,
+            severity=Severity.ERROR,
+            path="/works/submitter_work_number",
+            message="submitter_work_number is used by more than one work.",
+        )
+
+
+class DuplicateTitleLanguageRule:
+    code = "WORK.TITLE.DUPLICATE"
+
+    def visit_work(
+        self, report: ValidationReport, ctx: RuleContext, index: int, work: dict[str, Any]
+    ) -> None:
+        title = work.get("title")
+        if not isinstance(title, str):
+            return
+        key = normalize_title(title)
+        if not key:
+            return
+        lang = work.get("language_code")
+        lang = lang.strip().upper() if isinstance(lang, str) and lang.strip() else "EN"
+        ctx.index("title_lang").add(f"{key}|{lang}", index)
+
+    def finish(self, report: ValidationReport, ctx: RuleContext, work_count: int) -> None:
+        _report_duplicates(
+            report,
+            ctx,
+            index_name="title_lang",
+            code=self.code,
+            severity=Severity.WARNING,
+            path="/works/title",
+            message="Another work has the same title and language.",
+        )
+
+
+class AltTitleSameAsTitleRule:
+    code = "WORK.ALT_TITLE.SAME_AS_TITLE"
+
+    def visit_work(
+        self, report: ValidationReport, ctx: RuleContext, index: int, work: dict[str, Any]
+    ) -> None:
+        title = work.get("title")
+        alts = work.get("alternate_titles")
+        if not isinstance(title, str) or not isinstance(alts, list):
+            return
+        key = normalize_title(title)
+        for alt in alts:
+            if isinstance(alt, str) and normalize_title(alt) == key:
+                report.add_issue(
+                    self.code,
+                    Severity.WARNING,
+                    "Alternate title repeats the work title.",
+                    path="/works/alternate_titles",
+                    index=index,
+                    context={"value": alt},
+                )
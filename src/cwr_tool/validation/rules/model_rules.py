@@ -0,0 +1,240 @@
+"""
+Field checks derived from the input models (models/input.py).
+
+Two interchangeable implementations of the same contract:
+- Model*Rule: Pydantic validation (TypeAdapter over batches of items)
+- Compiled*Rule: plain isinstance/len checks compiled once from the model's
+  fields, for large payloads where Pydantic's per-object cost dominates
+
+Both report SCHEMA.<SECTION>.FIELD_INVALID issues with the Pydantic error
+type ("string_type", "missing", ...) in context, one per item and field.
+Fields that have a dedicated rule (title, submitter_work_number: see
+schema_rules) are left to that rule, so no problem is reported twice.
+"""
+
+from __future__ import annotations
+
+import types
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from typing import Any, Union, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from cwr_tool.ingest.json_stream import is_array
+from cwr_tool.models.input import SPUInput, WorkInput
+from cwr_tool.reporting.models import Severity, ValidationReport
+from cwr_tool.validation.rules.base import RuleContext, add_issue
+
+BATCH_SIZE = 1000
+
+# Checked by schema_rules (with a stricter "not blank" test)
+RULE_FIELDS = frozenset({"title", "submitter_work_number"})
+
+# item -> [(field, error type)], at most one entry per field
+FieldChecker = Callable[[Any], list[tuple[str, str]]]
+_ValueCheck = Callable[[Any], str | None]
+
+
+def _check_str(min_length: int) -> _ValueCheck:
+    def check(value: Any) -> str | None:
+        if not isinstance(value, str):
+            return "string_type"
+        if len(value) < min_length:
+            return "string_too_short"
+        return None
+
+    return check
+
+
+def _compile_value(annotation: Any, metadata: Iterable[Any], field: str) -> _ValueCheck:
+    # Field(min_length=...) puts an annotated_types.MinLen in the metadata
+    min_length = max(
+        (m.min_length for m in metadata if isinstance(getattr(m, "min_length", None), int)),
+        default=0,
+    )
+    origin = get_origin(annotation)
+
+    if annotation is str:
+        return _check_str(min_length)
+
+    if origin in (Union, types.UnionType):
+        options = [a for a in get_args(annotation) if a is not type(None)]
+        if len(options) != 1 or len(options) == len(get_args(annotation)):
+            raise TypeError(f"{field}: only `X | None` unions can be compiled")
+        inner = _compile_value(options[0], metadata, field)
+        return lambda value: None if value is None else inner(value)
+
+    if origin is list:
+        (item_type,) = get_args(annotation)
+        item = _compile_value(item_type, (), field)
+
+        def check_list(value: Any) -> str | None:
+            if not isinstance(value, list):
+                return "list_type"
+            for v in value:
+                err = item(v)
+                if err is not None:
+                    return err
+            return None
+
+        return check_list
+
+    if origin is dict or annotation is dict:
+        return lambda value: None if isinstance(value, dict) else "dict_type"
+
+    raise TypeError(f"{field}: cannot compile a check for {annotation!r}")
+
+
+def compile_checker(model: type[BaseModel], *, skip: frozenset[str] = frozenset()) -> FieldChecker:
+    """
+    Build a FieldChecker equivalent to validating one item against `model`
+    (lax Python mode, JSON-like input), restricted to the fields not in `skip`.
+
+    Raises TypeError at compile time for annotations it does not support, so
+    a model change cannot silently weaken the fast path.
+    """
+    checks: list[tuple[str, bool, _ValueCheck]] = [
+        (name, info.is_required(), _compile_value(info.annotation, info.metadata, name))
+        for name, info in model.model_fields.items()
+        if name not in skip
+    ]
+
+    def check(item: Any) -> list[tuple[str, str]]:
+        if not isinstance(item, Mapping):
+            return [("", "model_type")]
+        errors: list[tuple[str, str]] = []
+        for name, required, check_value in checks:
+            if name not in item:
+                if required:
+                    errors.append((name, "missing"))
+                continue
+            err = check_value(item[name])
+            if err is not None:
+                errors.append((name, err))
+        return errors
+
+    return check
+
+
+def model_errors(
+    adapter: TypeAdapter[Any], items: list[Any], *, skip: frozenset[str] = frozenset()
+) -> Iterator[tuple[int, str, str]]:
+    """
+    Validate `items` in one TypeAdapter call; yield (position, field, error
+    type), first error per item and field, fields in `skip` left out.
+    """
+    try:
+        adapter.validate_python(items)
+    except ValidationError as e:
+        seen: set[tuple[int, str]] = set()
+        for err in e.errors(include_url=False, include_context=False, include_input=False):
+            loc = err["loc"]
+            pos = int(loc[0])
+            name = str(loc[1]) if len(loc) > 1 else ""
+            if name in skip or (pos, name) in seen:
+                continue
+            seen.add((pos, name))
+            yield pos, name, err["type"]
+
+
+def _report(report: ValidationReport, section: str, index: int, name: str, error_type: str) -> None:
+    what = f"'{name}'" if name else "item"
+    report.add_issue(
+        f"SCHEMA.{section.upper()}.FIELD_INVALID",
+        Severity.ERROR,
+        f"{section} {what} does not match the input contract ({error_type}).",
+        path=f"/{section}/{name}" if name else f"/{section}",
+        index=index,
+        context={"type": error_type},
+    )
+
+
+_WORK_CHECK = compile_checker(WorkInput, skip=RULE_FIELDS)
+_SPU_CHECK = compile_checker(SPUInput)
+_WORKS_ADAPTER: TypeAdapter[list[WorkInput]] = TypeAdapter(list[WorkInput])
+_SPU_ADAPTER: TypeAdapter[list[SPUInput]] = TypeAdapter(list[SPUInput])
+
+
+SPU_CODE = "SCHEMA.SPU.FIELD_INVALID"
+
+
+class _SPUArrayRule:
+    """Reports a "spu" that is not an array; the pack only visits arrays."""
+
+    code = SPU_CODE
+
+    def apply(self, report: ValidationReport, ctx: RuleContext, payload: object) -> None:
+        if isinstance(payload, Mapping) and "spu" in payload:
+            spu = payload["spu"]
+            if spu is not None and not is_array(spu):
+                add_issue(
+                    report,
+                    code=self.code,
+                    severity=Severity.ERROR,
+                    message="'spu' must be an array.",
+                    path="/spu",
+                    context={"type": "list_type"},
+                )
+
+
+class CompiledWorkFieldsRule:
+    code = "SCHEMA.WORKS.FIELD_INVALID"
+
+    def visit_work(
+        self, report: ValidationReport, ctx: RuleContext, index: int, work: dict[str, Any]
+    ) -> None:
+        for name, error_type in _WORK_CHECK(work):
+            _report(report, "works", index, name, error_type)
+
+
+class ModelWorkFieldsRule:
+    """Pydantic-validated works, `batch_size` at a time (see RuleContext.buffers)."""
+
+    code = "SCHEMA.WORKS.FIELD_INVALID"
+    batch_size = BATCH_SIZE
+
+    def visit_work(
+        self, report: ValidationReport, ctx: RuleContext, index: int, work: dict[str, Any]
+    ) -> None:
+        buf = ctx.buffer("model_works")
+        buf.append((index, work))
+        if len(buf) >= self.batch_size:
+            self._flush(report, buf)
+
+    def finish(self, report: ValidationReport, ctx: RuleContext, work_count: int) -> None:
+        self._flush(report, ctx.buffer("model_works"))
+
+    def _flush(self, report: ValidationReport, buf: list[tuple[int, dict[str, Any]]]) -> None:
+        if not buf:
+            return
+        works = [w for _i, w in buf]
+        for pos, name, error_type in model_errors(_WORKS_ADAPTER, works, skip=RULE_FIELDS):
+            _report(report, "works", buf[pos][0], name, error_type)
+        buf.clear()
+
+
+class CompiledSPUFieldsRule(_SPUArrayRule):
+    def visit_spu(self, report: ValidationReport, ctx: RuleContext, index: int, item: Any) -> None:
+        for name, error_type in _SPU_CHECK(item):
+            _report(report, "spu", index, name, error_type)
+
+
+class ModelSPUFieldsRule(_SPUArrayRule):
+    """Pydantic-validated SPU items, BATCH_SIZE at a time (see RuleContext.buffers)."""
+
+    def visit_spu(self, report: ValidationReport, ctx: RuleContext, index: int, item: Any) -> None:
+        buf = ctx.buffer("model_spu")
+        buf.append(item)
+        if len(buf) >= BATCH_SIZE:
+            self._flush(report, buf, index + 1 - len(buf))
+
+    def finish_spu(self, report: ValidationReport, ctx: RuleContext, count: int) -> None:
+        buf = ctx.buffer("model_spu")
+        self._flush(report, buf, count - len(buf))
+
+    def _flush(self, report: ValidationReport, buf: list[Any], start: int) -> None:
+        if not buf:
+            return
+        for pos, name, error_type in model_errors(_SPU_ADAPTER, buf):
+            _report(report, "spu", start + pos, name, error_type)
+        buf.clear()
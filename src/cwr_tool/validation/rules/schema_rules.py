@@ -1,72 +1,77 @@
 from __future__ import annotations
 
-from cwr_tool.reporting.models import Pointer, Severity, ValidationReport
+from collections.abc import Mapping
+from typing import Any
+
+from cwr_tool.ingest.json_stream import is_array
+from cwr_tool.reporting.models import Severity, ValidationReport
 from cwr_tool.validation.rules.base import RuleContext, add_issue
 
 
+def _works_missing(report: ValidationReport) -> None:
+    add_issue(
+        report,
+        code=WorksRequiredRule.code,
+        severity=Severity.ERROR,
+        message="Input must include a non-empty 'works' array.",
+        path="/works",
+    )
+
+
 class WorksRequiredRule:
     code = "SCHEMA.WORKS.MISSING"
 
     def apply(self, report: ValidationReport, ctx: RuleContext, payload: object) -> None:
-        if not isinstance(payload, dict):
+        if not isinstance(payload, Mapping):
             add_issue(
                 report,
                 code="SCHEMA.PAYLOAD.NOT_OBJECT",
                 severity=Severity.ERROR,
                 message="Top-level payload must be an object.",
-                pointer=Pointer(path="/"),
+                path="/",
             )
             return
 
-        works = payload.get("works")
-        if not isinstance(works, list) or len(works) == 0:
+        if not is_array(payload.get("works")):
+            _works_missing(report)
+
+    def finish(self, report: ValidationReport, ctx: RuleContext, work_count: int) -> None:
+        # Emptiness is only known after the traversal when works are streamed.
+        if work_count == 0:
+            _works_missing(report)
+
+
+class TitleRequiredRule:
+    code = "WORK.TITLE.REQUIRED"
+
+    def visit_work(
+        self, report: ValidationReport, ctx: RuleContext, index: int, work: dict[str, Any]
+    ) -> None:
+        title = work.get("title")
+        if not isinstance(title, str) or not title.strip():
             add_issue(
                 report,
                 code=self.code,
                 severity=Severity.ERROR,
-                message="Input must include a non-empty 'works' array.",
-                pointer=Pointer(path="/works"),
+                message="Work title is required.",
+                path="/works/title",
+                index=index,
             )
 
 
-class WorkFieldsRule:
-    code = "SCHEMA.WORK.FIELD"
-
-    def apply(self, report: ValidationReport, ctx: RuleContext, payload: object) -> None:
-        if not isinstance(payload, dict):
-            return
+class SubmitterWorkNumberRequiredRule:
+    code = "WORK.SUBMITTER_WORK_NUMBER.REQUIRED"
 
-        works = payload.get("works")
-        if not isinstance(works, list):
-            return
-
-        for i, w in enumerate(works):
-            if not isinstance(w, dict):
-                add_issue(
-                    report,
-                    code="SCHEMA.WORK.NOT_OBJECT",
-                    severity=Severity.ERROR,
-                    message="Each work must be an object.",
-                    pointer=Pointer(path="/works", index=i),
-                )
-                continue
-
-            title = w.get("title")
-            if not isinstance(title, str) or not title.strip():
-                add_issue(
-                    report,
-                    code="WORK.TITLE.REQUIRED",
-                    severity=Severity.ERROR,
-                    message="Work title is required.",
-                    pointer=Pointer(path="/works/title", index=i),
-                )
-
-            swn = w.get("submitter_work_number")
-            if not isinstance(swn, str) or not swn.strip():
-                add_issue(
-                    report,
-                    code="WORK.SUBMITTER_WORK_NUMBER.REQUIRED",
-                    severity=Severity.ERROR,
-                    message="submitter_work_number is required (string).",
-                    pointer=Pointer(path="/works/submitter_work_number", index=i),
-                )
+    def visit_work(
+        self, report: ValidationReport, ctx: RuleContext, index: int, work: dict[str, Any]
+    ) -> None:
+        swn = work.get("submitter_work_number")
+        if not isinstance(swn, str) or not swn.strip():
+            add_issue(
+                report,
+                code=self.code,
+                severity=Severity.ERROR,
+                message="submitter_work_number is required (string).",
+                path="/works/submitter_work_number",
+                index=index,
+            )
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from cwr_tool.generation.batch import (
+    BatchEntry,
+    ManifestError,
+    assign_file_sequences,
+    load_manifest,
+    load_sequence_state,
+    run_batch,
+    save_sequence_state,
+)
+
+FIXED_TIME = datetime(2026, 1, 1, 12, 30, 45, tzinfo=UTC)
+
+
+def _setup(tmp_path: Path) -> Path:
+    good = {"works": [{"title": "HELLO WORLD", "submitter_work_number": "0000000001"}]}
+    (tmp_path / "good.json").write_text(json.dumps(good), encoding="utf-8")
+    (tmp_path / "bad.json").write_text(json.dumps({"works": []}), encoding="utf-8")
+
+    manifest = {
+        "sender": "SUB",
+        "entries": [
+            {"input": "good.json", "receiver": "ASC"},
+            {"input": "good.json", "receiver": "BMI", "version": "2.2", "file_seq": 40},
+            {"input": "good.json", "receiver": "asc"},
+            {"input": "good.json", "receiver": "BMI", "version": "2.2"},
+            {"input": "bad.json", "receiver": "PRS"},
+            {"input": "missing.json", "receiver": "PRS"},
+        ],
+    }
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps(manifest), encoding="utf-8")
+    return path
+
+
+def test_manifest_sequences_auto_increment_per_pair(tmp_path: Path) -> None:
+    entries = load_manifest(_setup(tmp_path))
+
+    assert [(e.receiver, e.file_sequence) for e in entries] == [
+        ("ASC", 1),
+        ("BMI", 40),
+        ("asc", 2),
+        ("BMI", 41),
+        ("PRS", 1),
+        ("PRS", 2),
+    ]
+    assert entries[0].input_path == tmp_path / "good.json"
+
+
+def test_sequences_are_never_reused_within_a_pair() -> None:
+    def entry(receiver: str, seq: int | None = None) -> BatchEntry:
+        return BatchEntry(input_path=Path("in.json"), receiver=receiver, file_sequence=seq)
+
+    entries = assign_file_sequences(
+        [entry("ASC"), entry("ASC", 2), entry("ASC"), entry("ASC", 1), entry("BMI", 1)]
+    )
+    # the counter steps over 2 and 1 rather than going back to them
+    assert [e.file_sequence for e in entries] == [3, 2, 4, 1, 1]
+
+    with pytest.raises(ManifestError, match="entry 2: file_seq 5 is already used for SUB->asc"):
+        assign_file_sequences([entry("ASC", 5), entry("BMI", 5), entry("asc", 5)])
+
+
+def test_stream_must_be_a_bool(tmp_path: Path) -> None:
+    manifest = {
+        "sender": "SUB",
+        "entries": [{"input": "in.json", "receiver": "ASC", "stream": "false"}],
+    }
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps(manifest), encoding="utf-8")
+
+    with pytest.raises(ManifestError, match="entry 0: stream must be true or false"):
+        load_manifest(path)
+
+
+def test_sequence_state_continues_numbering_across_runs(tmp_path: Path) -> None:
+    manifest, state_path = _setup(tmp_path), tmp_path / "seq.json"
+    assert load_sequence_state(state_path) == {}
+
+    first = run_batch(load_manifest(manifest), out_dir=tmp_path / "a", created=FIXED_TIME)
+    state = save_sequence_state(state_path, {}, first.entries)
+    # failed PRS entries do not use up a number
+    assert state == {("SUB", "ASC"): 2, ("SUB", "BMI"): 41}
+    assert json.loads(state_path.read_text(encoding="utf-8")) == {"SUB": {"ASC": 2, "BMI": 41}}
+
+    second = load_manifest(manifest, last_sequences=load_sequence_state(state_path))
+    assert [e.file_sequence for e in second] == [3, 40, 4, 42, 1, 2]
+
+
+def test_run_batch_summarises_every_entry(tmp_path: Path) -> None:
+    out_dir = tmp_path / "out"
+    summary = run_batch(load_manifest(_setup(tmp_path)), out_dir=out_dir, created=FIXED_TIME)
+
+    assert (summary.total, summary.succeeded, summary.failed, summary.ok) == (6, 4, 2, False)
+    names = sorted(p.name for p in out_dir.iterdir() if not p.name.endswith(".report.json"))
+    assert names == [
+        "CW260001SUB_ASC.V21",
+        "CW260002SUB_ASC.V21",
+        "CW260040SUB_BMI.V22",
+        "CW260041SUB_BMI.V22",
+    ]
+    assert summary.entries[4].error == "validation failed"
+    assert summary.entries[4].error_count == 1
+    assert summary.entries[5].error is not None
+
+
+def test_run_batch_parallel_matches_serial(tmp_path: Path) -> None:
+    entries = load_manifest(_setup(tmp_path))
+    serial = run_batch(entries, out_dir=tmp_path / "a", created=FIXED_TIME)
+    parallel = run_batch(entries, out_dir=tmp_path / "b", jobs=3, created=FIXED_TIME)
+
+    assert [e.ok for e in serial.entries] == [e.ok for e in parallel.entries]
+    for s, p in zip(serial.entries, parallel.entries, strict=True):
+        if s.output_path and p.output_path:
+            assert Path(s.output_path).read_bytes() == Path(p.output_path).read_bytes()
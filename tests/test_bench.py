@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import io
+from datetime import UTC, datetime
+
+import pytest
+
+from cwr_tool.bench.catalogue import CatalogueShape, synthesize_payload
+from cwr_tool.bench.runner import compare_reports, run_benchmark
+from cwr_tool.generation.writer import write_minimal_wrk_file
+from cwr_tool.validation.engine import validate_minimal
+
+STAGES = [
+    "validate_minimal",
+    "build_groups",
+    "render_group",
+    "join_records",
+    "write",
+    "write_minimal_wrk_file",
+]
+
+
+@pytest.mark.parametrize(
+    "shape",
+    [
+        CatalogueShape(works=25, alt_titles=2, comment_every=4, spu=3),
+        CatalogueShape(works=10, alt_titles=0, comment_every=0, spu=0),
+    ],
+)
+def test_synthetic_payload_is_valid_and_sized(shape: CatalogueShape) -> None:
+    payload = synthesize_payload(shape)
+    assert validate_minimal(payload).ok
+
+    buf = io.StringIO()
+    rectotal = write_minimal_wrk_file(
+        payload, buf, sender="SUB", receiver="000", now=datetime(2026, 1, 1, tzinfo=UTC)
+    )
+    assert rectotal == shape.record_count() == buf.getvalue().count("\r\n")
+
+
+def test_every_stage_is_reported() -> None:
+    shape = CatalogueShape(works=50, spu=5)
+    report = run_benchmark(shape, output_format="fixedwidth", repeat=2)
+
+    assert [s.name for s in report.stages] == STAGES
+    assert all(s.records == shape.record_count() for s in report.stages)
+    assert report.stages[-1].bytes > 0
+    assert report.shape["works"] == 50
+    if report.peak_rss_mib is not None:
+        # process-wide peaks, read as the run went on
+        assert all(0 < (s.process_peak_rss_mib or 0) <= report.peak_rss_mib for s in report.stages)
+
+    rows = compare_reports(report, report)
+    assert [r[0] for r in rows] == STAGES
+    assert all(r[3] == 0.0 for r in rows)
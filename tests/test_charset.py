@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+import subprocess
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cwr_tool.format.charset import TRANSLITERATION, find_invalid, is_cwr_text, to_cwr_text
+from cwr_tool.generation.control_records import HDRRecord
+from cwr_tool.generation.pipeline import generate_cwr_to_path
+from cwr_tool.validation.engine import ValidationMode, validate_minimal
+
+PAYLOAD: dict[str, Any] = {
+    "works": [
+        {
+            "title": "CAFÉ DEL MAR",
+            "submitter_work_number": "0000000001",
+            "alternate_titles": ["DON’T STOP — LIVE"],
+            "comment": "Ærø “remix”",
+        }
+    ],
+    "spu": [{"publisher_name": "ÉDITIONS ŁÓDŹ"}],
+}
+
+
+def test_transliteration() -> None:
+    assert to_cwr_text("Café Ærø Straße “Don’t” — x…") == 'Cafe AEro Strasse "Don\'t" - x...'
+    assert to_cwr_text("plain") == "plain"
+    assert all(is_cwr_text(v) for v in TRANSLITERATION.values())
+    # spacing accents are not turned into spaces
+    assert ord("¨") not in TRANSLITERATION
+    assert find_invalid("Zoë 中") == (4, "中")
+    assert find_invalid("a\tb") == (1, "\t")
+    assert find_invalid("Zoë") is None
+
+
+@pytest.mark.parametrize("output_format", ["kv", "fixedwidth"])
+def test_accented_payload_renders_transliterated(tmp_path: Path, output_format: str) -> None:
+    report, path, _name = generate_cwr_to_path(
+        PAYLOAD, "2.1", "SUB", "ASC", 1, out_dir=tmp_path, output_format=output_format
+    )
+
+    assert report.ok, report.issues
+    assert path is not None
+    text = path.read_bytes().decode("ascii")
+    for expected in ("CAFE DEL MAR", "DON'T STOP - LIVE", 'AEro "remix"', "EDITIONS LODZ"):
+        assert expected in text
+
+
+@pytest.mark.parametrize("mode", [ValidationMode.STRICT, ValidationMode.FAST])
+def test_untranslatable_characters_are_reported_per_work(mode: ValidationMode) -> None:
+    payload = {
+        "works": [
+            {"title": "FINE", "submitter_work_number": "1"},
+            {"title": "東京", "submitter_work_number": "2", "alternate_titles": ["OK", "A\x07"]},
+        ],
+        "spu": [{"publisher_name": "ACME 🎵"}],
+    }
+
+    report = validate_minimal(payload, mode=mode)
+
+    assert not report.ok
+    found = [
+        (i.code, i.pointer.path, i.pointer.index, i.context)
+        for i in report.issues
+        if i.code.endswith("CHARSET.INVALID")
+    ]
+    assert found == [
+        ("SPU.CHARSET.INVALID", "/spu/publisher_name", 0, {"char": "🎵", "position": 5}),
+        ("WORK.CHARSET.INVALID", "/works/title", 1, {"char": "東", "position": 0}),
+        (
+            "WORK.CHARSET.INVALID",
+            "/works/alternate_titles",
+            1,
+            {"char": "\x07", "position": 1, "item": 1},
+        ),
+    ]
+
+
+@pytest.mark.parametrize("output_format", ["kv", "fixedwidth"])
+@pytest.mark.parametrize("title", ["LINE\nBREAK", "TAB\tBED", "CARRIAGE\rRETURN"])
+def test_control_characters_never_reach_the_file(
+    tmp_path: Path, output_format: str, title: str
+) -> None:
+    payload = {"works": [{"title": title, "submitter_work_number": "1"}]}
+    assert not validate_minimal(payload).ok
+
+    # trusted mode skips the rules; rendering still refuses the line
+    with pytest.raises(ValueError, match="outside the CWR character set"):
+        generate_cwr_to_path(
+            payload,
+            "2.1",
+            "SUB",
+            "ASC",
+            1,
+            out_dir=tmp_path,
+            output_format=output_format,
+            validation_mode="trusted",
+        )
+    assert not list(tmp_path.glob("*.V21"))
+
+
+def test_kv_header_goes_through_the_line_check() -> None:
+    created = datetime(2026, 1, 1, tzinfo=UTC)
+    assert HDRRecord("SÜB", "ASC", "2.1", created).render().startswith("HDR SENDER=SUB ")
+    with pytest.raises(ValueError, match="HDR: character outside"):
+        HDRRecord("S\tB", "ASC", "2.1", created).render()
+
+
+def test_cli_generate_reports_the_work_instead_of_failing_late(tmp_path: Path) -> None:
+    p = tmp_path / "in.json"
+    bad = {"works": [*PAYLOAD["works"], {"title": "東京", "submitter_work_number": "2"}]}
+    p.write_text(json.dumps(bad), encoding="utf-8")
+    out = tmp_path / "out.cwr"
+
+    proc = subprocess.run(
+        [".venv/bin/cwr-tool", "generate", str(p), "-o", str(out)],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert proc.returncode == 2, proc.stderr
+    assert "UnicodeEncodeError" not in proc.stderr
+    assert not out.exists()
+    report = json.loads(proc.stdout)
+    assert [(i["code"], i["pointer"]["index"]) for i in report["issues"]] == [
+        ("WORK.CHARSET.INVALID", 1)
+    ]
@@ -65,3 +65,83 @@ def test_cli_generate_smoke(tmp_path: Path) -> None:
     assert lines[4].startswith("COM")
     assert lines[5].startswith("GRT")
     assert lines[6].startswith("TRL")
+
+
+def test_cli_generate_stream_smoke(tmp_path: Path) -> None:
+    payload = {"works": [{"title": "HELLO WORLD", "submitter_work_number": "0000000001"}]}
+    p = tmp_path / "in.json"
+    p.write_text(json.dumps(payload), encoding="utf-8")
+
+    out = tmp_path / "out.V21"
+
+    proc = subprocess.run(
+        [".venv/bin/cwr-tool", "generate", str(p), "--out", str(out), "--stream"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert proc.returncode == 0
+    lines = [ln for ln in out.read_text(encoding="ascii").splitlines() if ln]
+    assert [ln[:3] for ln in lines] == ["HDR", "GRH", "NWR", "GRT", "TRL"]
+
+
+def test_cli_generate_fixedwidth_smoke(tmp_path: Path) -> None:
+    payload = {"works": [{"title": "HELLO WORLD", "submitter_work_number": "0000000001"}]}
+    p = tmp_path / "in.json"
+    p.write_text(json.dumps(payload), encoding="utf-8")
+
+    out = tmp_path / "out.V22"
+
+    proc = subprocess.run(
+        [".venv/bin/cwr-tool", "generate", str(p), "--out", str(out), "-v", "2.2"]
+        + ["--format", "fixedwidth"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert proc.returncode == 0
+    lines = out.read_bytes().decode("ascii").split("\r\n")[:-1]
+    assert [len(ln) for ln in lines] == [167, 28, 260, 37, 24]
+
+
+def test_cli_parse_smoke(tmp_path: Path) -> None:
+    out = tmp_path / "hello.V21"
+    subprocess.run(
+        [".venv/bin/cwr-tool", "hello", "--out", str(out)], check=True, capture_output=True
+    )
+
+    proc = subprocess.run(
+        [".venv/bin/cwr-tool", "parse", str(out), "--type", "NWR"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert proc.returncode == 0
+    rows = [json.loads(ln) for ln in proc.stdout.splitlines()]
+    assert [(r["line"], r["type"], r["fields"]["title"]) for r in rows] == [
+        (3, "NWR", "HELLO WORLD")
+    ]
+
+
+def test_cli_verify_smoke(tmp_path: Path) -> None:
+    out = tmp_path / "hello.V21"
+    subprocess.run(
+        [".venv/bin/cwr-tool", "hello", "--out", str(out)], check=True, capture_output=True
+    )
+
+    proc = subprocess.run(
+        [".venv/bin/cwr-tool", "verify", str(out)], capture_output=True, text=True, check=False
+    )
+    assert proc.returncode == 0
+    assert json.loads(proc.stdout)["ok"] is True
+
+    out.write_bytes(out.read_bytes().replace(b"RECTOTAL=00000005", b"RECTOTAL=00000006"))
+    proc = subprocess.run(
+        [".venv/bin/cwr-tool", "verify", str(out)], capture_output=True, text=True, check=False
+    )
+    assert proc.returncode == 2
+    issue = json.loads(proc.stdout)["issues"][0]
+    assert (issue["code"], issue["pointer"]["line"]) == ("VERIFY.TRL.RECTOTAL_MISMATCH", 5)
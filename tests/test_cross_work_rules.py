@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from cwr_tool.validation.engine import validate_minimal
+from cwr_tool.validation.rules.cross_work_rules import MAX_LISTED_INDEXES, normalize_title
+
+
+def _issues(payload: dict[str, object]) -> list[tuple[str, int | None]]:
+    return [(i.code, i.pointer.index) for i in validate_minimal(payload).issues]
+
+
+def test_duplicate_submitter_work_numbers_point_at_every_work() -> None:
+    payload = {
+        "works": [
+            {"title": "A", "submitter_work_number": "001"},
+            {"title": "B", "submitter_work_number": "002"},
+            {"title": "C", "submitter_work_number": " 001 "},
+            {"title": "D", "submitter_work_number": "002"},
+            {"title": "E", "submitter_work_number": "001"},
+        ]
+    }
+
+    report = validate_minimal(payload)
+
+    assert not report.ok
+    assert _issues(payload) == [
+        ("WORK.SUBMITTER_WORK_NUMBER.DUPLICATE", 0),
+        ("WORK.SUBMITTER_WORK_NUMBER.DUPLICATE", 2),
+        ("WORK.SUBMITTER_WORK_NUMBER.DUPLICATE", 4),
+        ("WORK.SUBMITTER_WORK_NUMBER.DUPLICATE", 1),
+        ("WORK.SUBMITTER_WORK_NUMBER.DUPLICATE", 3),
+    ]
+    assert report.issues[0].context == {"value": "001", "count": 3, "indexes": [0, 2, 4]}
+    assert report.issues[1].context == {"value": "001", "count": 3, "first": 0}
+
+
+def test_many_duplicates_list_the_indexes_once() -> None:
+    n = MAX_LISTED_INDEXES + 50
+    payload = {"works": [{"title": f"T{i}", "submitter_work_number": "1"} for i in range(n)]}
+
+    issues = validate_minimal(payload).issues
+
+    assert len(issues) == n
+    assert issues[0].context is not None
+    assert issues[0].context["indexes"] == list(range(MAX_LISTED_INDEXES))
+    assert all(i.context == {"value": "1", "count": n, "first": 0} for i in issues[1:])
+
+
+def test_near_duplicate_titles_warn_per_language() -> None:
+    payload = {
+        "works": [
+            {"title": "Hello, World!", "submitter_work_number": "1"},
+            {"title": "HELLO  WORLD", "submitter_work_number": "2", "language_code": "en"},
+            {"title": "HELLO WORLD", "submitter_work_number": "3", "language_code": "ES"},
+        ]
+    }
+
+    report = validate_minimal(payload)
+
+    assert report.ok
+    assert _issues(payload) == [("WORK.TITLE.DUPLICATE", 0), ("WORK.TITLE.DUPLICATE", 1)]
+
+
+def test_alt_title_equal_to_title_warns() -> None:
+    payload = {
+        "works": [
+            {
+                "title": "Hello World",
+                "submitter_work_number": "1",
+                "alternate_titles": ["HELLO WORLD", "HOLA MUNDO"],
+            }
+        ]
+    }
+    assert _issues(payload) == [("WORK.ALT_TITLE.SAME_AS_TITLE", 0)]
+
+
+def test_normalize_title() -> None:
+    assert normalize_title("  it's  a-title ") == "IT S A TITLE"
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cwr_tool.generation.delta import diff_works
+from cwr_tool.generation.nwr_record import NWRRecord
+from cwr_tool.generation.pipeline import generate_delta_to_path
+from cwr_tool.generation.rev_record import REVRecord
+from cwr_tool.reporting.models import DeltaStats
+from cwr_tool.spec.registry import SpecRegistry
+
+NOW = datetime(2026, 1, 1, 12, 30, 45, tzinfo=UTC)
+
+
+def _works(*pairs: tuple[str, str]) -> dict[str, Any]:
+    return {"works": [{"title": t, "submitter_work_number": swk} for swk, t in pairs]}
+
+
+@pytest.mark.parametrize("version", ["2.1", "3.1"])
+def test_rev_renders_like_nwr_but_for_the_record_type(version: str) -> None:
+    spec = SpecRegistry.get(version)
+    fields = {"title": " TITLE ", "submitter_work_number": "1", "language_code": "fr"}
+    nwr, rev = NWRRecord(**fields), REVRecord(**fields)
+
+    assert rev.render() == "REV TITLE=TITLE SWK=1 LANG=FR"
+    assert rev.render() == "REV" + nwr.render()[3:]
+    assert rev.render_fixedwidth(spec, 4, 0) == "REV" + nwr.render_fixedwidth(spec, 4, 0)[3:]
+    with pytest.raises(ValueError, match="title is required"):
+        REVRecord(title=" ", submitter_work_number="1").render()
+
+
+def test_works_are_classified_by_submitter_work_number() -> None:
+    old = _works(("1", "A"), ("2", "B"), ("3", "C"))
+    new = _works(("2", "B CHANGED"), ("1", "A"), ("4", "D"))
+    # key order does not count as a change
+    new["works"][1] = {"submitter_work_number": "1", "title": "A"}
+
+    delta = diff_works(old, new)
+
+    assert [w["submitter_work_number"] for w in delta.new] == ["4"]
+    assert [w["title"] for w in delta.changed] == ["B CHANGED"]
+    assert delta.removed == ["3"]
+    assert delta.unchanged == 1
+
+
+def test_repeated_number_in_previous_payload_is_rejected() -> None:
+    with pytest.raises(ValueError, match="repeats submitter_work_number '1'"):
+        diff_works(_works(("1", "A"), ("1", "B")), _works())
+
+
+def _lines(path: Path) -> list[str]:
+    return path.read_bytes().decode("ascii").split("\r\n")[:-1]
+
+
+def test_delta_file_holds_only_changes_with_compact_groups(tmp_path: Path) -> None:
+    old = _works(("1", "A"), ("2", "B"))
+    new = _works(("1", "A"), ("2", "B2"))
+
+    report, path, _name = generate_delta_to_path(
+        old, new, "2.1", "SUB", "000", 1, out_dir=tmp_path, created=NOW
+    )
+
+    assert path is not None
+    assert report.delta == DeltaStats(new=0, changed=1, unchanged=1, removed=[])
+    # no new works: the REV group becomes group 1
+    assert _lines(path)[1:-1] == [
+        "GRH GROUP=00001 TYPE=REV",
+        "REV TITLE=B2 SWK=2 LANG=EN",
+        "GRT GROUP=00001 TXCOUNT=00000001 RECCOUNT=00000001",
+    ]
+
+
+def test_invalid_new_payload_writes_nothing(tmp_path: Path) -> None:
+    report, path, _name = generate_delta_to_path(
+        _works(("1", "A")), _works(("1", "")), "2.1", "SUB", "000", 1, out_dir=tmp_path
+    )
+    assert path is None
+    assert not report.ok
+    assert report.delta is None
+    assert list(tmp_path.iterdir()) == []
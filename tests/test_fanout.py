@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import subprocess
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from cwr_tool.generation.pipeline import generate_cwr_fanout, generate_cwr_to_path
+from cwr_tool.reporting.metrics import Metrics
+from cwr_tool.reporting.models import GenerationReport
+
+FIXED_TIME = datetime(2026, 1, 1, 12, 30, 45, tzinfo=UTC)
+
+PAYLOAD = {
+    "works": [
+        {
+            "title": "HELLO WORLD",
+            "submitter_work_number": "0000000001",
+            "alternate_titles": ["HELLO AGAIN"],
+            "comment": "NOTE",
+        },
+        {"title": "SECOND WORK", "submitter_work_number": "0000000002"},
+    ],
+    "spu": [{"publisher_name": "ACME PUBLISHING"}],
+}
+
+
+@pytest.mark.parametrize("output_format", ["kv", "fixedwidth"])
+def test_each_file_matches_a_single_receiver_run(tmp_path: Path, output_format: str) -> None:
+    report, written = generate_cwr_fanout(
+        payload=PAYLOAD,
+        cwr_version="2.2",
+        sender="SUB",
+        receivers=["ASC", "BMI", "PRS"],
+        file_sequence=3,
+        out_dir=tmp_path / "fan",
+        created=FIXED_TIME,
+        output_format=output_format,
+    )
+
+    assert report.ok
+    assert list(written) == ["ASC", "BMI", "PRS"]
+    assert sorted(p.name for p in (tmp_path / "fan").iterdir()) == [
+        "CW260003SUB_ASC.V22",
+        "CW260003SUB_BMI.V22",
+        "CW260003SUB_PRS.V22",
+    ]
+    for receiver, path in written.items():
+        _report, single, _name = generate_cwr_to_path(
+            payload=PAYLOAD,
+            cwr_version="2.2",
+            sender="SUB",
+            receiver=receiver,
+            file_sequence=3,
+            out_dir=tmp_path / receiver,
+            created=FIXED_TIME,
+            output_format=output_format,
+        )
+        assert single is not None
+        assert path.read_bytes() == single.read_bytes()
+
+
+def test_invalid_payload_writes_nothing(tmp_path: Path) -> None:
+    report, written = generate_cwr_fanout(
+        payload={"works": [{"title": "", "submitter_work_number": "1"}]},
+        cwr_version="2.1",
+        sender="SUB",
+        receivers=["ASC", "BMI"],
+        file_sequence=1,
+        out_dir=tmp_path,
+    )
+
+    assert not report.ok
+    assert written == {}
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_receivers_must_be_distinct(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="duplicate"):
+        generate_cwr_fanout(PAYLOAD, "2.1", "SUB", ["ASC", "asc "], 1, out_dir=tmp_path)
+    with pytest.raises(ValueError, match="at least one"):
+        generate_cwr_fanout(PAYLOAD, "2.1", "SUB", [], 1, out_dir=tmp_path)
+
+
+def test_metrics_render_once_and_count_every_copy(tmp_path: Path) -> None:
+    report, written = generate_cwr_fanout(
+        PAYLOAD, "2.1", "SUB", ["ASC", "BMI"], 1, out_dir=tmp_path, metrics=Metrics()
+    )
+
+    assert isinstance(report, GenerationReport) and report.metrics is not None
+    stages = report.metrics.stages
+    assert stages["validate"].records == 2
+    # the body (everything but HDR) is rendered and written once ...
+    assert stages["render"].records == stages["write"].records == 11
+    # ... and copied under both headers
+    assert stages["fan_out"].records == 22
+
+
+def test_cli_generate_receivers(tmp_path: Path) -> None:
+    p = tmp_path / "in.json"
+    p.write_text(json.dumps(PAYLOAD), encoding="utf-8")
+    out_dir = tmp_path / "out"
+
+    proc = subprocess.run(
+        [".venv/bin/cwr-tool", "generate", str(p), "-o", str(out_dir), "--receivers", "ASC,BMI"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert proc.returncode == 0, proc.stderr
+    files = sorted(p.name for p in out_dir.glob("*.V21"))
+    assert [f[-7:] for f in files] == ["ASC.V21", "BMI.V21"]
+    assert all((out_dir / f"{f}.report.json").exists() for f in files)
@@ -2,7 +2,14 @@ from __future__ import annotations
 
 import pytest
 
-from cwr_tool.format.fixedwidth import FieldSpec, FixedWidthError, fmt_int, fmt_text
+from cwr_tool.format.fixedwidth import (
+    FieldSpec,
+    FixedWidthError,
+    LayoutField,
+    compile_layout,
+    fmt_int,
+    fmt_text,
+)
 
 
 def test_fmt_text_left_pads_and_truncates() -> None:
@@ -31,3 +38,42 @@ def test_fmt_int_digits_only() -> None:
 def test_fmt_int_truncates_rightmost() -> None:
     spec = FieldSpec(width=3, align="right", pad="0")
     assert fmt_int("12345", spec) == "345"
+
+
+LAYOUT = [
+    LayoutField("record_type", FieldSpec(width=3), const="NWR"),
+    LayoutField("tx_seq", FieldSpec(width=8, align="right", pad="0"), numeric=True),
+    LayoutField("title", FieldSpec(width=10, required=True)),
+    LayoutField("code", FieldSpec(width=4, align="right", pad="*")),
+    LayoutField("duration", FieldSpec(width=3, align="right", pad="0"), numeric=True),
+]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        {"tx_seq": 1, "title": "HELLO", "code": "AB", "duration": "7"},
+        {"tx_seq": "123456789", "title": "  A VERY LONG TITLE  ", "code": "ABCDEF"},
+        {"tx_seq": None, "title": "X", "code": None, "duration": 12345},
+    ],
+)
+def test_compiled_layout_matches_per_field_formatting(values: dict[str, object]) -> None:
+    expected = "".join(
+        "NWR" if f.const else (fmt_int if f.numeric else fmt_text)(values.get(f.name), f.spec)  # type: ignore[arg-type]
+        for f in LAYOUT
+    )
+    layout = compile_layout(LAYOUT)
+    assert layout.render(values) == expected
+    assert len(expected) == layout.width == 28
+
+
+def test_compiled_layout_errors() -> None:
+    layout = compile_layout(LAYOUT)
+    with pytest.raises(FixedWidthError, match="title"):
+        layout.render({"title": " "})
+    with pytest.raises(FixedWidthError, match="digits"):
+        layout.render({"title": "A", "duration": "1A"})
+    with pytest.raises(FixedWidthError, match="outside the CWR character set in field code"):
+        layout.render({"title": "A", "code": "中"})
+    with pytest.raises(FixedWidthError, match=r"in field title: '\\t'"):
+        layout.render({"title": "A\tB"})
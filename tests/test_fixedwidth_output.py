@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import io
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from cwr_tool.generation.parallel import write_groups_parallel
+from cwr_tool.generation.writer import GROUP_SPECS, render_minimal_wrk_file
+from cwr_tool.spec.registry import SpecRegistry
+
+NOW = datetime(2026, 1, 1, 12, 30, 45, tzinfo=UTC)
+
+PAYLOAD: dict[str, Any] = {
+    "works": [
+        {
+            "title": "HELLO WORLD",
+            "submitter_work_number": "0000000001",
+            "alternate_titles": ["HELLO AGAIN"],
+            "comment": "NOTE",
+        },
+        {"title": "SECOND", "submitter_work_number": "0000000002", "language_code": "fr"},
+    ],
+    "spu": [{"publisher_name": "ACME MUSIC"}],
+}
+
+
+def _lines(version: str) -> list[str]:
+    text = render_minimal_wrk_file(
+        PAYLOAD,
+        sender="sub",
+        receiver="000",
+        cwr_version=version,
+        now=NOW,
+        output_format="fixedwidth",
+    )
+    assert text.endswith("\r\n")
+    return text.split("\r\n")[:-1]
+
+
+@pytest.mark.parametrize("version", ["2.1", "2.2", "3.1"])
+def test_every_line_has_its_layout_width(version: str) -> None:
+    spec = SpecRegistry.get(version)
+    lines = _lines(version)
+
+    assert [line[:3] for line in lines] == [
+        "HDR", "GRH", "NWR", "ALT", "COM", "NWR", "GRT", "GRH", "SPU", "GRT", "TRL",
+    ]  # fmt: skip
+    for line in lines:
+        assert len(line) == spec.layout(line[:3]).width
+
+
+def test_sequence_numbers_and_totals() -> None:
+    lines = _lines("2.1")
+
+    # tx_seq restarts per group; rec_seq restarts per transaction
+    body = [
+        (line[:3], line[3:11], line[11:19])
+        for line in lines
+        if line[:3] not in {"HDR", "GRH", "GRT", "TRL"}
+    ]
+    assert body == [
+        ("NWR", "00000000", "00000000"),
+        ("ALT", "00000000", "00000001"),
+        ("COM", "00000000", "00000002"),
+        ("NWR", "00000001", "00000000"),
+        ("SPU", "00000000", "00000000"),
+    ]
+
+    assert lines[0].startswith("HDRPBSUB      SUB")
+    assert lines[0][64:84] == "20260101123045202601"
+    assert lines[1] == "GRHWRK0000102.10" + " " * 12
+    assert lines[6].startswith("GRT000010000000200000004")
+    assert lines[-1] == "TRL000020000000300000011"
+
+    nwr = lines[5]
+    assert nwr[19:79].rstrip() == "SECOND"
+    assert nwr[79:81] == "FR"
+    assert nwr[81:95].rstrip() == "0000000002"
+
+
+def test_parallel_fixedwidth_matches_serial() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    spec = SpecRegistry.get("2.2")
+    works = [{"title": f"T{i}", "submitter_work_number": f"{i:010d}"} for i in range(7)]
+    payload = {"works": works}
+
+    serial = render_minimal_wrk_file(
+        payload,
+        sender="SUB",
+        receiver="000",
+        cwr_version="2.2",
+        now=NOW,
+        output_format="fixedwidth",
+    )
+    buf = io.StringIO()
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        write_groups_parallel(payload, GROUP_SPECS, buf, ex, chunk_size=3, spec=spec)
+
+    body = serial.split("\r\n", 1)[1].rsplit("TRL", 1)[0]
+    assert buf.getvalue() == body
+
+
+def test_unknown_output_format_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Unsupported output format"):
+        render_minimal_wrk_file(PAYLOAD, sender="SUB", receiver="000", output_format="xml")
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import io
+import json
+import subprocess
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cwr_tool.reporting.models import (
+    IssueLimits,
+    IssueStore,
+    Pointer,
+    Severity,
+    ValidationIssue,
+    ValidationReport,
+)
+from cwr_tool.reporting.ndjson import write_report_ndjson
+from cwr_tool.validation.engine import MODE_RULES, ValidationMode, validate_minimal
+from cwr_tool.validation.parallel import run_sharded
+from cwr_tool.validation.rules.base import RuleContext
+
+ISSUES = [
+    ValidationIssue(
+        code="WORK.TITLE.REQUIRED",
+        severity=Severity.ERROR,
+        message="Work title is required.",
+        pointer=Pointer(path="/works/title", index=0),
+    ),
+    ValidationIssue(
+        code="VERIFY.GRT.COUNT_MISMATCH",
+        severity=Severity.WARNING,
+        message="x",
+        pointer=Pointer(record_type="GRT", field="reccount", line=7),
+        context={"expected": 3, "found": 4},
+    ),
+    ValidationIssue(code="X", severity=Severity.INFO, message="x"),
+]
+
+# every work: a duplicate number, a bad language_code, and every third one no title
+BAD: dict[str, Any] = {
+    "works": [
+        {"title": "" if i % 3 == 0 else f"T{i}", "submitter_work_number": "1", "language_code": 5}
+        for i in range(50)
+    ]
+}
+
+
+def test_store_reads_back_what_was_added() -> None:
+    store = IssueStore(ISSUES)
+
+    assert len(store) == 3
+    assert store == ISSUES
+    assert store[-1] == ISSUES[2]
+    assert store[1:] == ISSUES[1:]
+    assert [i.model_dump() for i in store] == list(store.rows())
+    with pytest.raises(IndexError):
+        store[3]
+
+
+def test_report_json_is_unchanged_and_round_trips() -> None:
+    report = ValidationReport(ok=False, issues=ISSUES)
+
+    dumped = json.loads(report.model_dump_json())
+    assert dumped["issues"] == [i.model_dump(mode="json") for i in ISSUES]
+    assert dumped["omitted"] is None
+    assert ValidationReport.model_validate_json(report.model_dump_json()).issues == ISSUES
+
+
+def test_limits_keep_the_first_issues_and_count_the_rest() -> None:
+    serial = validate_minimal(BAD)
+    per_code = validate_minimal(BAD, issue_limits=IssueLimits(per_code=2))
+    total = validate_minimal(BAD, issue_limits=IssueLimits(max_issues=5))
+
+    for report in (per_code, total):
+        assert not report.ok
+        assert len(report.issues) + sum(report.issues.omitted.values()) == len(serial.issues)
+        assert report.issues.errors == serial.issues.errors
+    assert list(total.issues) == list(serial.issues)[:5]
+    codes = [i.code for i in per_code.issues]
+    assert all(codes.count(c) == 2 for c in codes)
+    assert per_code.omitted == {c: n - 2 for c, n in _code_counts(serial).items()}
+
+
+def test_an_omitted_error_still_fails_the_report() -> None:
+    report = ValidationReport.limited(IssueLimits(max_issues=1))
+    report.add_issue("W", Severity.WARNING, "kept")
+    report.add_issue("E", Severity.ERROR, "counted only")
+
+    assert not report.ok
+    assert report.omitted == {"E": 1}
+
+
+@pytest.mark.parametrize("limits", [IssueLimits(per_code=3), IssueLimits(max_issues=20)])
+def test_sharded_validation_keeps_the_same_issues(limits: IssueLimits) -> None:
+    serial = validate_minimal(BAD, mode=ValidationMode.FAST, issue_limits=limits)
+
+    sharded = ValidationReport.limited(limits)
+    pack = MODE_RULES[ValidationMode.FAST]
+    run_sharded(pack, sharded, RuleContext(version="2.1"), BAD, workers=2, shard_size=7)
+
+    assert sharded.ok == serial.ok
+    assert list(sharded.issues) == list(serial.issues)
+    assert sharded.omitted == serial.omitted
+
+
+def test_ndjson_report() -> None:
+    report = validate_minimal(BAD, issue_limits=IssueLimits(max_issues=4))
+    out = io.StringIO()
+
+    assert write_report_ndjson(report, out) == 5
+    head, *lines = (json.loads(line) for line in out.getvalue().splitlines())
+    assert head["ok"] is False
+    assert head["issue_count"] == 4
+    assert head["omitted"] == report.omitted
+    assert lines == [i.model_dump(mode="json") for i in report.issues]
+
+
+def test_cli_validate_ndjson(tmp_path: Path) -> None:
+    p = tmp_path / "in.json"
+    p.write_text(json.dumps(BAD), encoding="utf-8")
+
+    proc = subprocess.run(
+        [".venv/bin/cwr-tool", "validate", str(p), "--ndjson", "--max-issues-per-code", "1"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert proc.returncode == 2
+    head, *lines = (json.loads(line) for line in proc.stdout.splitlines())
+    assert head["issue_count"] == len(lines) == len({line["code"] for line in lines})
+
+
+def _code_counts(report: ValidationReport) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for issue in report.issues:
+        counts[issue.code] = counts.get(issue.code, 0) + 1
+    return counts
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cwr_tool.generation.pipeline import generate_cwr_to_path
+from cwr_tool.generation.writer import render_minimal_wrk_file
+from cwr_tool.ingest import json_stream
+from cwr_tool.ingest.json_stream import JsonStreamError, StreamingPayload, iter_array
+from cwr_tool.validation.engine import ValidationMode, validate_minimal
+
+PAYLOAD = {
+    "meta": {"note": "skipped", "nested": [1, 2, {"x": [3]}]},
+    "works": [
+        {
+            "title": "HELLO WORLD",
+            "submitter_work_number": "0000000001",
+            "alternate_titles": ['HÉLLO, "WORLD"'],
+            "comment": "C" * 100,
+        },
+        {"title": "SECOND WORK", "submitter_work_number": "0000000002", "n": 123456789},
+    ],
+    "spu": [{"publisher_name": "ACME PUBLISHING"}],
+}
+
+
+def _write(tmp_path: Path, payload: object, indent: int | None = 2) -> Path:
+    p = tmp_path / "in.json"
+    p.write_text(json.dumps(payload, indent=indent, ensure_ascii=False), encoding="utf-8")
+    return p
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+def test_iter_array_matches_json_loads(tmp_path: Path, chunk_size: int) -> None:
+    p = _write(tmp_path, PAYLOAD)
+
+    assert list(iter_array(p, "works", chunk_size=chunk_size)) == PAYLOAD["works"]
+    assert list(iter_array(p, "spu", chunk_size=chunk_size)) == PAYLOAD["spu"]
+    assert list(iter_array(p, "missing", chunk_size=chunk_size)) == []
+
+
+def test_streaming_payload_validates_and_renders_like_dict(tmp_path: Path) -> None:
+    p = _write(tmp_path, PAYLOAD, indent=None)
+    streamed = StreamingPayload(p, chunk_size=16)
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+
+    assert validate_minimal(streamed) == validate_minimal(PAYLOAD)
+    assert render_minimal_wrk_file(streamed, "SUB", "000", now=now) == render_minimal_wrk_file(
+        PAYLOAD, "SUB", "000", now=now
+    )
+
+
+def test_streaming_payload_empty_works_is_reported(tmp_path: Path) -> None:
+    p = _write(tmp_path, {"works": []})
+    report = validate_minimal(StreamingPayload(p))
+    assert [i.code for i in report.issues] == ["SCHEMA.WORKS.MISSING"]
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['[{"title": "X"}]', '{"works": 5}', '{"works": [{"title": "X"}', '{"works": [1 2]}'],
+)
+def test_malformed_input_raises(tmp_path: Path, text: str) -> None:
+    p = tmp_path / "bad.json"
+    p.write_text(text, encoding="utf-8")
+    with pytest.raises(JsonStreamError):
+        list(iter_array(p, "works", chunk_size=4))
+
+
+@pytest.mark.parametrize("mode", list(ValidationMode))
+def test_streamed_arrays_are_read_once_per_pass(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mode: ValidationMode
+) -> None:
+    p = _write(tmp_path, PAYLOAD)
+    reads: list[str] = []
+    real = json_stream.iter_array
+
+    def counting(path: Path, key: str, **kw: Any) -> Iterator[Any]:
+        reads.append(key)
+        return real(path, key, **kw)
+
+    monkeypatch.setattr(json_stream, "iter_array", counting)
+
+    validate_minimal(StreamingPayload(p), mode=mode)
+    assert sorted(reads) == (["works"] if mode is ValidationMode.TRUSTED else ["spu", "works"])
+
+    reads.clear()
+    generate_cwr_to_path(
+        StreamingPayload(p), "2.1", "SUB", "ASC", 1, out_dir=tmp_path, validation_mode=mode
+    )
+    # one validation pass and one render pass; streamed works are not kept in a WorkTable
+    validated = ["works"] if mode is ValidationMode.TRUSTED else ["spu", "works"]
+    assert sorted(reads) == sorted([*validated, "spu", "works"])
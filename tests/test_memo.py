@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import io
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cwr_tool.generation import memo
+from cwr_tool.generation.memo import clear_memos, memo_stats, norm_code, norm_text, seq_line
+from cwr_tool.generation.pipeline import generate_cwr_to_path
+from cwr_tool.generation.work_table import WorkTable
+from cwr_tool.generation.writer import write_minimal_wrk_body
+from cwr_tool.reporting.metrics import Metrics
+from cwr_tool.reporting.models import GenerationReport, MemoStats
+from cwr_tool.spec.registry import SpecRegistry
+
+PUBLISHERS = ["ACME PUBLISHING", "  ÉDITIONS DU LAC ", "NORTH SONGS"]
+
+PAYLOAD: dict[str, Any] = {
+    "works": [
+        {
+            "title": f"WORK {i}",
+            "submitter_work_number": f"{i:010d}",
+            "language_code": " en ",
+            "comment": "RECORDED LIVE" if i % 2 else f"NOTE {i}",
+        }
+        for i in range(40)
+    ],
+    "spu": [{"publisher_name": PUBLISHERS[i % 3]} for i in range(60)],
+}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_memos() -> Iterator[None]:
+    clear_memos()
+    yield
+    clear_memos()
+
+
+@pytest.mark.parametrize("version", ["2.1", "2.2", "3.0", "3.1"])
+@pytest.mark.parametrize("record_type", ["SPU", "COM"])
+def test_seq_line_matches_render_row(version: str, record_type: str) -> None:
+    layout = SpecRegistry.get(version).layout(record_type)
+    values: tuple[object, ...] = (1, "ACME") if record_type == "SPU" else ("A COMMENT",)
+    assert layout.span("tx_seq") == (3, 11)
+    assert layout.span("rec_seq") == (11, 19)
+
+    for tx_seq, rec_seq in ((0, 0), (7, 2), (12345678, 99), (123456789, 100000001)):
+        assert seq_line(layout, tx_seq, rec_seq, *values) == layout.render_row(
+            [tx_seq, rec_seq, *values]
+        )
+
+
+def test_seq_line_keeps_percent_signs() -> None:
+    layout = SpecRegistry.get("2.1").layout("COM")
+    assert seq_line(layout, 3, 4, "100% LIVE %d") == layout.render_row([3, 4, "100% LIVE %d"])
+
+
+def test_memoized_body_is_unchanged_and_hits_are_counted() -> None:
+    table = WorkTable.from_works(PAYLOAD["works"])
+    memoized = io.StringIO()
+    write_minimal_wrk_body(PAYLOAD, memoized, output_format="fixedwidth", works=table)
+
+    stats = memo_stats()
+    # 60 SPU lines over 3 publishers, 40 COM lines over 21 comments
+    assert stats["lines"].misses == 3 + 21
+    assert stats["lines"].hits == 60 + 40 - 24
+    assert stats["values"].hits > 0
+
+    direct = io.StringIO()
+    memo._gate.bypass = 10**6
+    write_minimal_wrk_body(PAYLOAD, direct, output_format="fixedwidth", works=table)
+    assert memoized.getvalue() == direct.getvalue()
+
+
+def test_line_memo_steps_aside_while_it_misses() -> None:
+    layout = SpecRegistry.get("2.1").layout("SPU")
+    for i in range(memo.LINE_WINDOW):
+        seq_line(layout, i, 1, 1, f"PUBLISHER {i}")
+
+    assert memo._gate.bypass == memo.BYPASS_LINES
+    before = _line_lookups()
+    assert seq_line(layout, 5, 1, 1, "X") == layout.render_row([5, 1, 1, "X"])
+    assert _line_lookups() == before
+
+
+def test_line_gate_is_per_thread() -> None:
+    layout = SpecRegistry.get("2.1").layout("SPU")
+    memo._gate.bypass = 5
+    seen: list[int] = []
+
+    def other() -> None:
+        seen.append(memo._gate.bypass)
+        seq_line(layout, 1, 1, 1, "OTHER THREAD")
+        seen.append(memo._gate.lookups)
+
+    t = threading.Thread(target=other)
+    t.start()
+    t.join()
+
+    assert seen == [0, 1]
+    assert (memo._gate.bypass, memo._gate.lookups) == (5, 0)
+
+
+def test_equal_values_share_one_string() -> None:
+    a, b = " RECORDED LIVE", "RECORDED LIVE "
+    assert norm_text(a) == "RECORDED LIVE"
+    assert norm_text(a) is norm_text(a[:-1] + a[-1])
+    assert norm_text(b) == norm_text(a)
+    assert norm_code(" en") == "EN"
+
+    table = WorkTable.from_works(PAYLOAD["works"])
+    assert table.comments[1] is table.comments[3]
+    assert table.languages[0] is table.languages[39]
+
+
+def test_hit_rate() -> None:
+    assert MemoStats().hit_rate == 0.0
+    assert MemoStats(hits=3, misses=1).hit_rate == 0.75
+
+
+def test_metrics_report_the_run_memo_counters(tmp_path: Path) -> None:
+    generate_cwr_to_path(
+        PAYLOAD, "2.1", "SUB", "ASC", 1, out_dir=tmp_path, output_format="fixedwidth"
+    )
+
+    report, _path, _name = generate_cwr_to_path(
+        PAYLOAD,
+        "2.1",
+        "SUB",
+        "ASC",
+        2,
+        out_dir=tmp_path,
+        output_format="fixedwidth",
+        metrics=Metrics(),
+    )
+
+    assert isinstance(report, GenerationReport) and report.metrics is not None
+    lines = report.metrics.memo["lines"]
+    # everything was memoized by the first run
+    assert (lines.hits, lines.misses) == (100, 0)
+    assert lines.hit_rate == 1.0
+    assert report.model_dump(mode="json")["metrics"]["memo"]["lines"]["hit_rate"] == 1.0
+
+
+def _line_lookups() -> int:
+    stats = memo_stats()["lines"]
+    return stats.hits + stats.misses
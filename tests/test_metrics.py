@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import io
+from datetime import UTC, datetime
+from typing import Any
+
+from cwr_tool.generation.pipeline import generate_cwr_file
+from cwr_tool.reporting.metrics import NULL_METRICS, Metrics
+from cwr_tool.reporting.models import GenerationReport
+
+NOW = datetime(2026, 1, 1, 12, 30, 45, tzinfo=UTC)
+
+PAYLOAD: dict[str, Any] = {
+    "works": [
+        {"title": "A", "submitter_work_number": "1", "alternate_titles": ["B"]},
+        {"title": "C", "submitter_work_number": "2", "comment": "NOTE"},
+    ],
+    "spu": [{"publisher_name": "ACME"}],
+}
+
+
+def test_enclosing_stage_excludes_nested_stages() -> None:
+    m = Metrics()
+    with m.stage("outer", exclude=("inner",)), m.stage("inner"):
+        sum(range(200_000))
+    outer, inner = m.get("outer").seconds, m.get("inner").seconds
+    assert 0 <= outer < inner
+
+
+def test_timed_and_sink_count_records_and_bytes() -> None:
+    m = Metrics()
+    assert list(m.timed("items", "abc")) == ["a", "b", "c"]
+    buf = io.StringIO()
+    m.sink("write", buf).write("HELLO")
+
+    result = m.result()
+    assert result.stages["items"].records == 3
+    assert result.stages["write"].bytes == 5
+    assert buf.getvalue() == "HELLO"
+
+
+def test_generation_report_carries_metrics() -> None:
+    out = io.StringIO()
+    report, _text, _name = generate_cwr_file(
+        PAYLOAD, "2.1", "SUB", "000", 1, created=NOW, out=out, metrics=Metrics()
+    )
+
+    assert isinstance(report, GenerationReport) and report.metrics is not None
+    stages = report.metrics.stages
+    lines = out.getvalue().count("\r\n")
+    assert stages["validate"].records == 2
+    assert stages["render"].records == stages["write"].records == lines
+    assert stages["write"].bytes == len(out.getvalue())
+    assert stages["build_transactions"].records == 1  # SPU; works come from the WorkTable
+
+
+def test_disabled_metrics_change_nothing() -> None:
+    buf = io.StringIO()
+    assert NULL_METRICS.sink("write", buf) is buf
+    with NULL_METRICS.stage("x") as st:
+        st.records += 1
+    assert NULL_METRICS.result().stages == {}
+
+    report, text, _name = generate_cwr_file(PAYLOAD, "2.1", "SUB", "000", 1, created=NOW)
+    assert type(report) is not GenerationReport
+    assert (
+        text
+        == generate_cwr_file(PAYLOAD, "2.1", "SUB", "000", 1, created=NOW, metrics=Metrics())[1]
+    )
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import json
+import subprocess
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from cwr_tool.generation.pipeline import generate_cwr_to_path, generate_cwr_versions
+from cwr_tool.generation.versions import changed_record_types
+from cwr_tool.reporting.models import GenerationReport
+from cwr_tool.spec.registry import SpecRegistry
+
+FIXED_TIME = datetime(2026, 1, 1, 12, 30, 45, tzinfo=UTC)
+
+PAYLOAD = {
+    "works": [
+        {
+            "title": "HELLO WORLD",
+            "submitter_work_number": "0000000001",
+            "alternate_titles": ["HELLO AGAIN"],
+            "comment": "NOTE",
+        },
+        {"title": "SECOND WORK", "submitter_work_number": "0000000002"},
+    ],
+    "spu": [{"publisher_name": "ACME PUBLISHING"}],
+}
+
+VERSIONS = ["2.1", "2.2", "3.0", "3.1"]
+
+
+@pytest.mark.parametrize("output_format", ["kv", "fixedwidth"])
+def test_each_version_matches_a_single_version_run(tmp_path: Path, output_format: str) -> None:
+    report, written = generate_cwr_versions(
+        payload=PAYLOAD,
+        cwr_versions=VERSIONS,
+        sender="SUB",
+        receiver="ASC",
+        file_sequence=5,
+        out_dir=tmp_path / "multi",
+        created=FIXED_TIME,
+        output_format=output_format,
+    )
+
+    assert report.ok
+    assert [p.name for p in written.values()] == [
+        "CW260005SUB_ASC.V21",
+        "CW260005SUB_ASC.V22",
+        "CW260005SUB_ASC.V30",
+        "CW260005SUB_ASC.V31",
+    ]
+    for version, path in written.items():
+        _report, single, _name = generate_cwr_to_path(
+            payload=PAYLOAD,
+            cwr_version=version,
+            sender="SUB",
+            receiver="ASC",
+            file_sequence=5,
+            out_dir=tmp_path / version,
+            created=FIXED_TIME,
+            output_format=output_format,
+        )
+        assert single is not None
+        assert path.read_bytes() == single.read_bytes()
+
+
+def test_report_has_per_version_stats(tmp_path: Path) -> None:
+    report, written = generate_cwr_versions(
+        PAYLOAD, ["2.2", "2.1"], "SUB", "ASC", 1, out_dir=tmp_path, output_format="fixedwidth"
+    )
+
+    assert isinstance(report, GenerationReport) and report.versions is not None
+    assert list(report.versions) == ["2.2", "2.1"]
+    for version, stats in report.versions.items():
+        assert stats.records == 11
+        assert stats.bytes == written[version].stat().st_size
+        assert stats.seconds > 0
+
+
+def test_only_version_dependent_layouts_are_rerendered() -> None:
+    v21, v22, v31 = (SpecRegistry.get(v) for v in ("2.1", "2.2", "3.1"))
+    assert changed_record_types(v21, v22) == {"HDR", "GRH"}
+    assert changed_record_types(v22, v31) == {"HDR", "GRH"}
+    assert changed_record_types(v22, v22) == frozenset()
+    assert changed_record_types(None, None) == frozenset()
+
+
+def test_invalid_payload_and_bad_versions(tmp_path: Path) -> None:
+    report, written = generate_cwr_versions(
+        {"works": []}, VERSIONS, "SUB", "ASC", 1, out_dir=tmp_path
+    )
+    assert not report.ok
+    assert written == {}
+    assert list(tmp_path.iterdir()) == []
+
+    for versions, match in (([], "at least one"), (["2.1", "2.1"], "duplicate"), (["9.9"], "9.9")):
+        with pytest.raises(ValueError, match=match):
+            generate_cwr_versions(PAYLOAD, versions, "SUB", "ASC", 1, out_dir=tmp_path)
+
+
+def test_cli_generate_versions(tmp_path: Path) -> None:
+    p = tmp_path / "in.json"
+    p.write_text(json.dumps(PAYLOAD), encoding="utf-8")
+    out_dir = tmp_path / "out"
+
+    proc = subprocess.run(
+        [
+            ".venv/bin/cwr-tool",
+            "generate",
+            str(p),
+            "-o",
+            str(out_dir),
+            "-f",
+            "fixedwidth",
+            "--versions",
+            "2.1,3.1",
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert proc.returncode == 0, proc.stderr
+    assert sorted(f.suffix for f in out_dir.glob("*.V[0-9][0-9]")) == [".V21", ".V31"]
+    report = json.loads(next(out_dir.glob("*.V31.report.json")).read_text(encoding="utf-8"))
+    assert set(report["versions"]) == {"2.1", "3.1"}
+
+
+@pytest.mark.parametrize(
+    ("versions", "match"),
+    [("2.1,9.9", "Unsupported CWR version: 9.9"), ("2.1, 2.1", "repeats"), (",", "at least one")],
+)
+def test_cli_rejects_bad_versions_up_front(tmp_path: Path, versions: str, match: str) -> None:
+    p = tmp_path / "in.json"
+    p.write_text(json.dumps(PAYLOAD), encoding="utf-8")
+
+    proc = subprocess.run(
+        [".venv/bin/cwr-tool", "generate", str(p), "-o", str(tmp_path), "--versions", versions],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert proc.returncode == 2
+    assert match in proc.stderr
+    assert "Traceback" not in proc.stderr
+    assert not list(tmp_path.glob("*.V*"))
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import io
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from cwr_tool.generation.parallel import write_groups_parallel
+from cwr_tool.generation.writer import GROUP_SPECS, write_minimal_wrk_file
+
+FIXED_TIME = datetime(2026, 1, 1, 12, 30, 45, tzinfo=UTC)
+
+
+def _payload(n: int, spu: int) -> dict[str, Any]:
+    return {
+        "works": [
+            {
+                "title": f"WORK {i}",
+                "submitter_work_number": f"{i:010d}",
+                "alternate_titles": [f"ALT {i}"] * (i % 3),
+                "comment": "NOTE" if i % 5 == 0 else None,
+            }
+            for i in range(n)
+        ],
+        "spu": [{"publisher_name": f"PUB {i}"} for i in range(spu)],
+    }
+
+
+def _render(payload: dict[str, Any], **kwargs: Any) -> str:
+    buf = io.StringIO()
+    write_minimal_wrk_file(payload, buf, "SUB", "000", now=FIXED_TIME, **kwargs)
+    return buf.getvalue()
+
+
+@pytest.mark.parametrize("spu", [0, 4])
+def test_process_pool_output_is_byte_identical(spu: int) -> None:
+    payload = _payload(53, spu)
+    assert _render(payload, workers=2, chunk_size=7) == _render(payload)
+
+
+def test_chunk_totals_are_merged_in_order() -> None:
+    payload = _payload(10, 3)
+    buf = io.StringIO()
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        totals = write_groups_parallel(payload, GROUP_SPECS, buf, ex, chunk_size=3, max_pending=2)
+
+    serial = _render(payload).splitlines()
+    assert buf.getvalue().splitlines() == serial[1:-1]
+    assert totals.trailer().render() == serial[-1]
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from cwr_tool.reporting.models import ValidationReport
+from cwr_tool.validation.engine import MODE_RULES, ValidationMode, validate_minimal
+from cwr_tool.validation.parallel import aligned_shard_size, iter_shards, run_sharded
+from cwr_tool.validation.rules.base import DuplicateIndex, RuleContext
+
+
+def _messy_works(n: int) -> list[Any]:
+    works: list[Any] = []
+    for i in range(n):
+        if i % 17 == 5:
+            works.append("junk")
+            continue
+        works.append(
+            {
+                "title": f"TITLE {i % 40}" if i % 9 else "",
+                "submitter_work_number": str(i % 250),
+                "language_code": "EN" if i % 11 else 7,
+                "alternate_titles": [f"title {i % 40}"] if i % 13 == 0 else [],
+            }
+        )
+    return works
+
+
+def _dump(report: ValidationReport) -> list[dict[str, Any]]:
+    return [i.model_dump() for i in report.issues]
+
+
+@pytest.mark.parametrize("mode", list(ValidationMode))
+def test_sharded_report_equals_serial(mode: ValidationMode) -> None:
+    payload = {"works": _messy_works(700), "spu": [{}, {"publisher_name": "P"}]}
+    serial = validate_minimal(payload, mode=mode)
+
+    pack = MODE_RULES[mode]
+    sharded = ValidationReport(ok=True)
+    # tiny shards on a real pool: many merges, batched (strict) flushes mid-shard
+    run_sharded(pack, sharded, RuleContext(version="2.1"), payload, workers=3, shard_size=64)
+
+    assert sharded.ok == serial.ok
+    assert _dump(sharded) == _dump(serial)
+
+
+def test_shards_cut_on_objects_and_batch_size() -> None:
+    works = [{"a": 1}, "x", {"a": 2}, {"a": 3}, "y", {"a": 4}, {"a": 5}]
+    shards = list(iter_shards(works, 2))
+    assert [(start, len(items)) for start, items in shards] == [(0, 3), (3, 3), (6, 1)]
+
+    assert aligned_shard_size(MODE_RULES[ValidationMode.STRICT], 1500) == 2000
+    assert aligned_shard_size(MODE_RULES[ValidationMode.FAST], 1500) == 1500
+
+
+def test_duplicate_index_merge_keeps_serial_order() -> None:
+    whole, first, second = DuplicateIndex(), DuplicateIndex(), DuplicateIndex()
+    keys = ["a", "b", "a", "c", "b", "a", "d", "c"]
+    for i, k in enumerate(keys):
+        whole.add(k, i)
+        (first if i < 4 else second).add(k, i)
+    first.merge(second)
+    assert list(first.duplicates()) == list(whole.duplicates())
+
+
+def test_stateful_extra_rules_are_rejected() -> None:
+    class Visitor:
+        code = "X"
+
+        def visit_work(self, *args: Any) -> None:
+            pass
+
+    with pytest.raises(ValueError, match="parallel"):
+        validate_minimal({"works": []}, extra_rules=[Visitor()], workers=2)
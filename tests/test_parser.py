@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from cwr_tool.generation.writer import render_minimal_wrk_file
+from cwr_tool.parsing.reader import ParseError, iter_records
+
+NOW = datetime(2026, 1, 1, 12, 30, 45, tzinfo=UTC)
+
+PAYLOAD = {
+    "works": [
+        {
+            "title": "HELLO WORLD",
+            "submitter_work_number": "0000000001",
+            "alternate_titles": ["HELLO AGAIN"],
+        }
+    ],
+    "spu": [{"publisher_name": "ACME MUSIC"}],
+}
+
+
+def _write(tmp_path: Path, version: str, output_format: str) -> Path:
+    text = render_minimal_wrk_file(
+        PAYLOAD,
+        sender="SUB",
+        receiver="000",
+        cwr_version=version,
+        now=NOW,
+        output_format=output_format,
+    )
+    p = tmp_path / "in.cwr"
+    p.write_bytes(text.encode("ascii"))
+    return p
+
+
+@pytest.mark.parametrize(("version", "output_format"), [("2.1", "kv"), ("2.2", "fixedwidth")])
+def test_both_formats_expose_the_same_field_names(
+    tmp_path: Path, version: str, output_format: str
+) -> None:
+    p = _write(tmp_path, version, output_format)
+
+    seen = [(r.record_type, r.line_no, r.fields()) for r in iter_records(p)]
+
+    assert [t for t, _, _ in seen] == [
+        "HDR",
+        "GRH",
+        "NWR",
+        "ALT",
+        "GRT",
+        "GRH",
+        "SPU",
+        "GRT",
+        "TRL",
+    ]
+    assert [n for _, n, _ in seen] == list(range(1, 10))
+    nwr = seen[2][2]
+    assert nwr["title"] == "HELLO WORLD"
+    assert nwr["submitter_work_number"] == "0000000001"
+    assert nwr["language_code"] == "EN"
+    assert seen[6][2]["publisher_name"] == "ACME MUSIC"
+    assert int(seen[-1][2]["rectotal"]) == 9
+
+
+def test_single_field_access_and_lf_only_input(tmp_path: Path) -> None:
+    p = _write(tmp_path, "2.1", "fixedwidth")
+    p.write_bytes(p.read_bytes().replace(b"\r\n", b"\n").rstrip(b"\n"))
+
+    titles = []
+    types = []
+    for r in iter_records(p):
+        types.append(r.record_type)
+        if r.record_type in {"NWR", "ALT"}:
+            titles.append(r["title"])
+            assert r.get("nope") is None
+
+    assert titles == ["HELLO WORLD", "HELLO AGAIN"]
+    assert types[-1] == "TRL"
+
+
+def test_errors_name_the_line(tmp_path: Path) -> None:
+    p = tmp_path / "bad.cwr"
+    p.write_bytes(b"NWR00000000000000001HELLO\r\nGRT TXCOUNT=\xe9\r\n")
+
+    errors = []
+    for rec in iter_records(p):
+        with pytest.raises(ParseError) as e:
+            rec.fields()
+        errors.append(str(e.value))
+
+    assert errors[0] == "Line 1: fixed-width NWR before HDR"
+    assert errors[1].startswith("Line 2: non-ASCII")
+
+
+def test_empty_file_yields_nothing(tmp_path: Path) -> None:
+    p = tmp_path / "empty.cwr"
+    p.write_bytes(b"")
+    assert list(iter_records(p)) == []
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import dataclasses
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cwr_tool.format.fixedwidth import FieldSpec, LayoutField, compile_layout
+from cwr_tool.generation import cache as cache_module
+from cwr_tool.generation.cache import RenderCache, layout_digest
+from cwr_tool.generation.pipeline import generate_cwr_file
+from cwr_tool.generation.totals import GroupTotals
+from cwr_tool.reporting.models import CacheStats, GenerationReport
+from cwr_tool.spec.registry import SpecRegistry
+
+NOW = datetime(2026, 1, 1, 12, 30, 45, tzinfo=UTC)
+
+
+def _payload(*titles: str) -> dict[str, Any]:
+    return {
+        "works": [
+            {"title": t, "submitter_work_number": f"{i:010d}", "alternate_titles": [t + " ALT"]}
+            for i, t in enumerate(titles)
+        ],
+        "spu": [{"publisher_name": "ACME"}],
+    }
+
+
+def _run(payload: dict[str, Any], cache_dir: Path | None, output_format: str) -> tuple[Any, str]:
+    report, text, _name = generate_cwr_file(
+        payload,
+        cwr_version="2.2",
+        sender="SUB",
+        receiver="000",
+        file_sequence=1,
+        created=NOW,
+        output_format=output_format,
+        cache_dir=cache_dir,
+    )
+    return report, text
+
+
+@pytest.mark.parametrize("output_format", ["kv", "fixedwidth"])
+def test_unchanged_works_are_served_from_cache(tmp_path: Path, output_format: str) -> None:
+    first, text1 = _run(_payload("A", "B", "C"), tmp_path, output_format)
+    assert isinstance(first, GenerationReport)
+    assert first.cache == CacheStats(hits=0, misses=4, stored=4)
+
+    second, text2 = _run(_payload("A", "B", "C"), tmp_path, output_format)
+    assert second.cache == CacheStats(hits=4, misses=0, stored=0)
+    assert text2 == text1
+
+
+@pytest.mark.parametrize("output_format", ["kv", "fixedwidth"])
+def test_changed_and_moved_works_render_like_an_uncached_run(
+    tmp_path: Path, output_format: str
+) -> None:
+    _run(_payload("A", "B", "C"), tmp_path, output_format)
+
+    # "Z" is new and shifts every other work's transaction sequence number
+    payload = _payload("A", "B", "C")
+    payload["works"].insert(0, {"title": "Z", "submitter_work_number": "0000000099"})
+
+    report, cached = _run(payload, tmp_path, output_format)
+    _uncached_report, expected = _run(payload, None, output_format)
+
+    assert report.cache == CacheStats(hits=4, misses=1, stored=1)
+    assert cached == expected
+
+
+@pytest.mark.parametrize("output_format", ["kv", "fixedwidth"])
+def test_works_that_render_the_same_share_an_entry(tmp_path: Path, output_format: str) -> None:
+    work = {"title": "A", "submitter_work_number": "1", "language_code": "fr", "comment": "N"}
+    spaced = {
+        "title": " A ",
+        "submitter_work_number": "1 ",
+        "language_code": " FR",
+        "comment": "N ",
+    }
+    first, text1 = _run({"works": [work]}, tmp_path, output_format)
+    second, text2 = _run({"works": [spaced]}, tmp_path, output_format)
+
+    assert first.cache == CacheStats(hits=0, misses=1, stored=1)
+    assert second.cache == CacheStats(hits=1, misses=0, stored=0)
+    assert text2 == text1
+
+
+def test_render_changes_do_not_reuse_old_lines(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _run(_payload("A"), tmp_path, "fixedwidth")
+    monkeypatch.setattr(cache_module, "RENDER_SCHEMA", cache_module.RENDER_SCHEMA + 1)
+    report, _text = _run(_payload("A"), tmp_path, "fixedwidth")
+    assert report.cache == CacheStats(hits=0, misses=2, stored=2)
+
+    spec = SpecRegistry.get("2.2")
+    wider = compile_layout([*spec.layout("SPU").fields, LayoutField("x", FieldSpec(width=1))])
+    changed = dataclasses.replace(spec, layouts={**spec.layouts, "SPU": wider})
+    assert layout_digest(changed) != layout_digest(spec)
+    assert layout_digest(None) == ""
+
+
+def test_without_cache_dir_report_is_plain(tmp_path: Path) -> None:
+    report, _text = _run(_payload("A"), None, "kv")
+    assert not isinstance(report, GenerationReport)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_rows_are_inserted_as_they_come_and_only_kept_on_commit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(cache_module, "PUT_BATCH", 2)
+    cache = RenderCache(tmp_path)
+    for i in range(5):
+        cache.put(f"k{i}", f"LINE {i}\r\n", GroupTotals(txcount=1, reccount=1))
+        assert len(cache._pending) < 2
+    assert cache.get("k0") is not None
+    cache.close()
+
+    # closed without commit(): nothing was stored
+    with RenderCache(tmp_path) as cache:
+        assert cache.get("k0") is None
+        cache.put("k0", "LINE 0\r\n", GroupTotals(txcount=1, reccount=1))
+    with RenderCache(tmp_path) as cache:
+        assert cache.get("k0") == ("LINE 0\r\n", GroupTotals(txcount=1, reccount=1))
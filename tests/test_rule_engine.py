@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+from cwr_tool.reporting.models import ValidationReport
+from cwr_tool.validation.engine import MINIMAL_RULES, run_rule_pack, validate_minimal
+from cwr_tool.validation.rules.base import RuleContext, RulePack
+
+
+class CountingList(list[Any]):
+    passes = 0
+
+    def __iter__(self) -> Iterator[Any]:
+        self.passes += 1
+        return super().__iter__()
+
+
+class SeenRule:
+    def __init__(self, code: str) -> None:
+        self.code = code
+        self.seen: list[int] = []
+
+    def visit_work(
+        self, report: ValidationReport, ctx: RuleContext, index: int, work: dict[str, Any]
+    ) -> None:
+        self.seen.append(index)
+
+
+def test_hundreds_of_rules_share_one_traversal() -> None:
+    works = CountingList([{"title": "A", "submitter_work_number": "1"}, "junk", {}])
+    rules = [SeenRule(f"X{i}") for i in range(300)]
+    pack = RulePack(name="many", rules=[*MINIMAL_RULES.rules, *rules])
+
+    report = run_rule_pack(pack, {"works": works})
+
+    assert works.passes == 1
+    assert all(r.seen == [0, 2] for r in rules)
+    assert [(i.code, i.pointer.index) for i in report.issues] == [
+        ("SCHEMA.WORK.NOT_OBJECT", 1),
+        ("WORK.TITLE.REQUIRED", 2),
+        ("WORK.SUBMITTER_WORK_NUMBER.REQUIRED", 2),
+    ]
+
+
+def test_validate_minimal_reports_missing_and_blank_fields() -> None:
+    assert [i.code for i in validate_minimal({}).issues] == ["SCHEMA.WORKS.MISSING"]
+    assert [i.code for i in validate_minimal({"works": []}).issues] == ["SCHEMA.WORKS.MISSING"]
+
+    report = validate_minimal({"works": [{"title": "   ", "submitter_work_number": "1"}]})
+    assert [i.code for i in report.issues] == ["WORK.TITLE.REQUIRED"]
+    assert not report.ok
+
+
+def test_unsupported_version_stops_before_rules() -> None:
+    report = validate_minimal({}, version="9.9")
+    assert [i.code for i in report.issues] == ["SPEC.VERSION.UNSUPPORTED"]
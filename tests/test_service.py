@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cwr_tool.generation.pipeline import generate_cwr_file
+from cwr_tool.service.client import CWRClient, ServiceError
+from cwr_tool.service.server import CWRServer
+
+PAYLOAD: dict[str, Any] = {
+    "works": [
+        {"title": "HELLO WORLD", "submitter_work_number": "1", "alternate_titles": ["HI"]},
+        {"title": "SECOND", "submitter_work_number": "2"},
+    ],
+    "spu": [{"publisher_name": "ACME"}],
+}
+
+
+@pytest.fixture
+def server() -> Iterator[CWRServer]:
+    srv = CWRServer(("127.0.0.1", 0), workers=2)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield srv
+    finally:
+        srv.shutdown()
+        srv.server_close()
+        thread.join()
+
+
+def test_requests_share_one_connection(server: CWRServer) -> None:
+    with CWRClient(server.url) as client:
+        assert client.health()["ok"] is True
+        conn = client._conn
+        assert client.validate(PAYLOAD).ok
+        report = client.validate({"works": [{"title": ""}]}, mode="strict")
+        assert not report.ok
+        assert client._conn is conn
+
+
+def test_generate_matches_local_pipeline(server: CWRServer) -> None:
+    with CWRClient(server.url) as client:
+        report, data, filename = client.generate(
+            PAYLOAD, version="2.2", receiver="ABC", output_format="fixedwidth"
+        )
+    assert report.ok and data is not None
+    assert filename.startswith("CW") and filename.endswith("SUB_ABC.V22")
+
+    _report, text, _name = generate_cwr_file(
+        PAYLOAD, "2.2", "SUB", "ABC", 1, output_format="fixedwidth"
+    )
+    # the HDR carries the creation time; everything after it is identical
+    assert data.decode("ascii").split("\r\n")[1:] == text.split("\r\n")[1:]
+
+
+def test_generate_returns_the_server_report_with_its_warnings(server: CWRServer) -> None:
+    payload = {
+        "works": [
+            {"title": "SAME", "submitter_work_number": "1"},
+            {"title": "SAME", "submitter_work_number": "2"},
+        ]
+    }
+    with CWRClient(server.url) as client:
+        report, data, _name = client.generate(payload)
+
+    local, _text, _name = generate_cwr_file(payload, "2.1", "SUB", "000", 1)
+    assert report.ok and data is not None
+    assert report.parse() == local
+    assert [i["code"] for i in json.loads(report.json)["issues"]] == ["WORK.TITLE.DUPLICATE"] * 2
+
+
+def test_invalid_requests(server: CWRServer) -> None:
+    with CWRClient(server.url) as client:
+        report, data, _name = client.generate({"works": []})
+        assert data is None and not report.ok
+
+        with pytest.raises(ServiceError, match="400: Invalid JSON"):
+            client.validate(b"{not json")
+        with pytest.raises(ServiceError, match="400"):
+            client.validate(PAYLOAD, mode="lenient")
+        # the connection survives rejected requests
+        assert client.health()["ok"] is True
+
+
+def test_unreachable_server() -> None:
+    with CWRClient("http://127.0.0.1:9") as client, pytest.raises(ServiceError):
+        client.health()
+
+
+def test_cli_uses_running_server(server: CWRServer, tmp_path: Path) -> None:
+    p = tmp_path / "in.json"
+    p.write_text('{"works": [{"title": "A", "submitter_work_number": "1"}]}', encoding="utf-8")
+    out = tmp_path / "out.V21"
+
+    proc = subprocess.run(
+        [".venv/bin/cwr-tool", "generate", str(p), "-o", str(out), "--server", server.url],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert proc.returncode == 0, proc.stderr
+    assert out.read_bytes().startswith(b"HDR SENDER=SUB")
+    report = json.loads((tmp_path / "out.V21.report.json").read_text(encoding="utf-8"))
+    assert report["ok"] is True
+
+
+def test_client_does_not_load_pydantic(server: CWRServer) -> None:
+    code = (
+        "import sys\n"
+        "from cwr_tool.cli import _check_format\n"
+        "from cwr_tool.reporting.paths import report_path_for\n"
+        "from cwr_tool.service.client import CWRClient\n"
+        "_check_format('kv')\n"
+        "with CWRClient(sys.argv[1]) as client:\n"
+        "    report, data, _name = client.generate({'works': [{'title': 'A', "
+        "'submitter_work_number': '1'}]})\n"
+        "assert report.ok and data\n"
+        "print('pydantic' in sys.modules)\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code, server.url], capture_output=True, text=True, check=True
+    )
+    assert proc.stdout.strip() == "False"
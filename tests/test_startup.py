@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+# Our share of `import cwr_tool.cli` (Typer itself excluded), best of 3 runs.
+# The full stack (Pydantic, layouts, generation) costs ~200 ms; a CLI that
+# imports only what --help needs stays well under this.
+IMPORT_BUDGET_MS = 60
+
+HEAVY_MODULES = (
+    "pydantic",
+    "cwr_tool.models.input",
+    "cwr_tool.validation.engine",
+    "cwr_tool.generation.pipeline",
+    "cwr_tool.spec.registry",
+)
+
+
+def _cumulative_us(stderr: str) -> dict[str, int]:
+    out: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _self, cumulative, name = line.removeprefix("import time:").split("|")
+        if cumulative.strip().isdigit():
+            out[name.strip()] = int(cumulative)
+    return out
+
+
+def test_cli_import_does_not_load_the_heavy_stack() -> None:
+    code = "import sys, cwr_tool.cli; print(','.join(sorted(sys.modules)))"
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    loaded = set(proc.stdout.strip().split(","))
+    assert not [m for m in HEAVY_MODULES if m in loaded]
+
+
+def test_cli_import_time_budget() -> None:
+    costs = []
+    for _ in range(3):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import cwr_tool.cli"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        times = _cumulative_us(proc.stderr)
+        costs.append(times["cwr_tool.cli"] - times.get("typer", 0))
+    assert min(costs) / 1000 <= IMPORT_BUDGET_MS, f"import cwr_tool.cli took {min(costs)} us"
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import io
+from datetime import UTC, datetime
+from pathlib import Path
+
+from cwr_tool.generation.pipeline import generate_cwr_to_path
+from cwr_tool.generation.writer import render_minimal_wrk_file, write_minimal_wrk_file
+
+FIXED_TIME = datetime(2026, 1, 1, 12, 30, 45, tzinfo=UTC)
+
+PAYLOAD = {
+    "works": [
+        {
+            "title": "HELLO WORLD",
+            "submitter_work_number": "0000000001",
+            "alternate_titles": ["HELLO AGAIN"],
+            "comment": "NOTE",
+        },
+        {"title": "SECOND WORK", "submitter_work_number": "0000000002"},
+    ],
+    "spu": [{"publisher_name": "ACME PUBLISHING"}],
+}
+
+
+def test_streamed_output_matches_string_render() -> None:
+    buf = io.StringIO()
+    rectotal = write_minimal_wrk_file(
+        payload=PAYLOAD, out=buf, sender="SUB", receiver="000", now=FIXED_TIME
+    )
+
+    expected = render_minimal_wrk_file(
+        payload=PAYLOAD, sender="SUB", receiver="000", now=FIXED_TIME
+    )
+    assert buf.getvalue() == expected
+    assert rectotal == len(expected.splitlines())
+    assert expected.splitlines()[-1] == "TRL GROUPS=00002 TXTOTAL=00000003 RECTOTAL=00000011"
+
+
+def test_generate_to_path_writes_crlf_file_atomically(tmp_path: Path) -> None:
+    report, path, suggested = generate_cwr_to_path(
+        payload=PAYLOAD,
+        cwr_version="2.1",
+        sender="SUB",
+        receiver="000",
+        file_sequence=7,
+        out_dir=tmp_path,
+        created=FIXED_TIME,
+    )
+
+    assert report.ok
+    assert path == tmp_path / suggested == tmp_path / "CW260007SUB_000.V21"
+    data = path.read_bytes()
+    assert data.count(b"\r\n") == 11
+    assert b"\r\r\n" not in data
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_generate_to_path_writes_nothing_when_invalid(tmp_path: Path) -> None:
+    out = tmp_path / "out.V21"
+    report, path, _suggested = generate_cwr_to_path(
+        payload={"works": []},
+        cwr_version="2.1",
+        sender="SUB",
+        receiver="000",
+        file_sequence=1,
+        output_path=out,
+    )
+
+    assert not report.ok
+    assert path is None
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass, field
+from typing import Any
+
+from cwr_tool.generation.group_builder import (
+    GroupSpec,
+    build_groups,
+    render_group,
+    total_physical_line_count,
+    write_group,
+)
+from cwr_tool.generation.totals import FileTotals, GroupTotals
+from cwr_tool.generation.transaction import Transaction
+
+
+@dataclass
+class CountingRecord:
+    tx: int
+    calls: list[int] = field(default_factory=list)
+
+    def counts(self) -> tuple[int, int]:
+        self.calls.append(1)
+        return self.tx, 1
+
+    def render(self) -> str:
+        return "NWR" if self.tx else "ALT"
+
+
+def _specs(records: list[CountingRecord]) -> list[GroupSpec]:
+    def build(_payload: dict[str, Any]) -> list[Transaction]:
+        return [Transaction(records=[records[0], records[1]]), Transaction(records=[records[2]])]
+
+    return [GroupSpec(group_type="WRK", build_transactions=build)]
+
+
+def test_build_render_and_trailer_count_each_record_once() -> None:
+    records = [CountingRecord(tx=1), CountingRecord(tx=0), CountingRecord(tx=1)]
+
+    built = build_groups({}, _specs(records))
+    g = built[0]
+    lines, txcount, reccount = render_group(
+        group_number=g.group_number,
+        group_type=g.group_type,
+        transactions=g.transactions,
+        totals=g.totals,
+    )
+    group_lines = total_physical_line_count(built)
+
+    file_totals = FileTotals()
+    file_totals.add_group(g.group_totals())
+    trl = file_totals.trailer()
+
+    assert (txcount, reccount) == (2, 3)
+    assert lines[-1].render() == "GRT GROUP=00001 TXCOUNT=00000002 RECCOUNT=00000003"
+    assert group_lines == 5
+    assert (trl.groups, trl.txtotal, trl.rectotal) == (1, 2, 7)
+    assert [len(r.calls) for r in records] == [1, 1, 1]
+
+
+def test_write_group_accumulates_while_streaming() -> None:
+    records = [CountingRecord(tx=1), CountingRecord(tx=0), CountingRecord(tx=1)]
+    txs = iter([Transaction(records=[records[0], records[1]]), Transaction(records=[records[2]])])
+
+    buf = io.StringIO()
+    totals = write_group(buf, group_number=3, group_type="WRK", transactions=txs)
+
+    assert totals == GroupTotals(txcount=2, reccount=3)
+    assert buf.getvalue().splitlines()[-1] == "GRT GROUP=00003 TXCOUNT=00000002 RECCOUNT=00000003"
+    assert [len(r.calls) for r in records] == [1, 1, 1]
+
+
+def test_partial_totals_merge() -> None:
+    a = GroupTotals(txcount=2, reccount=5)
+    a.merge(GroupTotals(txcount=1, reccount=1))
+    assert a == GroupTotals(txcount=3, reccount=6)
+    assert a.physical_lines == 8
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from cwr_tool.generation.pipeline import generate_cwr_file
+from cwr_tool.models.input import WorkInput
+from cwr_tool.validation.engine import ValidationMode, validate_minimal
+from cwr_tool.validation.rules import model_rules
+from cwr_tool.validation.rules.model_rules import (
+    RULE_FIELDS,
+    ModelWorkFieldsRule,
+    compile_checker,
+)
+
+INVALID: dict[str, Any] = {
+    "works": [
+        {"title": "A", "submitter_work_number": "1"},
+        {
+            "title": "B",
+            "submitter_work_number": "2",
+            "language_code": 7,
+            "alternate_titles": ["OK", 3],
+            "comment": None,
+        },
+        {"title": "C", "submitter_work_number": "3", "language_code": "", "extra": []},
+        {"title": "D", "submitter_work_number": "4", "alternate_titles": "X", "comment": 1},
+    ],
+    "spu": [{"publisher_name": "ACME"}, {}, "junk", {"publisher_name": 5}],
+}
+
+
+def _schema_issues(payload: dict[str, Any], mode: str) -> list[tuple[str, str, int | None, Any]]:
+    report = validate_minimal(payload, mode=mode)
+    return sorted(
+        (i.code, i.pointer.path, i.pointer.index, i.context.get("type"))
+        for i in report.issues
+        if i.code.endswith(".FIELD_INVALID")
+    )
+
+
+def test_fast_mode_reports_contract_violations() -> None:
+    assert _schema_issues(INVALID, "fast") == [
+        ("SCHEMA.SPU.FIELD_INVALID", "/spu", 2, "model_type"),
+        ("SCHEMA.SPU.FIELD_INVALID", "/spu/publisher_name", 1, "missing"),
+        ("SCHEMA.SPU.FIELD_INVALID", "/spu/publisher_name", 3, "string_type"),
+        ("SCHEMA.WORKS.FIELD_INVALID", "/works/alternate_titles", 1, "string_type"),
+        ("SCHEMA.WORKS.FIELD_INVALID", "/works/alternate_titles", 3, "list_type"),
+        ("SCHEMA.WORKS.FIELD_INVALID", "/works/comment", 3, "string_type"),
+        ("SCHEMA.WORKS.FIELD_INVALID", "/works/extra", 2, "dict_type"),
+        ("SCHEMA.WORKS.FIELD_INVALID", "/works/language_code", 1, "string_type"),
+        ("SCHEMA.WORKS.FIELD_INVALID", "/works/language_code", 2, "string_too_short"),
+    ]
+
+
+def test_strict_and_fast_agree(monkeypatch: pytest.MonkeyPatch) -> None:
+    # a small batch size exercises flushing mid-traversal as well as in finish()
+    monkeypatch.setattr(ModelWorkFieldsRule, "batch_size", 3)
+    monkeypatch.setattr(model_rules, "BATCH_SIZE", 3)
+    payload = {"works": INVALID["works"] * 3, "spu": INVALID["spu"] * 2}
+    assert _schema_issues(payload, "strict") == _schema_issues(payload, "fast")
+
+
+def test_rule_fields_are_reported_once() -> None:
+    payload = {"works": [{"title": "", "submitter_work_number": 1}]}
+    for mode in ("strict", "fast"):
+        codes = [i.code for i in validate_minimal(payload, mode=mode).issues]
+        assert codes == ["WORK.TITLE.REQUIRED", "WORK.SUBMITTER_WORK_NUMBER.REQUIRED"]
+
+
+def test_non_array_spu() -> None:
+    for mode in ("strict", "fast"):
+        assert _schema_issues({"works": INVALID["works"][:1], "spu": {}}, mode) == [
+            ("SCHEMA.SPU.FIELD_INVALID", "/spu", None, "list_type")
+        ]
+
+
+def test_trusted_mode_only_checks_the_works_array() -> None:
+    assert validate_minimal(INVALID, mode=ValidationMode.TRUSTED).ok
+    dupes = {"works": [{"title": "A", "submitter_work_number": "1"}] * 2}
+    assert validate_minimal(dupes, mode="trusted").ok
+    assert not validate_minimal(dupes, mode="fast").ok
+    assert not validate_minimal({"works": []}, mode="trusted").ok
+
+
+def test_default_mode_accepts_what_validation_accepted_before_modes() -> None:
+    fixture = json.loads(
+        (Path(__file__).parent / "fixtures" / "minimal.json").read_text(encoding="utf-8")
+    )
+    loose = {
+        "works": [
+            {
+                "title": "A",
+                "submitter_work_number": "1",
+                "language_code": "",
+                "alternate_titles": None,
+                "comment": 1,
+            }
+        ],
+        "spu": [{"publisher_name": 5}],
+    }
+
+    for payload in (fixture, loose):
+        report = validate_minimal(payload)
+        assert report.ok and not report.issues
+        assert generate_cwr_file(payload, "2.1", "SUB", "000", 1)[0].ok
+    # the full input contract is opt-in
+    assert not validate_minimal(loose, mode="fast").ok
+
+
+def test_unknown_mode_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        validate_minimal(INVALID, mode="lenient")
+
+
+def test_compiled_checker_matches_model_fields() -> None:
+    check = compile_checker(WorkInput, skip=RULE_FIELDS)
+    assert check({"title": 1}) == []
+    assert check([]) == [("", "model_type")]
+
+    class Unsupported(BaseModel):
+        count: int
+
+    with pytest.raises(TypeError, match="count"):
+        compile_checker(Unsupported)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from cwr_tool.generation.alt_record import ALTRecord
+from cwr_tool.generation.com_record import COMRecord
+from cwr_tool.generation.nwr_record import NWRRecord
+from cwr_tool.generation.records import RECORD_COUNTS
+from cwr_tool.generation.rev_record import REVRecord
+from cwr_tool.generation.spu_record import SPURecord
+from cwr_tool.generation.writer import render_minimal_wrk_file
+from cwr_tool.parsing.verify import verify_file
+
+NOW = datetime(2026, 1, 1, 12, 30, 45, tzinfo=UTC)
+
+PAYLOAD = {
+    "works": [
+        {"title": "A", "submitter_work_number": "1", "alternate_titles": ["B"], "comment": "C"},
+        {"title": "D", "submitter_work_number": "2"},
+    ],
+    "spu": [{"publisher_name": "ACME"}],
+}
+
+
+def _write(tmp_path: Path, output_format: str = "kv") -> Path:
+    text = render_minimal_wrk_file(
+        PAYLOAD, sender="SUB", receiver="000", now=NOW, output_format=output_format
+    )
+    p = tmp_path / "f.V21"
+    p.write_bytes(text.encode("ascii"))
+    return p
+
+
+def _codes(p: Path) -> list[tuple[str, int | None]]:
+    return [(i.code, i.pointer.line) for i in verify_file(p).issues]
+
+
+def test_record_counts_table_matches_records() -> None:
+    records = [NWRRecord(title="T", submitter_work_number="1"), ALTRecord(title="T")]
+    records += [REVRecord(title="T", submitter_work_number="1")]
+    records += [COMRecord(comment="C"), SPURecord(publisher_name="P")]
+    assert {type(r).__name__[:3]: r.counts() for r in records} == RECORD_COUNTS
+
+
+@pytest.mark.parametrize("output_format", ["kv", "fixedwidth"])
+def test_generated_files_verify_clean(tmp_path: Path, output_format: str) -> None:
+    report = verify_file(_write(tmp_path, output_format))
+    assert report.ok
+    assert report.issues == []
+
+
+def test_mismatches_are_reported_with_line_numbers(tmp_path: Path) -> None:
+    p = _write(tmp_path)
+    lines = p.read_bytes().split(b"\r\n")[:-1]
+    del lines[3]  # drop the ALT line: GRT RECCOUNT and TRL RECTOTAL are now off by one
+    p.write_bytes(b"".join(ln + b"\r\n" for ln in lines))
+
+    report = verify_file(p)
+
+    assert [(i.code, i.pointer.line) for i in report.issues] == [
+        ("VERIFY.GRT.RECCOUNT_MISMATCH", 6),
+        ("VERIFY.TRL.RECTOTAL_MISMATCH", 10),
+    ]
+    assert report.issues[0].context == {"expected": 3, "found": 4}
+    assert not report.ok
+
+
+def test_structure_errors(tmp_path: Path) -> None:
+    p = _write(tmp_path)
+    lines = p.read_bytes().split(b"\r\n")[:-1]
+
+    p.write_bytes(b"\r\n".join(lines[1:-1]) + b"\r\n")  # no HDR, no TRL
+    assert _codes(p) == [("VERIFY.HDR.MISSING", 1), ("VERIFY.TRL.MISSING", 10)]
+
+    p.write_bytes(b"\r\n".join([*lines, b"COM"]) + b"\r\n")
+    assert _codes(p) == [("VERIFY.TRL.NOT_LAST", 12), ("VERIFY.RECORD.OUTSIDE_GROUP", 12)]
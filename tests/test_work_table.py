@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import io
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from cwr_tool.generation.pipeline import generate_cwr_file
+from cwr_tool.generation.work_table import WorkTable, WorkTableCollector
+from cwr_tool.generation.writer import write_minimal_wrk_file
+from cwr_tool.validation.engine import validate_minimal
+
+NOW = datetime(2026, 1, 1, 12, 30, 45, tzinfo=UTC)
+
+WORKS: list[dict[str, Any]] = [
+    {
+        "title": "  HELLO WORLD ",
+        "submitter_work_number": "0000000001",
+        "language_code": "fr",
+        "alternate_titles": ["HELLO AGAIN", "  ", "BONJOUR"],
+        "comment": " NOTE ",
+    },
+    {"title": "SECOND", "submitter_work_number": "0000000002"},
+    {"title": "THIRD", "submitter_work_number": "0000000003", "comment": "ONLY A COMMENT"},
+]
+
+
+def test_columns_are_normalized_once() -> None:
+    table = WorkTable.from_works(WORKS)
+
+    assert len(table) == 3
+    assert table.titles == ["HELLO WORLD", "SECOND", "THIRD"]
+    assert table.languages == ["FR", "EN", "EN"]
+    assert table.languages[1] is table.languages[2]
+    assert [table.alts(i) for i in range(3)] == [["HELLO AGAIN", "BONJOUR"], [], []]
+    assert table.comments == {0: "NOTE", 2: "ONLY A COMMENT"}
+    assert (table.totals().txcount, table.totals().reccount) == (3, 7)
+
+
+@pytest.mark.parametrize("output_format", ["kv", "fixedwidth"])
+def test_table_output_matches_record_output(output_format: str) -> None:
+    payload = {"works": WORKS, "spu": [{"publisher_name": "ACME"}]}
+
+    def render(works: WorkTable | None) -> str:
+        buf = io.StringIO()
+        write_minimal_wrk_file(
+            payload,
+            buf,
+            sender="SUB",
+            receiver="000",
+            cwr_version="2.2",
+            now=NOW,
+            output_format=output_format,
+            works=works,
+        )
+        return buf.getvalue()
+
+    assert render(WorkTable.from_works(WORKS)) == render(None)
+
+
+def test_collector_fills_table_in_the_validation_pass() -> None:
+    collector = WorkTableCollector(WorkTable())
+    report = validate_minimal({"works": WORKS}, extra_rules=[collector])
+
+    assert report.ok
+    assert collector.table.swks == ["0000000001", "0000000002", "0000000003"]
+
+
+@pytest.mark.parametrize("output_format", ["kv", "fixedwidth"])
+@pytest.mark.parametrize(
+    ("work", "match"),
+    [
+        ({"title": " ", "submitter_work_number": "1"}, "title is required"),
+        ({"title": "A", "submitter_work_number": ""}, "submitter_work_number is required"),
+    ],
+)
+def test_blank_required_fields_fail_like_the_record_path(
+    work: dict[str, Any], match: str, output_format: str
+) -> None:
+    with pytest.raises(ValueError, match=match):
+        WorkTable.from_works([work])
+    # trusted mode skips the field rules; rendering still refuses the work
+    with pytest.raises(ValueError, match=match):
+        generate_cwr_file(
+            {"works": [work]},
+            "2.1",
+            "SUB",
+            "000",
+            1,
+            created=NOW,
+            output_format=output_format,
+            validation_mode="trusted",
+        )
+
+
+def test_malformed_alternate_titles_still_fail_generation() -> None:
+    payload = {"works": [{"title": "A", "submitter_work_number": "1", "alternate_titles": "X"}]}
+    # trusted mode lets the work through validation; the writer still rejects it
+    with pytest.raises(ValueError, match="alternate_titles"):
+        generate_cwr_file(payload, "2.1", "SUB", "000", 1, created=NOW, validation_mode="trusted")